@@ -0,0 +1,91 @@
+"""Benchmark: vectorized number formatting against the per-value .apply it replaced.
+
+    python benchmarks/bench_formatting.py [--values 1000000] [--repeat 3]
+
+Formats a Series of values spread log-uniformly over 1e-3..1e15 (a tenth of
+them negative, a few NaN) with the old row-by-row formatters and with
+horizon.formatting, printing the best time of each. Checks the vectorized
+output against a plain Python reference on a sample first.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon.formatting import UNITS, humanize, scientific, usd  # noqa: E402
+
+
+def legacy_investment(value):
+    if value >= 1e9: return f'{round(value / 1e9, 2)}B'
+    elif value >= 1e6: return f'{round(value / 1e6, 2)}M'
+    else: return str(value)
+
+
+LEGACY = {
+    "investment": legacy_investment,
+    "usd": lambda x: f"${x/1e6:,.1f}M" if x >= 1e6 else f"${x:,.0f}",
+    "parameters": lambda x: f"{x/1e9:,.1f}B" if x >= 1e9 else f"{x/1e6:,.1f}M",
+    "computation": lambda x: f"{x:,.1f}",
+}
+
+VECTORIZED = {
+    "humanize": humanize,
+    "usd": usd,
+    "scientific": scientific,
+}
+
+
+def reference_humanize(value, decimals=1):
+    if not math.isfinite(value):
+        return ""
+    if value == round(value) and abs(value) < 1000:
+        return str(int(value))
+    unit = 0
+    while unit < len(UNITS) - 1 and round(abs(value) / 1000 ** unit, decimals) >= 1000:
+        unit += 1
+    text = f"{abs(value) / 1000 ** unit:.{decimals}f}"
+    return f"{'-' if value < 0 and text.strip('0.') else ''}{text}{UNITS[unit]}"
+
+
+def synthetic(n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 10 ** rng.uniform(-3, 15, n) * np.where(rng.random(n) < 0.1, -1, 1)
+    values[rng.choice(n, n // 1000, replace=False)] = np.nan
+    return pd.Series(values)
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    series = synthetic(args.values)
+
+    sample = series.sample(min(len(series), 100_000), random_state=0)
+    assert (humanize(sample) == sample.map(reference_humanize)).all(), "humanize disagrees with the reference"
+    assert (scientific(sample) == sample.map(lambda v: f"{v:.1e}" if math.isfinite(v) else "")).all(), "scientific disagrees with '{:.1e}'"
+
+    print(f"{'formatter':<24} {'values':>9} {'time':>8} {'per value':>10}")
+    for kind, table in [("legacy .apply", LEGACY), ("vectorized", VECTORIZED)]:
+        for name, fn in table.items():
+            run = (lambda: series.apply(fn)) if kind == "legacy .apply" else (lambda: fn(series))
+            elapsed = best_of(run, args.repeat)
+            print(f"{kind + ' ' + name:<24} {len(series):>9} {elapsed:>7.2f}s {elapsed / len(series) * 1e9:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
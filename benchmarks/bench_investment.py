@@ -0,0 +1,83 @@
+"""Benchmark: vectorized sector analytics vs. the original per-sector functions.
+
+    python benchmarks/bench_investment.py [--sectors 100 1000 5000] [--years 40]
+
+Builds a synthetic df_invest_general-shaped frame, checks that both
+implementations agree and prints their run times.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon.analytics import REGIONS, sector_metrics  # noqa: E402
+
+
+# Original implementations from AIHorizonScannerApp.py, kept for comparison
+def calculate_volatility(df, entity_name):
+    sector_df = df[df['entity'] == entity_name].sort_values('year')
+    sector_df['yoy_growth'] = sector_df['world'].pct_change() * 100
+    max_growth = sector_df['yoy_growth'].max()
+    max_decline = sector_df['yoy_growth'].min()
+    return abs(max_growth - max_decline)
+
+
+def geographic_concentration(row):
+    total = row['china'] + row['united_states'] + row['european_union_and_united_kingdom']
+    if total == 0:
+        return 0
+    china_share = row['china'] / total
+    us_share = row['united_states'] / total
+    eu_share = row['european_union_and_united_kingdom'] / total
+    return (china_share**2 + us_share**2 + eu_share**2)
+
+
+def legacy(df):
+    volatility = {entity: calculate_volatility(df, entity) for entity in df['entity'].unique()}
+    concentration = df.apply(geographic_concentration, axis=1)
+    return pd.Series(volatility), concentration
+
+
+def synthetic(sectors, years, seed=0):
+    rng = np.random.default_rng(seed)
+    n = sectors * years
+    regions = rng.lognormal(18, 1.5, size=(n, len(REGIONS)))
+    regions[rng.random(n) < 0.02] = 0
+    df = pd.DataFrame(regions, columns=REGIONS)
+    df.insert(0, 'entity', np.repeat([f"Sector {i}" for i in range(sectors)], years))
+    df.insert(1, 'year', np.tile(np.arange(2024 - years, 2024), sectors))
+    df['world'] = (df[REGIONS].sum(axis=1) * rng.uniform(1, 1.5, n)).astype('int64')
+    # Shuffle so neither implementation benefits from presorted input
+    return df.sample(frac=1, random_state=seed, ignore_index=True)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sectors", type=int, nargs="+", default=[100, 1000, 3000])
+    parser.add_argument("--years", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'sectors':>8} {'rows':>8} {'legacy':>10} {'vectorized':>11} {'speedup':>8}")
+    for sectors in args.sectors:
+        df = synthetic(sectors, args.years)
+        (volatility, concentration), legacy_s = timed(legacy, df)
+        metrics, vector_s = timed(sector_metrics, df)
+        metrics = metrics.set_index('entity')
+        assert np.allclose(metrics['volatility_score'], volatility.reindex(metrics.index), equal_nan=True)
+        hhi = df.assign(hhi=concentration).sort_values('year').groupby('entity')['hhi'].last()
+        assert np.allclose(metrics['geo_concentration'], hhi.reindex(metrics.index))
+        print(f"{sectors:>8} {len(df):>8} {legacy_s:>9.3f}s {vector_s:>10.3f}s {legacy_s / vector_s:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
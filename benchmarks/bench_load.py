@@ -0,0 +1,343 @@
+"""Load test: N concurrent sessions against one app process, with rerun latency percentiles and RSS growth.
+
+    python benchmarks/bench_load.py --sessions 1 4 16 [--duration 30]           # starts its own server
+    python benchmarks/bench_load.py --url http://localhost:8501 --pid <server pid>
+    python benchmarks/bench_load.py --in-process --sessions 4                   # no server, AppTest stand-in
+
+Every simulated session does what a visitor does: it switches sidebar
+sections, submits the opinion poll and runs Comparison Tool queries, in the
+proportions given by --mix, with an exponential think time between actions.
+Sessions speak Streamlit's websocket protocol (the BackMsg/ForwardMsg
+protobufs the browser sends), so the server runs every rerun exactly as it
+would for a browser. A rerun's latency runs from sending it to the server's
+script_finished message.
+
+Without --url the app is started with python -m horizon.warmup on a free port,
+so caches are warm before the first session connects (--no-warmup starts it
+cold). Its poll votes go to a temporary file. For each session count the run
+prints the p50/p95/p99 rerun latency, reruns per second, script errors and the
+server's RSS (sampled every --sample seconds, Linux /proc or ps). RSS that
+keeps growing across phases with the same data points at a leak in the cached
+dataframes. --json writes every phase's results and RSS timeline.
+
+--in-process replaces the server with Streamlit AppTest sessions in this
+process. AppTest is not thread-safe, so these sessions take turns on one
+thread: latencies are per-rerun service times without queueing, and RSS is
+this process's.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "AIHorizonScannerApp.py")
+sys.path.insert(0, ROOT)
+from horizon.catalog import SECTIONS  # noqa: E402
+from horizon.comparison import REGISTRY  # noqa: E402
+
+COMPARISON = "🔍 Comparison Tool"
+POLL_OPINIONS = ["Mostly helpful", "Mostly harmful", "Both equally", "Not sure"]
+POLL_AGES = ["Under 30", "30-49", "50-64", "65+"]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)] if ordered else float("nan")
+
+
+def rss_mb(pid):
+    """Resident set size of a process in MB, or None when it cannot be read"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:")) / 1024
+    except (OSError, StopIteration):
+        pass
+    try:
+        return int(subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True).stdout) / 1024
+    except (OSError, ValueError):
+        return None
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = {}  # action -> rerun latencies in seconds
+        self.errors = 0
+
+    def add(self, action, latency, ok):
+        self.latencies.setdefault(action, []).append(latency)
+        self.errors += not ok
+
+
+class ServerSession:
+    """One browser-like session over Streamlit's websocket protocol"""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream"
+        self.widgets = {}  # label -> (widget type, id)
+        self.states = {}  # id -> WidgetState of every widget set so far
+        self.ws = None
+
+    async def connect(self):
+        import websockets
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, triggers=()):
+        """Send a rerun with the current widget states; return (latency, ok)"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        for widget_id in triggers:
+            state = WidgetState(id=widget_id, trigger_value=True)
+            msg.rerun_script.widget_states.widgets.append(state)
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        ok = True
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                widget = element.WhichOneof("type")
+                ok &= widget != "exception"
+                if widget in ("radio", "selectbox", "button", "slider", "multiselect", "checkbox"):
+                    proto = getattr(element, widget)
+                    self.widgets[proto.label] = (widget, proto.id)
+            elif kind == "script_finished":
+                # FINISHED_SUCCESSFULLY = 0; anything else is an early stop or a compile error
+                return time.perf_counter() - start, ok and forward.script_finished == 0
+
+    def choose(self, label, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+        widget_id = self.widgets[label][1]
+        self.states[widget_id] = WidgetState(id=widget_id, string_value=value)
+
+    def click(self, label):
+        return [self.widgets[label][1]]
+
+
+class AppTestSession:
+    """In-process stand-in with the same interface; runs are serialized by the caller"""
+
+    def __init__(self, url=None):
+        self.at = None
+        self.pending = {}
+
+    async def connect(self):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(APP, default_timeout=120)
+
+    async def close(self):
+        pass
+
+    @property
+    def widgets(self):
+        return {w.label: None for kind in ("radio", "selectbox", "button") for w in getattr(self.at, kind)} if self.at._tree else {}
+
+    async def rerun(self, triggers=()):
+        start = time.perf_counter()
+        for label, value in self.pending.items():
+            next(w for kind in ("radio", "selectbox") for w in getattr(self.at, kind) if w.label == label).set_value(value)
+        for label in triggers:
+            next(w for w in self.at.button if w.label == label).click()
+        self.pending = {}
+        self.at.run()
+        return time.perf_counter() - start, not self.at.exception
+
+    def choose(self, label, value):
+        self.pending[label] = value
+
+    def click(self, label):
+        return [label]
+
+
+async def act(session, action, rng):
+    """Run one visitor action; return [(action, latency, ok)] for each rerun it caused"""
+    reruns = []
+
+    async def rerun(triggers=()):
+        latency, ok = await session.rerun(triggers)
+        reruns.append((action, latency, ok))
+
+    if not session.widgets:
+        await rerun()
+    if action == "section":
+        session.choose("Go to:", rng.choice([s for s in SECTIONS]))
+        await rerun()
+    elif action == "poll":
+        session.choose("How do you think AI will impact society in the next 20 years?", rng.choice(POLL_OPINIONS))
+        session.choose("Your age group", rng.choice(POLL_AGES))
+        await rerun(session.click("Submit"))
+    elif action == "compare":
+        entry = rng.choice(REGISTRY)
+        session.choose("Go to:", COMPARISON)
+        await rerun()
+        session.choose("Compare by:", entry.dimension)
+        await rerun()
+        session.choose("Metric:", entry.metric)
+        await rerun(session.click("Generate Comparison"))
+    return reruns
+
+
+async def run_session(make_session, mix, think, deadline, stats, rng, lock=None):
+    session = make_session()
+    await session.connect()
+    actions, weights = zip(*mix.items())
+    try:
+        while time.perf_counter() < deadline:
+            action = rng.choices(actions, weights)[0]
+            if lock is None:
+                reruns = await act(session, action, rng)
+            else:
+                async with lock:
+                    reruns = await act(session, action, rng)
+            for name, latency, ok in reruns:
+                stats.add(name, latency, ok)
+            await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+    finally:
+        await session.close()
+
+
+async def sample_rss(pid, interval, timeline, start, stop):
+    while not stop.is_set():
+        timeline.append((round(time.perf_counter() - start, 1), rss_mb(pid)))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+    timeline.append((round(time.perf_counter() - start, 1), rss_mb(pid)))
+
+
+async def run_phase(make_session, sessions, args, pid, start, seed):
+    stats, timeline, stop = Stats(), [], asyncio.Event()
+    deadline = time.perf_counter() + args.duration
+    lock = asyncio.Lock() if args.in_process else None
+    sampler = asyncio.create_task(sample_rss(pid, args.sample, timeline, start, stop))
+    began = time.perf_counter()
+    await asyncio.gather(*(run_session(make_session, args.mix, args.think, deadline, stats, random.Random(seed + i), lock)
+                           for i in range(sessions)))
+    elapsed = time.perf_counter() - began
+    stop.set()
+    await sampler
+    latencies = [latency for values in stats.latencies.values() for latency in values]
+    memory = [mb for _, mb in timeline if mb is not None]
+    return {
+        "sessions": sessions, "reruns": len(latencies), "errors": stats.errors, "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50), "p95": percentile(latencies, 95), "p99": percentile(latencies, 99),
+        "by_action": {action: {"reruns": len(v), "p50": percentile(v, 50), "p95": percentile(v, 95), "mean": statistics.fmean(v)}
+                      for action, v in sorted(stats.latencies.items())},
+        "rss_start_mb": memory[0] if memory else None, "rss_end_mb": memory[-1] if memory else None,
+        "rss_peak_mb": max(memory) if memory else None, "rss_timeline": timeline,
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(warm, poll_path):
+    """Start the app on a free port; return (process, url) once it answers health checks"""
+    port = free_port()
+    command = ["-m", "horizon.warmup"] if warm else ["-m", "streamlit", "run", APP]
+    env = dict(os.environ, HORIZON_POLL_PATH=poll_path, **({} if warm else {"HORIZON_WARMUP": "0"}))
+    process = subprocess.Popen([sys.executable, *command, "--server.headless", "true", "--server.port", str(port),
+                                "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+                               cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"app exited with {process.returncode}:\n{process.stderr.read().decode()[-2000:]}")
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=2) as response:
+                if response.status == 200:
+                    return process, url
+        except OSError:
+            time.sleep(0.5)
+    process.kill()
+    raise RuntimeError("app did not become healthy within 300s")
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("section", "poll", "compare"):
+            raise argparse.ArgumentTypeError(f"unknown action {name!r}: use section, poll, compare")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16], help="concurrent sessions per phase")
+    parser.add_argument("--duration", type=float, default=30, help="seconds per phase")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("section=6,poll=1,compare=3"), help="action weights")
+    parser.add_argument("--think", type=float, default=0.5, help="mean think time between actions in seconds, 0 for none")
+    parser.add_argument("--sample", type=float, default=1.0, help="RSS sampling interval in seconds")
+    parser.add_argument("--url", help="running app to test instead of starting one")
+    parser.add_argument("--pid", type=int, help="process id of the --url app, for RSS")
+    parser.add_argument("--no-warmup", action="store_true", help="start the app without warming its caches")
+    parser.add_argument("--in-process", action="store_true", help="AppTest sessions in this process instead of a server")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    process = None
+    if args.in_process:
+        from streamlit.logger import set_log_level
+        set_log_level("error")
+        os.environ.setdefault("HORIZON_POLL_PATH", os.path.join(tempfile.mkdtemp(prefix="bench_load"), "votes.jsonl"))
+        os.environ.setdefault("HORIZON_WARMUP", "0")  # a background warm-up would share the CPU with the measured reruns
+        make_session, pid = AppTestSession, os.getpid()
+    else:
+        if args.url is None:
+            process, args.url = start_server(not args.no_warmup, os.path.join(tempfile.mkdtemp(prefix="bench_load"), "votes.jsonl"))
+        url = args.url
+        make_session, pid = (lambda: ServerSession(url)), args.pid or (process.pid if process else None)
+
+    start = time.perf_counter()
+    results = []
+    print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'rerun/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'rss start':>10} {'rss end':>8} {'peak':>8}")
+    try:
+        for i, sessions in enumerate(args.sessions):
+            result = asyncio.run(run_phase(make_session, sessions, args, pid, start, args.seed + 1000 * i))
+            results.append(result)
+            mb = lambda v: f"{v:.0f}MB" if v is not None else "-"  # noqa: E731
+            print(f"{sessions:>8} {result['reruns']:>7} {result['errors']:>6} {result['throughput']:>8.1f} "
+                  f"{result['p50'] * 1e3:>6.0f}ms {result['p95'] * 1e3:>6.0f}ms {result['p99'] * 1e3:>6.0f}ms "
+                  f"{mb(result['rss_start_mb']):>10} {mb(result['rss_end_mb']):>8} {mb(result['rss_peak_mb']):>8}")
+            for action, row in result["by_action"].items():
+                print(f"{'':>8} {action:<8} {row['reruns']:>6} reruns, p50 {row['p50'] * 1e3:.0f}ms, p95 {row['p95'] * 1e3:.0f}ms")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+    if results and results[0]["rss_start_mb"] is not None:
+        print(f"RSS growth over the run: {results[-1]['rss_end_mb'] - results[0]['rss_start_mb']:+.0f}MB")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
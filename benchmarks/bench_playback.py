@@ -0,0 +1,78 @@
+"""Benchmark: payload of year-by-year choropleth playback, z-only frames against Plotly Express animation frames.
+
+    python benchmarks/bench_playback.py [--grid 15x7 60x20 200x30]
+
+For each countries x years grid it builds a df_cumulative-shaped frame of
+ISO-3 countries with cumulative counts, then the playback map from
+horizon/playback.py and px.choropleth(animation_frame="year") over the same
+data. Both go through the app's compact figure encoding. It reports the
+bytes st.plotly_chart would send, the bytes per year of playback and the
+build time. The real df_cumulative is measured first (--no-real skips it).
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon import playback  # noqa: E402
+from horizon.countries import COUNTRIES  # noqa: E402
+from horizon.figures import compact_figure, payload_size  # noqa: E402
+
+
+def synthetic(countries, years, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = sorted(COUNTRIES)[:countries]
+    counts = np.cumsum(rng.poisson(2, (countries, years)), axis=1)
+    return pd.DataFrame({
+        'entity': np.repeat([COUNTRIES[code] for code in codes], years),
+        'year': np.tile(np.arange(2025 - years + 1, 2026), countries),
+        'cumulative_count': counts.ravel(),
+        'iso3': np.repeat(codes, years),
+    })
+
+
+def measure(df):
+    start = time.perf_counter()
+    frames = playback.year_frames(df, 'cumulative_count')
+    z_only = compact_figure(playback.animated_choropleth(frames, "Cumulative AI Systems", "AI Systems"))
+    z_only_s = time.perf_counter() - start
+    start = time.perf_counter()
+    full = compact_figure(px.choropleth(df.sort_values('year'), locations='iso3', color='cumulative_count', hover_name='entity',
+                                        animation_frame='year', range_color=(0, df['cumulative_count'].max())))
+    full_s = time.perf_counter() - start
+    return payload_size(z_only), payload_size(full), len(frames.years), z_only_s, full_s
+
+
+def grid(text):
+    countries, _, years = text.partition("x")
+    return int(countries), int(years)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", type=grid, nargs="+", default=[(15, 7), (60, 20), (200, 30)], metavar="COUNTRIESxYEARS")
+    parser.add_argument("--real", action=argparse.BooleanOptionalAction, default=True, help="also measure the real df_cumulative")
+    args = parser.parse_args()
+
+    cases = [(f"{countries}x{years}", synthetic(countries, years)) for countries, years in args.grid]
+    if args.real:
+        from streamlit.logger import set_log_level
+        from horizon.catalog import load_dataset
+        # Streamlit warns about the missing script context on every cached call outside `streamlit run`
+        set_log_level("error")
+        cases.insert(0, ("df_cumulative", load_dataset("df_cumulative")))
+
+    print(f"{'data':>14} {'z-only':>10} {'px frames':>10} {'smaller':>8} {'z-only/year':>13} {'px/year':>9} {'build':>16}")
+    for label, df in cases:
+        z_only, full, years, z_only_s, full_s = measure(df)
+        print(f"{label:>14} {z_only / 1024:>8.1f}KB {full / 1024:>8.1f}KB {full / z_only:>7.1f}x "
+              f"{z_only / years:>11.0f}B {full / years:>8.0f}B {z_only_s * 1e3:>6.0f}/{full_s * 1e3:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
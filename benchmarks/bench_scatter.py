@@ -0,0 +1,61 @@
+"""Benchmark: size and build time of the AI Development scatters as the model databases grow.
+
+    python benchmarks/bench_scatter.py [--rows 1000 10000 100000 500000]
+
+Builds df_hardware/df_parameter-shaped synthetic frames, renders them with
+the page's figure builders and prints the points and bytes sent to the
+browser, the trace type and the build time. Checks that decimation keeps
+every group's highest point.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon.pages.development import cost_chart, parameter_chart  # noqa: E402
+
+DOMAINS = ['Language', 'Speech', 'Vision', 'Image Generation', 'Multimodal', 'Other', 'Biology', 'Games']
+ORGANIZATIONS = ['Academia', 'Academia & Industry Collab', 'Industry', 'Other']
+
+
+def synthetic(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    day = pd.Timestamp("1960-01-01") + pd.to_timedelta(rng.uniform(0, 65 * 365, rows), unit="D")
+    growth = (day.year.to_numpy() - 1960) / 10
+    return pd.DataFrame({
+        'entity': [f"System {i}" for i in range(rows)],
+        'day': day,
+        'domain': pd.Categorical(rng.choice(DOMAINS, rows)),
+        'organization_categorization': pd.Categorical(rng.choice(ORGANIZATIONS, rows)),
+        'cost__inflation_adjusted': 10 ** (growth + rng.normal(0, 1, rows)),
+        'parameters': 10 ** (growth + 3 + rng.normal(0, 1, rows)),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000, 500000])
+    args = parser.parse_args()
+
+    print(f"{'chart':<16} {'rows':>8} {'points':>7} {'labels':>7} {'trace':>10} {'payload':>10} {'build':>8}")
+    for rows in args.rows:
+        df = synthetic(rows)
+        for builder, y, group in [(cost_chart, 'cost__inflation_adjusted', 'domain'), (parameter_chart, 'parameters', 'organization_categorization')]:
+            start = time.perf_counter()
+            fig = builder(df)
+            payload = len(fig.to_json())
+            elapsed = time.perf_counter() - start
+            points = sum(len(trace.y) for trace in fig.data)
+            labels = sum(int(np.count_nonzero(np.asarray(trace.text, dtype=object) != "")) for trace in fig.data if trace.text is not None)
+            shown_max = {trace.name: max(trace.y) for trace in fig.data}
+            for name, value in df.groupby(group, observed=True)[y].max().items():
+                assert shown_max[name] == value, f"{builder.__name__}: max of {name} dropped"
+            print(f"{builder.__name__:<16} {rows:>8} {points:>7} {labels:>7} {fig.data[0].type:>10} {payload / 1024:>8.0f}KB {elapsed:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
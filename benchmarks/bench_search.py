@@ -0,0 +1,89 @@
+"""Benchmark: entity search through the inverted index in horizon.search against scanning every dataset.
+
+    python benchmarks/bench_search.py [--repeat 200] [--scale 1 10 100]
+
+Times search() per query (exact, prefix, multi-word and misspelled queries)
+against a scan that checks every searchable column of every catalog frame for
+the query as a substring, which is what a search box without an index has to
+do on each keystroke. --scale repeats the names with numbered suffixes to show
+how both grow with the number of distinct names. The scan has no fuzzy
+matching, so misspelled queries find nothing there.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon import search  # noqa: E402
+from horizon.catalog import CATALOG, load_dataset  # noqa: E402
+
+QUERIES = ["GPT-4", "gpt", "germany", "united st", "vision", "alphago zero", "germny", "deepsek"]
+
+
+def scan(frames, query):
+    """Reference: names containing the query, case-insensitively, in any searchable column of any frame"""
+    needle = query.lower()
+    found = set()
+    for df in frames.values():
+        for field in search.FIELDS:
+            if field in df.columns:
+                values = df[field].astype(str)
+                found.update(values[values.str.lower().str.contains(needle, regex=False)])
+    return found
+
+
+def scaled(frames, scale):
+    if scale == 1:
+        return frames
+    result = {}
+    for name, df in frames.items():
+        copies = []
+        for i in range(scale):
+            copy = df.copy()
+            for field in search.FIELDS:
+                if field in copy.columns:
+                    copy[field] = copy[field].astype(str) + ("" if i == 0 else f" {i}")
+            copies.append(copy)
+        result[name] = pd.concat(copies, ignore_index=True)
+    return result
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    from streamlit.logger import set_log_level
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+    # Streamlit warns about the missing script context on every cached call outside `streamlit run`
+    set_log_level("error")
+    base = {name: load_dataset(name) for name in CATALOG}
+
+    print(f"{'scale':>6} {'names':>7} {'query':<14} {'index':>9} {'scan':>9} {'speedup':>8} {'hits':>5} {'scan hits':>9}")
+    for scale in args.scale:
+        frames = scaled(base, scale)
+        start = time.perf_counter()
+        index = search.build_index(search.collect(frames))
+        build = time.perf_counter() - start
+        for query in QUERIES:
+            indexed, hits = timed(lambda: search.search(query, index), args.repeat)
+            scanned, found = timed(lambda: scan(frames, query), max(args.repeat // scale, 3))
+            print(f"{scale:>6} {len(index.names):>7} {query:<14} {indexed * 1e3:>7.2f}ms {scanned * 1e3:>7.1f}ms "
+                  f"{scanned / indexed:>7.0f}x {len(hits):>5} {len(found):>9}")
+        print(f"{'':>6} index built in {build * 1e3:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Headless per-section benchmark of AIHorizonScannerApp.py with regression thresholds.
+
+    python benchmarks/bench_sections.py              # compare against baselines.json
+    python benchmarks/bench_sections.py --update     # record new baselines
+    python benchmarks/bench_sections.py --only Investment "Domain / Computation"
+
+Every scenario (one per sidebar section and one per Comparison Tool registry
+entry) runs in a fresh process through Streamlit's AppTest and records:
+
+- cold_s: first render after all Streamlit caches are cleared
+- warm_s: median of repeated reruns with warm caches
+- peak_mb: peak traced Python allocations during a cold render
+- rss_mb: peak resident set size of the scenario process (Linux/macOS)
+
+The run fails when a metric exceeds its baseline by more than --tolerance
+(relative) plus a small absolute slack that absorbs timer noise.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(ROOT, "benchmarks", "baselines.json")
+APP = os.path.join(ROOT, "AIHorizonScannerApp.py")
+sys.path.insert(0, ROOT)
+
+# Absolute slack per metric, so sub-100ms timings don't flap on noise
+SLACK = {"cold_s": 0.05, "warm_s": 0.03, "peak_mb": 2.0, "rss_mb": 10.0}
+METRICS = list(SLACK)
+
+
+def scenarios():
+    from horizon.catalog import SECTIONS
+    from horizon.comparison import REGISTRY
+    names = {section.split(" ", 1)[1]: (section, None) for section in SECTIONS if section != "🔍 Comparison Tool"}
+    for entry in REGISTRY:
+        names[f"{entry.dimension} / {entry.metric}"] = ("🔍 Comparison Tool", entry)
+    return names
+
+
+def clear_caches():
+    import streamlit as st
+    from horizon import kpis
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    kpis._snapshot = None
+
+
+def run_scenario(name, reruns):
+    """Measure one scenario inside this process and return its metrics"""
+    from streamlit.testing.v1 import AppTest
+    section, entry = scenarios()[name]
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    if entry is not None:
+        # Only the "Generate Comparison" click is timed
+        at.sidebar.radio[0].set_value(section).run()
+        at.selectbox[0].set_value(entry.dimension).run()
+        at.selectbox[1].set_value(entry.metric)
+
+    def render():
+        if entry is None:
+            at.sidebar.radio[0].set_value(section).run()
+        else:
+            at.button[0].click().run()
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].value}")
+
+    def timed():
+        start = time.perf_counter()
+        render()
+        return time.perf_counter() - start
+
+    clear_caches()
+    cold = timed()
+    warm = statistics.median(timed() for _ in range(reruns))
+    clear_caches()
+    tracemalloc.start()
+    render()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {"cold_s": round(cold, 4), "warm_s": round(warm, 4), "peak_mb": round(peak / 2**20, 2)}
+    try:
+        import resource
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if platform.system() == "Darwin" else 2**10)
+        result["rss_mb"] = round(rss, 1)
+    except ImportError:
+        pass
+    return result
+
+
+def measure(name, reruns):
+    # No background warm-up: it would compete with the measured renders for the CPU
+    out = subprocess.run([sys.executable, __file__, "--run-scenario", name, "--reruns", str(reruns)],
+                         cwd=ROOT, capture_output=True, text=True, env=dict(os.environ, HORIZON_WARMUP="0"))
+    if out.returncode:
+        raise RuntimeError(f"{name} failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="write measured values to baselines.json")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative regression (default 0.5 = +50%%)")
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="scenario names to run")
+    parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    from streamlit.logger import set_log_level
+    set_log_level("error")
+    if args.run_scenario:
+        print(json.dumps(run_scenario(args.run_scenario, args.reruns)))
+        return 0
+
+    names = args.only or list(scenarios())
+    try:
+        with open(BASELINES, encoding="utf-8") as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+
+    failures = []
+    print(f"{'scenario':<34}" + "".join(f" {m:>8}" for m in METRICS))
+    for name in names:
+        result = measure(name, args.reruns)
+        marks = {}
+        for metric, value in result.items():
+            limit = baselines.get(name, {}).get(metric)
+            if limit is not None and value > limit * (1 + args.tolerance) + SLACK[metric]:
+                marks[metric] = "!"
+                failures.append(f"{name} {metric}: {value} > baseline {limit}")
+        print(f"{name:<34}" + "".join(f" {result.get(m, '-'):>7}{marks.get(m, ' ')}" for m in METRICS))
+        if args.update:
+            baselines[name] = result
+
+    if args.update:
+        with open(BASELINES, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Baselines written to {os.path.relpath(BASELINES, ROOT)}")
+        return 0
+    if failures:
+        print("\nRegressions:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Benchmark: survey lookups through horizon.surveys indexes against boolean-mask scans.
+
+    python benchmarks/bench_surveys.py [--entities 50 500 5000] [--lookups 2000]
+
+Builds df_automated_survey-shaped frames with many entities (countries x
+age groups), four answers and ten waves. It then times the same random
+(entity, answer, year) lookups done as mask-and-.iloc[0] scans and as index
+hits, and checks that both give the same values.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon.surveys import build_index, value  # noqa: E402
+
+ANSWERS = ["Don't Know", "Not Worried", "Very Worried", "Worried"]
+YEARS = list(range(2016, 2026))
+
+
+def synthetic(entities, seed=0):
+    rng = np.random.default_rng(seed)
+    names = [f"Group {i}" for i in range(entities)]
+    index = pd.MultiIndex.from_product([names, YEARS, ANSWERS], names=["entity", "year", "opinion"])
+    df = index.to_frame(index=False)
+    df["opinion_count"] = rng.integers(0, 500, len(df))
+    return df.astype({"entity": "category", "opinion": "category", "year": "int32", "opinion_count": "int32"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'entities':>8} {'rows':>8} {'build':>8} {'mask scan':>12} {'index':>10} {'speedup':>8}")
+    rng = np.random.default_rng(1)
+    for entities in args.entities:
+        df = synthetic(entities)
+        keys = [(f"Group {rng.integers(entities)}", ANSWERS[rng.integers(4)], YEARS[rng.integers(len(YEARS))]) for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        scanned = [df.loc[(df['entity'] == e) & (df['opinion'] == a) & (df['year'] == y), 'opinion_count'].iloc[0] for e, a, y in keys]
+        scan = (time.perf_counter() - start) / len(keys)
+
+        start = time.perf_counter()
+        index = build_index("df_automated_survey", df)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        looked_up = [value(index, e, a, y) for e, a, y in keys]
+        lookup = (time.perf_counter() - start) / len(keys)
+
+        assert np.array_equal(scanned, looked_up), "index and mask scan disagree"
+        print(f"{entities:>8} {len(df):>8} {build * 1e3:>6.1f}ms {scan * 1e6:>10.1f}us {lookup * 1e6:>8.2f}us {scan / lookup:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: batched bootstrap growth fits in horizon.trends against a per-group polyfit loop.
+
+    python benchmarks/bench_trends.py [--rows 500 5000 50000] [--boot 2000] [--loop-boot 200]
+
+Builds df_computation-shaped frames with eight domains and a known doubling
+time per domain. It fits them with trends.fit (every group and resample in
+reduceat passes) and with a Python loop of np.polyfit per group and resample.
+It checks the point slopes against polyfit and that the true doubling time
+falls inside most intervals. The loop is timed with --loop-boot resamples and
+scaled up to --boot.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon import trends  # noqa: E402
+
+DOMAINS = ['Language', 'Speech', 'Vision', 'Image Generation', 'Multiple Domains', 'Other', 'Biology', 'Games']
+DOUBLING = dict(zip(DOMAINS, [0.5, 0.8, 1.0, 1.2, 1.5, 2.0, 2.5, 3.0]))
+
+
+def synthetic(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    domain = rng.choice(DOMAINS, rows)
+    years = rng.uniform(1990, 2025, rows)
+    slope = np.log10(2) / pd.Series(domain).map(DOUBLING).to_numpy()
+    return pd.DataFrame({
+        'entity': [f"System {i}" for i in range(rows)],
+        'day': pd.to_datetime(((years - 1970) * 365.2425 * 86400e9).astype(np.int64)),
+        'training_computation_petaflop': 10 ** (slope * (years - 1990) + rng.normal(0, 1, rows)),
+        'domain': pd.Categorical(domain),
+    })
+
+
+def loop_fit(df, n_boot, seed=0):
+    """Reference: np.polyfit per domain, and per bootstrap resample"""
+    rng = np.random.default_rng(seed)
+    x = trends._years(df['day'])
+    y = np.log10(df['training_computation_petaflop'].to_numpy())
+    slopes, intervals = {}, {}
+    for domain in DOMAINS:
+        mask = (df['domain'] == domain).to_numpy()
+        gx, gy = x[mask], y[mask]
+        slopes[domain] = np.polyfit(gx, gy, 1)[0]
+        boot = []
+        for _ in range(n_boot):
+            pick = rng.integers(0, len(gx), len(gx))
+            boot.append(np.polyfit(gx[pick], gy[pick], 1)[0])
+        intervals[domain] = np.percentile(boot, [2.5, 97.5])
+    return slopes, intervals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 5000, 50000])
+    parser.add_argument("--boot", type=int, default=trends.BOOTSTRAP)
+    parser.add_argument("--loop-boot", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'batched':>10} {'loop (est.)':>12} {'speedup':>8} {'covered':>8}")
+    for rows in args.rows:
+        df = synthetic(rows)
+        start = time.perf_counter()
+        table = trends.fit("df_computation", df, n_boot=args.boot)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        slopes, _ = loop_fit(df, args.loop_boot)
+        loop = (time.perf_counter() - start) * args.boot / args.loop_boot
+
+        fitted = dict(zip(table['group'], table['slope']))
+        assert all(np.isclose(fitted[d], slopes[d]) for d in DOMAINS), "slopes disagree with np.polyfit"
+        covered = sum(row.ci_low <= DOUBLING[row.group] <= row.ci_high for row in table.itertuples())
+        print(f"{rows:>8} {batched * 1e3:>8.1f}ms {loop * 1e3:>10.0f}ms {loop / batched:>7.0f}x {covered:>5}/{len(table)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: one-year queries on year-sorted row groups vs. full read and filter.
+
+    python benchmarks/bench_windows.py [--years 10 40 160] [--rows-per-year 50000]
+
+Writes synthetic histories of increasing length both as a plain parquet file
+and through horizon.partitioned.write_sorted, checks that both read paths
+return the same rows for the latest year and prints their query times.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from horizon.partitioned import read_file_window, write_sorted  # noqa: E402
+
+
+def synthetic(years, rows_per_year, seed=0):
+    rng = np.random.default_rng(seed)
+    n = years * rows_per_year
+    df = pd.DataFrame({
+        'entity': pd.Categorical.from_codes(rng.integers(0, 200, n), [f"System {i}" for i in range(200)]),
+        'year': np.repeat(np.arange(2025 - years, 2025, dtype='int32'), rows_per_year),
+        'value': rng.lognormal(10, 3, n),
+    })
+    return df.sample(frac=1, random_state=seed, ignore_index=True)
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[10, 40, 160])
+    parser.add_argument("--rows-per-year", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{'years':>6} {'rows':>9} {'full read':>10} {'pushdown':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for years in args.years:
+            df = synthetic(years, args.rows_per_year)
+            plain, sorted_path = os.path.join(tmp, f"plain{years}.parquet"), os.path.join(tmp, f"sorted{years}.parquet")
+            df.to_parquet(plain, index=False)
+            write_sorted(df, sorted_path)
+
+            def full():
+                frame = pd.read_parquet(plain)
+                return frame[frame['year'] == 2024]
+
+            expected, full_s = best_of(full)
+            window, window_s = best_of(lambda: read_file_window(sorted_path, years=(2024, 2024)))
+            assert len(window) == len(expected) and np.isclose(window['value'].sum(), expected['value'].sum())
+            print(f"{years:>6} {len(df):>9} {full_s * 1e3:>8.1f}ms {window_s * 1e3:>7.1f}ms {full_s / window_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Data and chart helpers behind the AI Horizon Scanner dashboard."""
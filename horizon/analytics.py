@@ -0,0 +1,48 @@
+"""Investment analytics used by the Investment section and its KPIs.
+
+All metrics are computed for every sector in one grouped pass over a
+(entity, year) sorted frame, so cost grows with the number of rows rather
+than sectors x rows.
+"""
+import numpy as np
+
+REGIONS = ['china', 'united_states', 'european_union_and_united_kingdom']
+
+
+def sector_growth(df, value_col='world', regions=REGIONS):
+    """Per sector-year rows with YoY growth (%) and geographic HHI added"""
+    df = df.sort_values(['entity', 'year'], kind='stable', ignore_index=True)
+    yoy_growth = df.groupby('entity', sort=False, observed=True)[value_col].pct_change() * 100
+    region_values = df[regions].to_numpy(dtype=float)
+    total = region_values.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hhi = np.where(total[:, 0] == 0, 0.0, ((region_values / total) ** 2).sum(axis=1))
+    return df.assign(yoy_growth=yoy_growth, geo_concentration=hhi)
+
+
+def sector_metrics(df, value_col='world', regions=REGIONS):
+    """Tidy table with one row per sector: YoY growth range, volatility, latest HHI and CAGR
+
+    volatility_score is the spread between the largest YoY rise and fall (in
+    percentage points); cagr is the compound annual growth rate (%) between
+    the sector's first and last year.
+    """
+    growth = sector_growth(df, value_col, regions)
+    grouped = growth.groupby('entity', sort=False, observed=True)
+    metrics = grouped.agg(first_year=('year', 'first'), last_year=('year', 'last'), first_value=(value_col, 'first'),
+                          last_value=(value_col, 'last'), latest_yoy_growth=('yoy_growth', 'last'),
+                          max_yoy_growth=('yoy_growth', 'max'), min_yoy_growth=('yoy_growth', 'min'),
+                          geo_concentration=('geo_concentration', 'last'))
+    metrics['volatility_score'] = (metrics['max_yoy_growth'] - metrics['min_yoy_growth']).abs()
+    span = metrics['last_year'] - metrics['first_year']
+    ratio = metrics['last_value'] / metrics['first_value'].where(metrics['first_value'] > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        metrics['cagr'] = (ratio ** (1 / span.where(span > 0)) - 1) * 100
+    return metrics.drop(columns=['first_value', 'last_value']).reset_index()
+
+
+def volatility_table(df):
+    """Sectors ranked by volatility score, as shown in the volatility chart"""
+    metrics = sector_metrics(df)
+    return metrics[['entity', 'volatility_score']].sort_values('volatility_score', ascending=False, ignore_index=True)
+
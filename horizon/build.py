@@ -0,0 +1,34 @@
+"""Offline data build: python -m horizon.build
+
+Precomputes the artifacts the app reads from ./data/build. Everything here is
+also rebuilt lazily by the app when a source parquet file changes, so running
+it is an optimization for deploys, not a requirement.
+"""
+import time
+
+from streamlit.logger import set_log_level
+
+from horizon import catalog, countries, kpis, manifest, partitioned, search
+
+# Step name -> callable producing one artifact
+STEPS = {
+    "manifest": manifest.build_manifest,
+    "dataset_store": catalog.build_store,
+    "partitioned": partitioned.build_partitioned,
+    "kpi_snapshot": kpis.build_snapshot,
+    "country_report": countries.build_report,
+    "search_index": search.build_index_file,
+}
+
+
+def main():
+    # Streamlit warns about the missing script context on every cached call outside `streamlit run`
+    set_log_level("error")
+    for name, step in STEPS.items():
+        start = time.perf_counter()
+        step()
+        print(f"{name}: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
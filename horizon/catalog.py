@@ -0,0 +1,173 @@
+"""Dataset catalog: which parquet files and columns each dashboard section reads.
+
+Datasets are served from a shared store: each one is compacted, gets its
+derived columns (year from day, iso3 from country names) and is written once
+to an Arrow IPC file under data/build/store. The file is memory-mapped and
+converted to a read-only DataFrame that every session of the process shares,
+so reruns and concurrent users never copy the data.
+"""
+import glob
+import hashlib
+import os
+from collections.abc import Mapping
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from horizon import telemetry
+from horizon.compaction import compact
+from horizon.countries import COUNTRY_DATASETS, codes
+
+DATA_DIR = "./data"
+BUILD_DIR = f"{DATA_DIR}/build"
+STORE_DIR = f"{BUILD_DIR}/store"
+FRAME_VERSION = 3  # bump when build_frame's derived columns change, so stale store files are rebuilt
+
+# Dataset name -> (parquet file, columns actually used by the app)
+CATALOG = {
+    "df_hardware": ("df_hardware.parquet", ["entity", "day", "domain", "cost__inflation_adjusted"]),
+    "df_computation": ("df_comput.parquet", ["entity", "day", "training_computation_petaflop", "domain"]),
+    "df_datapoint": ("df_data.parquet", ["entity", "day", "training_dataset_size__datapoints", "domain"]),
+    "df_parameter": ("df_param.parquet", ["entity", "day", "parameters", "organization_categorization"]),
+    "df_cost_hardware": ("df_cost_hardware.parquet", ["entity", "day", "training_computation_petaflop", "parameters", "organization_categorization"]),
+    "df_cumulative2": ("df_cumu2.parquet", ["entity", "year", "cumulative_count"]),
+    "df_cumulative": ("df_cumu.parquet", ["entity", "year", "cumulative_count"]),
+    "df_patent_agg": ("df_patent_agg.parquet", ["entity", "num_patent_applications__field_all"]),
+    "df_bill": ("df_bill.parquet", ["entity", "number_of_ai_related_bills_passed_into_law"]),
+    "df_affiliation": ("df_affiliation.parquet", ["entity", "year", "yearly_count"]),
+    "df_patent_world": ("df_patent_world.parquet", ["year", "num_patent_granted__field_all", "num_patent_applications__field_all"]),
+    "df_patent_world2": ("df_patent_world2.parquet", ["year", "industry", "patent_count"]),
+    "df_investment": ("df_investment.parquet", ["year", "china", "united_states", "european_union_and_united_kingdom", "world"]),
+    "df_investment1": ("df_investment1.parquet", ["entity", "year", "world"]),
+    "df_investment2": ("df_investment2.parquet", ["entity", "year", "world"]),
+    "df_investment3": ("df_investment3.parquet", ["year", "generative_ai"]),
+    "df_invest_general": ("df_invest_general.parquet", ["entity", "year", "china", "united_states", "european_union_and_united_kingdom", "world"]),
+    "df_automated_survey": ("df_automated_survey.parquet", ["entity", "year", "opinion", "opinion_count"]),
+    "df_view_country": ("df_view_country.parquet", ["entity", "opinion", "opinion_percent"]),
+    "df_view_continent21": ("df_view_continent2021.parquet", ["entity", "opinion", "opinion_percent"]),
+    "df_view_gender": ("df_view_gender.parquet", ["entity", "year", "opinion", "opinion_percent"]),
+    "df_view3": ("df_view3.parquet", ["entity", "view", "view_percent"]),
+}
+
+# Sidebar section -> datasets rendered in that section
+SECTIONS = {
+    "🔧 AI Development": ["df_hardware", "df_computation", "df_datapoint", "df_parameter", "df_cost_hardware"],
+    "🌍 Geographic Distribution": ["df_cumulative", "df_patent_agg", "df_bill"],
+    "💡 Innovation": ["df_affiliation", "df_patent_world", "df_patent_world2"],
+    "💵 Investment": ["df_investment", "df_investment1", "df_investment2", "df_investment3", "df_invest_general"],
+    "👥 Public View": ["df_automated_survey", "df_view_country", "df_view_continent21", "df_view_gender", "df_view3"],
+    "🔍 Comparison Tool": ["df_cumulative", "df_patent_agg", "df_hardware", "df_parameter", "df_computation", "df_cost_hardware"],
+}
+
+
+def dataset_path(name):
+    return f"{DATA_DIR}/{CATALOG[name][0]}"
+
+
+_fingerprints = {}
+
+
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def file_fingerprint(name):
+    """Content hash of a dataset's parquet file, taken from the manifest while its size and mtime match"""
+    path = dataset_path(name)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _fingerprints:
+        from horizon import manifest  # imports this module; re-describes (and rehashes) the file if it changed
+        _fingerprints[key] = manifest.entry(name)["hash"]
+    return _fingerprints[key]
+
+
+def fingerprint(names):
+    """Combined fingerprint of several datasets"""
+    return hashlib.sha256("".join(file_fingerprint(n) for n in sorted(names)).encode()).hexdigest()[:16]
+
+
+def frame_key(name):
+    """Version of a dataset's built frame: its file fingerprint and the derived-column version"""
+    return f"{file_fingerprint(name)}-v{FRAME_VERSION}"
+
+
+def store_path(name):
+    return f"{STORE_DIR}/{name}-{frame_key(name)}.arrow"
+
+
+def build_frame(name):
+    """Projected, compacted dataset with derived columns"""
+    df = compact(pd.read_parquet(dataset_path(name), engine='pyarrow', columns=CATALOG[name][1]))
+    if 'day' in df.columns and 'year' not in df.columns:
+        df['year'] = df['day'].dt.year.astype('int32')
+    if name in COUNTRY_DATASETS:
+        df['iso3'] = codes(df['entity'])  # categorical over all ISO codes: integer codes agree across datasets
+    return df
+
+
+def build_table(name):
+    return pa.Table.from_pandas(build_frame(name), preserve_index=False)
+
+
+def write_store(name):
+    """Write a dataset's store file and drop files of older versions"""
+    path = store_path(name)
+    table = build_table(name)
+    os.makedirs(STORE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+    for stale in glob.glob(f"{STORE_DIR}/{name}-*.arrow"):
+        if stale != path:
+            os.remove(stale)
+    return path
+
+
+def build_store():
+    for name in CATALOG:
+        write_store(name)
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_dataset(name, file_hash):
+    telemetry.mark_miss()
+    path = store_path(name)
+    try:
+        if not os.path.exists(path):
+            write_store(name)
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    except OSError:
+        table = build_table(name)  # read-only deployments keep the table in memory
+    # split_blocks keeps one block per column, so numeric and datetime columns are views on the mapped file
+    return table.to_pandas(split_blocks=True)
+
+
+def load_dataset(name):
+    """One catalog dataset, projected, compacted and with derived columns; shared and read-only"""
+    with telemetry.span(f"load:{name}"), telemetry.cache_lookup("dataset"):
+        return _shared_dataset(name, file_fingerprint(name))
+
+
+class SectionData(Mapping):
+    """Datasets of one section, each read on first access"""
+
+    def __init__(self, section):
+        self.names = SECTIONS[section]
+        self._frames = {}
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(f"{name} is not registered for this section in horizon.catalog.SECTIONS")
+        if name not in self._frames:
+            self._frames[name] = load_dataset(name)
+        return self._frames[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,48 @@
+"""Load-time compaction of catalog datasets: python -m horizon.compaction
+
+Repeated string dimensions (entity, domain, opinion, ...) become categoricals
+and 64-bit integers are downcast to 32 bits when every value fits. Integers
+stop at 32 bits so arithmetic in charts and KPIs (percentages, sums,
+differences) cannot wrap around; floats stay 64-bit because KPIs derived
+from float32 inputs would drift in the last digits.
+"""
+import numpy as np
+import pandas as pd
+
+# Dictionary-encode a string column when it has at most this many distinct values per row
+CATEGORY_RATIO = 0.5
+
+
+def compact_column(s):
+    if pd.api.types.is_string_dtype(s.dtype) or s.dtype == object:
+        if len(s) and s.nunique(dropna=False) <= CATEGORY_RATIO * len(s):
+            return s.astype("category")
+        return s
+    if pd.api.types.is_integer_dtype(s.dtype) and s.dtype.itemsize > 4:
+        info = np.iinfo(np.int32)
+        if s.empty or (s.min() >= info.min and s.max() <= info.max):
+            return s.astype(np.int32)
+    return s
+
+
+def compact(df):
+    """Same frame with categorical strings and lossless narrower integers"""
+    return df.apply(compact_column)
+
+
+def memory_report(names=None):
+    """Per-dataset deep memory usage before and after compaction"""
+    from horizon.catalog import CATALOG, dataset_path
+    rows = []
+    for name in names or CATALOG:
+        raw = pd.read_parquet(dataset_path(name), engine='pyarrow', columns=CATALOG[name][1])
+        before, after = raw.memory_usage(deep=True).sum(), compact(raw).memory_usage(deep=True).sum()
+        rows.append((name, len(raw), before / 1024, after / 1024, (1 - after / before) * 100))
+    report = pd.DataFrame(rows, columns=["dataset", "rows", "before_kb", "after_kb", "saved_pct"])
+    total = report[["rows", "before_kb", "after_kb"]].sum()
+    report.loc[len(report)] = ["TOTAL", int(total["rows"]), total["before_kb"], total["after_kb"], (1 - total["after_kb"] / total["before_kb"]) * 100]
+    return report.round(1)
+
+
+if __name__ == "__main__":
+    print(memory_report().to_string(index=False))
@@ -0,0 +1,103 @@
+"""Metric registry and per-year cubes behind the Comparison Tool.
+
+Each registry entry names the dataset, grouping column, value column and
+aggregation for one (dimension, metric) pair. Its cube holds the aggregate
+per group and year, so any year-range window is answered from a slice of
+that matrix instead of filtering and grouping the source rows again.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import fingerprint, load_dataset
+from horizon.formatting import humanize, scientific, usd
+
+
+class ComparisonMetric(NamedTuple):
+    dimension: str
+    metric: str
+    dataset: str
+    group_col: str
+    value_col: str
+    agg: str  # "max" or "sum"
+    label: str
+    formatter: object  # vectorized horizon.formatting function for labels and tables
+
+
+REGISTRY = [
+    ComparisonMetric("Country", "System Count", "df_cumulative", "entity", "cumulative_count", "max", "AI Systems Count", humanize),
+    ComparisonMetric("Country", "Patents", "df_patent_agg", "entity", "num_patent_applications__field_all", "sum", "Patent Applications", humanize),
+    ComparisonMetric("Domain", "Training Cost", "df_hardware", "domain", "cost__inflation_adjusted", "max", "Max Training Cost (USD)", usd),
+    ComparisonMetric("Domain", "Computation", "df_computation", "domain", "training_computation_petaflop", "max", "Max Computation (petaFLOPs)", scientific),
+    ComparisonMetric("Organization Type", "Parameters", "df_parameter", "organization_categorization", "parameters", "max", "Max Parameters", humanize),
+    ComparisonMetric("Organization Type", "Computation", "df_cost_hardware", "organization_categorization", "training_computation_petaflop", "max", "Max Computation (petaFLOPs)", scientific),
+]
+
+METRICS = {(entry.dimension, entry.metric): entry for entry in REGISTRY}
+
+
+def dimensions():
+    return list(dict.fromkeys(entry.dimension for entry in REGISTRY))
+
+
+def metrics_for(dimension):
+    return [entry.metric for entry in REGISTRY if entry.dimension == dimension]
+
+
+class Cube(NamedTuple):
+    groups: np.ndarray
+    years: np.ndarray  # empty when the dataset has no time column
+    values: np.ndarray  # groups x years, NaN where a group has no rows that year
+    agg: str
+    dtype: np.dtype  # dtype of the source column, restored on output
+
+
+def build_cube(entry, df):
+    """Aggregate a registry entry's dataset per group and year"""
+    if 'year' not in df.columns:
+        totals = df.groupby(entry.group_col, observed=True)[entry.value_col].agg(entry.agg)
+        return Cube(totals.index.to_numpy(), np.array([], dtype=int), totals.to_numpy(dtype=float)[:, None], entry.agg, totals.dtype)
+    table = df.groupby([entry.group_col, 'year'], observed=True)[entry.value_col].agg(entry.agg).unstack('year')
+    return Cube(table.index.to_numpy(), table.columns.to_numpy(), table.to_numpy(dtype=float), entry.agg, df[entry.value_col].dtype)
+
+
+@st.cache_resource(show_spinner=False)
+def _cube(dimension, metric, data_fingerprint):
+    telemetry.mark_miss()
+    entry = METRICS[(dimension, metric)]
+    with telemetry.span(f"cube:{dimension}/{metric}"):
+        cube = build_cube(entry, load_dataset(entry.dataset))
+    for array in cube[:3]:
+        array.setflags(write=False)
+    return cube
+
+
+def get_cube(dimension, metric):
+    """Shared, read-only cube for a registry entry, rebuilt when its dataset changes"""
+    with telemetry.cache_lookup("comparison_cube"):
+        return _cube(dimension, metric, fingerprint([METRICS[(dimension, metric)].dataset]))
+
+
+def window(cube, year_range):
+    """Aggregate per group over the inclusive year range, NaN for groups without data in it"""
+    if not len(cube.years):
+        return cube.values[:, 0]
+    lo, hi = np.searchsorted(cube.years, year_range[0]), np.searchsorted(cube.years, year_range[1], side="right")
+    block = cube.values[:, lo:hi]
+    if cube.agg == "max":
+        # fmax skips NaN and stays NaN for groups without any value in the window
+        return np.fmax.reduce(block, axis=1, initial=np.nan) if hi > lo else np.full(len(cube.groups), np.nan)
+    return np.where(np.isnan(block).all(axis=1), np.nan, np.nansum(block, axis=1))
+
+
+def compare(dimension, metric, year_range):
+    """Comparison table for the Comparison Tool, sorted by metric value"""
+    entry = METRICS[(dimension, metric)]
+    cube = get_cube(dimension, metric)
+    values = window(cube, year_range)
+    keep = ~np.isnan(values)
+    order = np.argsort(-values[keep], kind="stable")
+    return pd.DataFrame({dimension: cube.groups[keep][order], entry.label: values[keep][order].astype(cube.dtype)})
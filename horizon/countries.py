@@ -0,0 +1,170 @@
+"""ISO 3166-1 alpha-3 codes for the country names used across the datasets.
+
+The dataset store adds an `iso3` column to every dataset in COUNTRY_DATASETS
+at build time (horizon/catalog.py). The column is categorical over all ISO
+codes, so its integer codes mean the same country in every dataset: frames
+join on iso3 codes instead of matching free-text names, and the maps pass the
+codes to Plotly (locationmode "ISO-3") instead of letting it resolve names on
+every render. Names are matched after normalization (case, accents,
+punctuation, "&" and a leading "the") against the ISO short names and ALIASES.
+Region and aggregate names are kept apart from genuinely unmatched names in
+the report, written to data/build at build time: python -m horizon.countries
+"""
+import json
+import os
+import re
+import unicodedata
+
+import pandas as pd
+
+# Datasets whose `entity` column names countries, next to aggregates such as "World" that get no code.
+# df_view_continent21 is left out: its entities are world regions, and its "Australia" is the region,
+# so coding it AUS would let iso3 joins match a region's survey answers to the country's rows.
+COUNTRY_DATASETS = ["df_cumulative", "df_patent_agg", "df_bill", "df_view_country"]
+
+COUNTRIES = {
+    "ABW": "Aruba", "AFG": "Afghanistan", "AGO": "Angola", "AIA": "Anguilla", "ALA": "Åland Islands", "ALB": "Albania", "AND": "Andorra",
+    "ARE": "United Arab Emirates", "ARG": "Argentina", "ARM": "Armenia", "ASM": "American Samoa", "ATA": "Antarctica",
+    "ATF": "French Southern Territories", "ATG": "Antigua and Barbuda", "AUS": "Australia", "AUT": "Austria", "AZE": "Azerbaijan",
+    "BDI": "Burundi", "BEL": "Belgium", "BEN": "Benin", "BES": "Bonaire, Sint Eustatius and Saba", "BFA": "Burkina Faso",
+    "BGD": "Bangladesh", "BGR": "Bulgaria", "BHR": "Bahrain", "BHS": "Bahamas", "BIH": "Bosnia and Herzegovina", "BLM": "Saint Barthélemy",
+    "BLR": "Belarus", "BLZ": "Belize", "BMU": "Bermuda", "BOL": "Bolivia", "BRA": "Brazil", "BRB": "Barbados", "BRN": "Brunei Darussalam",
+    "BTN": "Bhutan", "BVT": "Bouvet Island", "BWA": "Botswana", "CAF": "Central African Republic", "CAN": "Canada",
+    "CCK": "Cocos (Keeling) Islands", "CHE": "Switzerland", "CHL": "Chile", "CHN": "China", "CIV": "Côte d'Ivoire", "CMR": "Cameroon",
+    "COD": "Democratic Republic of the Congo", "COG": "Congo", "COK": "Cook Islands", "COL": "Colombia", "COM": "Comoros",
+    "CPV": "Cabo Verde", "CRI": "Costa Rica", "CUB": "Cuba", "CUW": "Curaçao", "CXR": "Christmas Island", "CYM": "Cayman Islands",
+    "CYP": "Cyprus", "CZE": "Czechia", "DEU": "Germany", "DJI": "Djibouti", "DMA": "Dominica", "DNK": "Denmark",
+    "DOM": "Dominican Republic", "DZA": "Algeria", "ECU": "Ecuador", "EGY": "Egypt", "ERI": "Eritrea", "ESH": "Western Sahara",
+    "ESP": "Spain", "EST": "Estonia", "ETH": "Ethiopia", "FIN": "Finland", "FJI": "Fiji", "FLK": "Falkland Islands", "FRA": "France",
+    "FRO": "Faroe Islands", "FSM": "Micronesia", "GAB": "Gabon", "GBR": "United Kingdom", "GEO": "Georgia", "GGY": "Guernsey",
+    "GHA": "Ghana", "GIB": "Gibraltar", "GIN": "Guinea", "GLP": "Guadeloupe", "GMB": "Gambia", "GNB": "Guinea-Bissau",
+    "GNQ": "Equatorial Guinea", "GRC": "Greece", "GRD": "Grenada", "GRL": "Greenland", "GTM": "Guatemala", "GUF": "French Guiana",
+    "GUM": "Guam", "GUY": "Guyana", "HKG": "Hong Kong", "HMD": "Heard Island and McDonald Islands", "HND": "Honduras", "HRV": "Croatia",
+    "HTI": "Haiti", "HUN": "Hungary", "IDN": "Indonesia", "IMN": "Isle of Man", "IND": "India", "IOT": "British Indian Ocean Territory",
+    "IRL": "Ireland", "IRN": "Iran", "IRQ": "Iraq", "ISL": "Iceland", "ISR": "Israel", "ITA": "Italy", "JAM": "Jamaica", "JEY": "Jersey",
+    "JOR": "Jordan", "JPN": "Japan", "KAZ": "Kazakhstan", "KEN": "Kenya", "KGZ": "Kyrgyzstan", "KHM": "Cambodia", "KIR": "Kiribati",
+    "KNA": "Saint Kitts and Nevis", "KOR": "South Korea", "KWT": "Kuwait", "LAO": "Laos", "LBN": "Lebanon", "LBR": "Liberia",
+    "LBY": "Libya", "LCA": "Saint Lucia", "LIE": "Liechtenstein", "LKA": "Sri Lanka", "LSO": "Lesotho", "LTU": "Lithuania",
+    "LUX": "Luxembourg", "LVA": "Latvia", "MAC": "Macao", "MAF": "Saint Martin (French part)", "MAR": "Morocco", "MCO": "Monaco",
+    "MDA": "Moldova", "MDG": "Madagascar", "MDV": "Maldives", "MEX": "Mexico", "MHL": "Marshall Islands", "MKD": "North Macedonia",
+    "MLI": "Mali", "MLT": "Malta", "MMR": "Myanmar", "MNE": "Montenegro", "MNG": "Mongolia", "MNP": "Northern Mariana Islands",
+    "MOZ": "Mozambique", "MRT": "Mauritania", "MSR": "Montserrat", "MTQ": "Martinique", "MUS": "Mauritius", "MWI": "Malawi",
+    "MYS": "Malaysia", "MYT": "Mayotte", "NAM": "Namibia", "NCL": "New Caledonia", "NER": "Niger", "NFK": "Norfolk Island",
+    "NGA": "Nigeria", "NIC": "Nicaragua", "NIU": "Niue", "NLD": "Netherlands", "NOR": "Norway", "NPL": "Nepal", "NRU": "Nauru",
+    "NZL": "New Zealand", "OMN": "Oman", "PAK": "Pakistan", "PAN": "Panama", "PCN": "Pitcairn", "PER": "Peru", "PHL": "Philippines",
+    "PLW": "Palau", "PNG": "Papua New Guinea", "POL": "Poland", "PRI": "Puerto Rico", "PRK": "North Korea", "PRT": "Portugal",
+    "PRY": "Paraguay", "PSE": "Palestine", "PYF": "French Polynesia", "QAT": "Qatar", "REU": "Réunion", "ROU": "Romania",
+    "RUS": "Russia", "RWA": "Rwanda", "SAU": "Saudi Arabia", "SDN": "Sudan", "SEN": "Senegal", "SGP": "Singapore",
+    "SGS": "South Georgia and the South Sandwich Islands", "SHN": "Saint Helena", "SJM": "Svalbard and Jan Mayen",
+    "SLB": "Solomon Islands", "SLE": "Sierra Leone", "SLV": "El Salvador", "SMR": "San Marino", "SOM": "Somalia",
+    "SPM": "Saint Pierre and Miquelon", "SRB": "Serbia", "SSD": "South Sudan", "STP": "Sao Tome and Principe", "SUR": "Suriname",
+    "SVK": "Slovakia", "SVN": "Slovenia", "SWE": "Sweden", "SWZ": "Eswatini", "SXM": "Sint Maarten (Dutch part)", "SYC": "Seychelles",
+    "SYR": "Syria", "TCA": "Turks and Caicos Islands", "TCD": "Chad", "TGO": "Togo", "THA": "Thailand", "TJK": "Tajikistan",
+    "TKL": "Tokelau", "TKM": "Turkmenistan", "TLS": "Timor-Leste", "TON": "Tonga", "TTO": "Trinidad and Tobago", "TUN": "Tunisia",
+    "TUR": "Turkey", "TUV": "Tuvalu", "TWN": "Taiwan", "TZA": "Tanzania", "UGA": "Uganda", "UKR": "Ukraine",
+    "UMI": "United States Minor Outlying Islands", "URY": "Uruguay", "USA": "United States", "UZB": "Uzbekistan", "VAT": "Holy See",
+    "VCT": "Saint Vincent and the Grenadines", "VEN": "Venezuela", "VGB": "British Virgin Islands", "VIR": "United States Virgin Islands",
+    "VNM": "Vietnam", "VUT": "Vanuatu", "WLF": "Wallis and Futuna", "WSM": "Samoa", "YEM": "Yemen", "ZAF": "South Africa",
+    "ZMB": "Zambia", "ZWE": "Zimbabwe",
+}
+
+# Other spellings seen in the sources (and common ones), matched after normalization
+ALIASES = {
+    "USA": ["United States of America", "US", "U.S.", "America"], "GBR": ["UK", "Great Britain", "Britain"],
+    "KOR": ["Korea", "Republic of Korea", "Korea, Rep."], "PRK": ["Democratic People's Republic of Korea", "Korea, Dem. People's Rep."],
+    "RUS": ["Russian Federation"], "IRN": ["Islamic Republic of Iran", "Iran, Islamic Rep."], "CZE": ["Czech Republic"],
+    "TUR": ["Türkiye", "Turkiye"], "VNM": ["Viet Nam"], "BRN": ["Brunei"], "MAC": ["Macau", "Macao SAR", "Macao SAR, China"],
+    "HKG": ["Hong Kong SAR", "Hong Kong SAR, China"], "TWN": ["Chinese Taipei", "Taiwan, Province of China"], "LAO": ["Lao PDR"],
+    "ARE": ["UAE"], "SYR": ["Syrian Arab Republic"], "TZA": ["United Republic of Tanzania"], "BOL": ["Plurinational State of Bolivia"],
+    "VEN": ["Bolivarian Republic of Venezuela"], "MDA": ["Republic of Moldova"], "FSM": ["Federated States of Micronesia"],
+    "COD": ["DR Congo", "Congo, Dem. Rep.", "Congo-Kinshasa"], "COG": ["Republic of the Congo", "Congo, Rep.", "Congo-Brazzaville"],
+    "CIV": ["Ivory Coast"], "CPV": ["Cape Verde"], "SWZ": ["Swaziland"], "MKD": ["Macedonia"], "MMR": ["Burma"], "TLS": ["East Timor"],
+    "PSE": ["Palestinian Territories", "State of Palestine"], "VAT": ["Vatican", "Vatican City"], "GMB": ["The Gambia"],
+    "BHS": ["The Bahamas"], "KNA": ["Saint Kitts & Nevis"], "FLK": ["Falkland Islands (Malvinas)"], "CUW": ["Curacao"],
+    "REU": ["Reunion"], "ALA": ["Aland Islands"], "BLM": ["Saint Barthelemy"], "SVK": ["Slovak Republic"], "EGY": ["Egypt, Arab Rep."],
+    "YEM": ["Yemen, Rep."], "KGZ": ["Kyrgyz Republic"],
+}
+
+# Regions and aggregates: not countries, and not errors either
+AGGREGATES = {
+    "World", "Africa", "Asia", "Europe", "Oceania", "North America", "South America", "Latin America", "European Union",
+    "European Union and United Kingdom", "Middle East", "Central Asia", "East Asia", "South Asia", "Southeast Asia",
+    "North Africa", "Central Western Africa", "Sub-Saharan Africa", "Rest of the World",
+}
+
+
+def normalize(name):
+    """Case-, accent- and punctuation-insensitive form of a country name"""
+    name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode().lower().replace("&", " and ")
+    name = re.sub(r"[^a-z0-9]+", " ", name).strip()
+    return name[4:] if name.startswith("the ") else name
+
+
+_LOOKUP = {normalize(name): code for code, name in COUNTRIES.items()}
+_LOOKUP.update({normalize(alias): code for code, aliases in ALIASES.items() for alias in aliases})
+_LOOKUP.update({code.lower(): code for code in COUNTRIES})
+_AGGREGATES = {normalize(name) for name in AGGREGATES}
+
+ISO3_DTYPE = pd.CategoricalDtype(sorted(COUNTRIES))
+
+
+def lookup(name):
+    """ISO-3 code of a country name, or None for regions and unknown names"""
+    return _LOOKUP.get(normalize(name))
+
+
+def codes(entities):
+    """ISO-3 codes of a Series of names as a categorical over every ISO code; NaN where unmatched"""
+    names = pd.Series(entities).astype(str)
+    unique = names.unique()
+    mapping = dict(zip(unique, (lookup(name) for name in unique)))
+    return pd.Series(names.map(mapping), index=names.index, dtype=ISO3_DTYPE)
+
+
+def report(frames):
+    """Names without a code per dataset: {dataset: {"aggregates": [...], "unmatched": [...]}}"""
+    result = {}
+    for name, df in frames.items():
+        unique = sorted(set(df['entity'].astype(str)))
+        missing = [entity for entity in unique if lookup(entity) is None]
+        result[name] = {"countries": len(unique) - len(missing),
+                        "aggregates": [entity for entity in missing if normalize(entity) in _AGGREGATES],
+                        "unmatched": [entity for entity in missing if normalize(entity) not in _AGGREGATES]}
+    return result
+
+
+def report_path():
+    from horizon.catalog import BUILD_DIR  # imported here: the catalog imports this module
+    return f"{BUILD_DIR}/country_report.json"
+
+
+def build_report():
+    """Write the unmatched-name report of COUNTRY_DATASETS to the build directory and return it"""
+    from horizon.catalog import load_dataset
+    result = report({name: load_dataset(name) for name in COUNTRY_DATASETS})
+    path = report_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(result, f, indent=1)
+    os.replace(tmp_path, path)
+    return result
+
+
+def main():
+    from streamlit.logger import set_log_level
+    # Streamlit warns about the missing script context on every cached call outside `streamlit run`
+    set_log_level("error")
+    unmatched = 0
+    for name, entry in build_report().items():
+        print(f"{name}: {entry['countries']} countries, {len(entry['aggregates'])} regions/aggregates, {len(entry['unmatched'])} unmatched")
+        if entry['aggregates']:
+            print(f"  regions/aggregates: {', '.join(entry['aggregates'])}")
+        if entry['unmatched']:
+            print(f"  UNMATCHED: {', '.join(entry['unmatched'])}")
+        unmatched += len(entry['unmatched'])
+    return 1 if unmatched else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
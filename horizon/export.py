@@ -0,0 +1,219 @@
+"""Bulk export of Comparison Tool results: python -m horizon.export [options]
+
+Any set of (dimension, metric, year range) combinations can be exported. The
+export holds the comparison table of each combination, or with rows=True the
+per-system rows behind it. Results are produced as Arrow record batches, one
+combination (or one row group of its dataset) at a time. They are encoded
+incrementally as chunked CSV, Parquet or an Arrow IPC stream, so an export is
+never held whole in memory: the CLI writes the chunks straight to a file or
+stdout. In the app, the download buttons pass deferred() to
+st.download_button. The export is then built only when a button is clicked
+and is spooled to a temporary file while it is encoded.
+"""
+import argparse
+import os
+import sys
+import tempfile
+from typing import NamedTuple
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from horizon import comparison, telemetry
+from horizon.partitioned import iter_window
+
+BATCH_ROWS = 65536  # batches are coalesced up to this many rows, so Parquet row groups are not tiny
+SPOOL_BYTES = 16 * 2**20  # in-app exports move from memory to a temporary file above this size
+
+
+class Combination(NamedTuple):
+    dimension: str
+    metric: str
+    year_range: tuple  # inclusive (first, last), or None for datasets without years
+
+
+class ExportFormat(NamedTuple):
+    extension: str
+    mime: str
+
+
+FORMATS = {
+    "csv": ExportFormat(".csv", "text/csv"),
+    "parquet": ExportFormat(".parquet", "application/vnd.apache.parquet"),
+    "arrow": ExportFormat(".arrows", "application/vnd.apache.arrow.stream"),
+}
+
+_KEYS = [("dimension", pa.string()), ("metric", pa.string()), ("year_from", pa.int32()), ("year_to", pa.int32()), ("group", pa.string())]
+SUMMARY_SCHEMA = pa.schema([*_KEYS, ("rank", pa.int32()), ("value", pa.float64())])
+ROWS_SCHEMA = pa.schema([*_KEYS, ("entity", pa.string()), ("year", pa.int32()), ("value", pa.float64())])
+
+
+def combinations(dimensions=None, metrics=None, year_ranges=None, per_year=False):
+    """Combinations of the registry entries matching the filters (None: all).
+
+    Without year_ranges each entry gets the full year range of its cube; per_year
+    splits every range into single years.
+    """
+    combos = []
+    for entry in comparison.REGISTRY:
+        if (dimensions and entry.dimension not in dimensions) or (metrics and entry.metric not in metrics):
+            continue
+        years = comparison.get_cube(entry.dimension, entry.metric).years
+        if not len(years):
+            combos.append(Combination(entry.dimension, entry.metric, None))
+            continue
+        for first, last in year_ranges or [(int(years[0]), int(years[-1]))]:
+            ranges = [(year, year) for year in range(first, last + 1)] if per_year else [(first, last)]
+            combos += [Combination(entry.dimension, entry.metric, year_range) for year_range in ranges]
+    return combos
+
+
+def _keys(combo, rows, group):
+    first, last = combo.year_range or (None, None)
+    return [pa.array([combo.dimension] * rows, pa.string()), pa.array([combo.metric] * rows, pa.string()),
+            pa.array([first] * rows, pa.int32()), pa.array([last] * rows, pa.int32()), group.cast(pa.string())]
+
+
+def summary_batches(combos):
+    """One record batch per combination: its comparison table, ranked by value"""
+    for combo in combos:
+        df = comparison.compare(*combo)
+        yield pa.RecordBatch.from_arrays(
+            [*_keys(combo, len(df), pa.array(df.iloc[:, 0].astype(str))),
+             pa.array(range(1, len(df) + 1), pa.int32()), pa.array(df.iloc[:, 1].to_numpy(dtype=float))], schema=SUMMARY_SCHEMA)
+
+
+def row_batches(combos):
+    """The per-system rows behind each combination, one matching row group at a time"""
+    for combo in combos:
+        entry = comparison.METRICS[combo[:2]]
+        columns = list(dict.fromkeys(["entity", entry.group_col, entry.value_col]))
+        for table in iter_window(entry.dataset, combo.year_range, columns + ["year"] if combo.year_range else columns):
+            if not table.num_rows:
+                continue
+            column = {name: table[name].combine_chunks() for name in table.column_names}
+            year = column["year"].cast(pa.int32()) if combo.year_range else pa.nulls(table.num_rows, pa.int32())
+            yield pa.RecordBatch.from_arrays([*_keys(combo, table.num_rows, column[entry.group_col]), column["entity"].cast(pa.string()),
+                                              year, column[entry.value_col].cast(pa.float64())], schema=ROWS_SCHEMA)
+
+
+def _coalesce(batches, schema, rows=BATCH_ROWS):
+    pending, pending_rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= rows:
+            yield pa.Table.from_batches(pending, schema)
+            pending, pending_rows = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending, schema)
+
+
+class _Chunks:
+    """Write-only file object; drain() takes out the bytes written since the last drain"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _writer(fmt, sink, schema):
+    if fmt == "csv":
+        return pa_csv.CSVWriter(sink, schema)
+    if fmt == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    return pa.ipc.new_stream(sink, schema)
+
+
+def stream(combos, fmt, rows=False):
+    """Encoded export as a generator of byte chunks, about one per BATCH_ROWS rows"""
+    schema = ROWS_SCHEMA if rows else SUMMARY_SCHEMA
+    sink = _Chunks()
+    writer = _writer(fmt, sink, schema)
+    for table in _coalesce(row_batches(combos) if rows else summary_batches(combos), schema):
+        writer.write_table(table)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def write(path, combos, fmt, rows=False):
+    """Stream an export to a file, replacing it only once complete; returns its size in bytes"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with telemetry.span(f"export:{fmt}"), open(tmp_path, "wb") as f:
+        for chunk in stream(combos, fmt, rows):
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def file_name(combos, fmt, rows=False):
+    if len(combos) == 1:
+        stem = f"ai_comparison_{combos[0].dimension}_{combos[0].metric}".lower().replace(" ", "_")
+    else:
+        stem = f"ai_comparison_export_{len(combos)}"
+    return stem + ("_rows" if rows else "") + FORMATS[fmt].extension
+
+
+def deferred(combos, fmt, rows=False):
+    """st.download_button data: builds the export when the button is clicked, spooled to a temporary file"""
+    def build():
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        with telemetry.span(f"export:{fmt}"):
+            for chunk in stream(combos, fmt, rows):
+                spool.write(chunk)
+        spool.seek(0)
+        return spool
+    return build
+
+
+def _years(text):
+    first, _, last = text.partition("-")
+    return int(first), int(last or first)
+
+
+def main():
+    from streamlit.logger import set_log_level
+    parser = argparse.ArgumentParser(description="Bulk export of Comparison Tool results")
+    parser.add_argument("--dimension", nargs="+", choices=comparison.dimensions(), help="default: all")
+    parser.add_argument("--metric", nargs="+", help="default: all metrics of the chosen dimensions")
+    parser.add_argument("--years", nargs="+", type=_years, metavar="FIRST-LAST", help="year ranges, default: each metric's full range")
+    parser.add_argument("--per-year", action="store_true", help="split every year range into single years")
+    parser.add_argument("--rows", action="store_true", help="export the per-system rows instead of the comparison tables")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--out", default="-", help="output file, - for stdout")
+    args = parser.parse_args()
+    # Streamlit warns about the missing script context on every cached call outside `streamlit run`
+    set_log_level("error")
+    combos = combinations(args.dimension, args.metric, args.years, args.per_year)
+    if args.out == "-":
+        for chunk in stream(combos, args.format, args.rows):
+            sys.stdout.buffer.write(chunk)
+    else:
+        size = write(args.out, combos, args.format, args.rows)
+        print(f"{len(combos)} combinations, {size:,} bytes -> {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
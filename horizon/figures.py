@@ -0,0 +1,92 @@
+"""Process-wide cache of built Plotly figures.
+
+Figures are keyed by builder, dataset fingerprint and chart parameters and
+shared by every session, so a rerun hands back the finished figure instead of
+re-running Plotly Express. Cached figures are shared objects: render them
+with st.plotly_chart (which serializes a copy) and never update them in place.
+
+In compact mode (the default; HORIZON_COMPACT_FIGURES=0 turns it off) float
+arrays are rounded to COMPACT_DIGITS significant digits and sent as float32
+typed arrays when every value reads back unchanged (counts, whole numbers,
+binary fractions). The browser widens float32 to float64 for hovers and
+exports, which would show 0.1 as 0.10000000149, so other arrays stay float64.
+Timestamps that are all midnight are sent as plain dates.
+"""
+import os
+
+import numpy as np
+import plotly.io as pio
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import fingerprint
+
+COMPACT_FIGURES = os.environ.get("HORIZON_COMPACT_FIGURES", "1") != "0"
+COMPACT_DIGITS = 6
+_DATA_ATTRS = ("x", "y", "z", "values", "customdata", "lat", "lon", "r", "theta")
+
+
+def round_significant(values, digits=COMPACT_DIGITS):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitude = np.floor(np.log10(np.abs(values)))
+    scale = 10.0 ** (digits - 1 - np.nan_to_num(magnitude, nan=0, posinf=0, neginf=0))
+    return np.round(values * scale) / scale
+
+
+def _compact_array(values):
+    """Smaller encoding of a trace data array, or None to keep it"""
+    if values is None or isinstance(values, str):
+        return None
+    array = np.asarray(values)
+    if array.dtype.kind == "f":
+        rounded = round_significant(array)
+        single = rounded.astype(np.float32)
+        return single if np.array_equal(single, rounded, equal_nan=True) else rounded
+    if array.dtype.kind == "M" and (array == array.astype("datetime64[D]")).all():
+        return np.datetime_as_string(array, unit="D")
+    return None
+
+
+def compact_figure(fig):
+    """Rewrite a figure's data arrays, and those of its animation frames, in place with their compact encoding"""
+    for trace in [*fig.data, *(trace for frame in fig.frames for trace in frame.data)]:
+        for attr in _DATA_ATTRS:
+            if attr in trace:
+                compacted = _compact_array(trace[attr])
+                if compacted is not None:
+                    trace[attr] = compacted
+    return fig
+
+
+def payload_size(fig):
+    """Bytes of the spec st.plotly_chart sends to the browser"""
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _figure(chart_id, data_fingerprint, params, _build):
+    telemetry.mark_miss()
+    with telemetry.span(f"build:{chart_id}"):
+        fig = _build()
+        return compact_figure(fig) if COMPACT_FIGURES else fig
+
+
+def cached_figure(builder, data, names, **params):
+    """Figure from builder(*datasets, **params), rebuilt only when a dataset or parameter changes"""
+    chart_id = f"{builder.__module__}.{builder.__qualname__}"
+    with telemetry.span(f"figure:{chart_id}"), telemetry.cache_lookup("figure"):
+        return _figure(chart_id, fingerprint(names), tuple(sorted(params.items())),
+                       lambda: builder(*(data[name] for name in names), **params))
+
+
+def show_figure(fig, name, **kwargs):
+    """st.plotly_chart under a render:<name> timing span, recording its payload size when reporting is on"""
+    if telemetry.reporting_enabled():
+        telemetry.record_payload(name, payload_size(fig))
+    with telemetry.span(f"render:{name}"):
+        st.plotly_chart(fig, **kwargs)
+
+
+def show_chart(builder, data, names, params=None, **kwargs):
+    """Render a cached figure; kwargs go to st.plotly_chart"""
+    show_figure(cached_figure(builder, data, names, **(params or {})), builder.__name__, **kwargs)
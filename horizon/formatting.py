@@ -0,0 +1,103 @@
+"""Number formatting for chart labels, KPIs and tables.
+
+Every formatter takes a scalar, list, NumPy array or pandas Series and
+formats all values at once with array arithmetic and NumPy string
+operations: a scalar gives a str, a Series a Series with the same index and
+anything else a NumPy string array. Missing values become na_rep. Halves
+round away from zero (0.05 -> '0.1', 0.25 -> '0.3'), not to even as
+np.round and Python's format() do.
+
+    humanize(2_540_000)             -> '2.5M'
+    humanize(999_960)               -> '1.0M'   (the unit is chosen after rounding)
+    usd(-1234)                      -> '-$1.2K'
+    scientific(0.000123, 2)         -> '1.23e-04'
+"""
+import numpy as np
+import pandas as pd
+
+UNITS = np.array(["", "K", "M", "B", "T"])
+
+
+def _wrap(values, out):
+    if isinstance(values, pd.Series):
+        return pd.Series(out, index=values.index, name=values.name, dtype=object)
+    if np.ndim(values) == 0:
+        return str(out[0])
+    return out
+
+
+def _half_up(magnitude, decimals):
+    """Non-negative values in units of 10**-decimals, rounded half away from zero"""
+    return np.floor(magnitude * 10.0 ** decimals + 0.5)
+
+
+def _fixed(magnitude, decimals, whole=None):
+    """Non-negative finite values as fixed-point strings, written digit by digit into a code-point matrix
+
+    Rows flagged in `whole` are written without the decimal point and fraction.
+    """
+    rounded = _half_up(magnitude, decimals).astype(np.int64)
+    width = max(len(str(rounded.max(initial=0))), decimals + 1)
+    point = 1 if decimals else 0
+    chars = np.full((len(rounded), width + point), ord(" "), dtype=np.uint32)
+    for k in range(width):
+        column = width + point - 1 - k - (point if k >= decimals else 0)
+        digit = rounded // 10 ** k % 10 + ord("0")
+        # Leading zeros of the integer part stay blank
+        chars[:, column] = digit if k <= decimals else np.where(rounded >= 10 ** k, digit, ord(" "))
+    if point:
+        chars[:, width - decimals] = ord(".")
+        if whole is not None:
+            # Trailing NULs are padding in a '<U' array, so these rows end at the integer part
+            chars[whole, width - decimals:] = 0
+    # A row of UCS-4 code points is exactly one element of a '<U' array
+    return np.strings.lstrip(chars.view(f"<U{chars.shape[1]}").ravel())
+
+
+def humanize(values, decimals=1, prefix="", suffix="", na_rep=""):
+    """K/M/B/T-abbreviated numbers with a fixed number of decimals (none for whole numbers below 1K)"""
+    array = np.atleast_1d(np.asarray(values, dtype=float))
+    finite = np.isfinite(array)
+    # Beyond a million trillion the digits no longer fit in int64: those fall back to scientific notation
+    huge = finite & (np.abs(array) >= 1e18)
+    magnitude = np.abs(np.where(finite & ~huge, array, 0.0))
+    with np.errstate(divide='ignore'):
+        unit = np.clip(np.floor(np.log10(magnitude) / 3), 0, len(UNITS) - 1).astype(np.int64)
+    scaled = magnitude / 1000.0 ** unit
+    # 999.96K rounds to 1000.0K: move it up to the next unit
+    carry = (_half_up(scaled, decimals) >= 1000 * 10 ** decimals) & (unit < len(UNITS) - 1)
+    unit += carry
+    scaled = np.where(carry, scaled / 1000, scaled)
+    whole = (unit == 0) & (magnitude == np.round(magnitude))
+    number = _fixed(scaled, decimals, whole)
+    if huge.any():
+        number = np.where(huge, scientific(np.where(huge, np.abs(array), 0), decimals), number)
+    # No minus sign on values that round to zero
+    negative = (array < 0) & ((_half_up(scaled, decimals) != 0) | huge)
+    out = np.strings.add(np.strings.add(np.where(negative, "-" + prefix, prefix), number), UNITS[unit])
+    if suffix:
+        out = np.strings.add(out, suffix)
+    return _wrap(values, np.where(finite, out, na_rep))
+
+
+def usd(values, decimals=1, na_rep=""):
+    return humanize(values, decimals, prefix="$", na_rep=na_rep)
+
+
+def scientific(values, decimals=1, na_rep=""):
+    """Scientific notation matching Python's '{:.<decimals>e}'"""
+    array = np.atleast_1d(np.asarray(values, dtype=float))
+    finite = np.isfinite(array)
+    magnitude = np.abs(np.where(finite, array, 0.0))
+    with np.errstate(divide='ignore'):
+        exponent = np.where(magnitude > 0, np.floor(np.log10(magnitude)), 0).astype(np.int64)
+    # Two steps so 10**exponent stays finite for subnormal values
+    mantissa = magnitude / 10.0 ** (exponent // 2) / 10.0 ** (exponent - exponent // 2)
+    # 9.96e+02 rounds to 10.0e+02: renormalize to 1.0e+03
+    carry = _half_up(mantissa, decimals) >= 10 * 10 ** decimals
+    exponent += carry
+    mantissa = np.where(carry, mantissa / 10, mantissa)
+    low = exponent.min(initial=0)
+    exponents = np.array([f"e{e:+03d}" for e in range(low, exponent.max(initial=0) + 1)])
+    out = np.strings.add(np.strings.add(np.where(np.signbit(array), "-", ""), _fixed(mantissa, decimals)), exponents[exponent - low])
+    return _wrap(values, np.where(finite, out, na_rep))
@@ -0,0 +1,222 @@
+"""KPI values shown at the top of each section, precomputed into a snapshot file.
+
+The snapshot stores raw values per section together with the fingerprint of
+the parquet files they were computed from. A section is recomputed only when
+one of its source files changes (or KPI_VERSION is bumped), so rendering the
+top of a page is a dictionary lookup.
+"""
+import json
+import os
+import threading
+
+from horizon import telemetry
+from horizon.analytics import sector_metrics
+from horizon.catalog import BUILD_DIR, SectionData, fingerprint
+from horizon.manifest import complete_year, latest_year, years
+from horizon.partitioned import read_window
+from horizon.surveys import answer_share, get_index, missing, value, wave_mean
+
+KPI_VERSION = 4
+SNAPSHOT_PATH = f"{BUILD_DIR}/kpi_snapshot.json"
+
+
+def dev_kpis(data):
+    df_hardware = data["df_hardware"]
+    top_cost = df_hardware.loc[df_hardware['cost__inflation_adjusted'].idxmax()]
+    df_computation = data["df_computation"]
+    latest_comp = df_computation['training_computation_petaflop'].max()
+    prev_comp = df_computation.loc[df_computation['year'] == latest_year("df_computation") - 1, 'training_computation_petaflop'].max()
+    avg_datapoint = data["df_datapoint"].groupby('domain', observed=True)['training_dataset_size__datapoints'].mean().sort_values(ascending=False)
+    df_parameter = data["df_parameter"]
+    params_year = complete_year("df_parameter")
+    avg_params = df_parameter.groupby('year')['parameters'].mean().loc[params_year]
+    industry_year = complete_year("df_cost_hardware")
+    df_cost_hardware_year = read_window("df_cost_hardware", years=(industry_year, industry_year))
+    industry = df_cost_hardware_year.groupby('organization_categorization', observed=True)[['training_computation_petaflop', 'parameters']].mean().loc['Industry']
+    return {
+        "top_cost_system": top_cost['entity'],
+        "top_cost": top_cost['cost__inflation_adjusted'],
+        "computation_yoy": (latest_comp - prev_comp) / prev_comp * 100,
+        "top_datapoint_domain": avg_datapoint.index[0],
+        "top_datapoint_avg": avg_datapoint.iloc[0],
+        "avg_params": avg_params,
+        "params_year": params_year,
+        "industry_year": industry_year,
+        "industry_computation": industry['training_computation_petaflop'],
+        "industry_params": industry['parameters'],
+    }
+
+
+def geo_kpis(data):
+    cumulative_year = latest_year("df_cumulative")
+    df_cumulative_year = read_window("df_cumulative", years=(cumulative_year, cumulative_year))
+    us_count = df_cumulative_year.loc[df_cumulative_year['entity'] == "United States", 'cumulative_count'].iloc[0]
+    df_patent_agg = data["df_patent_agg"]
+    # Countries only: aggregates such as "World" have no iso3 code
+    top_patent_country = df_patent_agg[df_patent_agg['iso3'].notna()].sort_values(by='num_patent_applications__field_all', ascending=False)
+    df_bill = data["df_bill"]
+    return {
+        "cumulative_year": cumulative_year,
+        "us_share": us_count / df_cumulative_year['cumulative_count'].sum(),
+        "top_patent_country": top_patent_country['entity'].iloc[0],
+        "top_patent_applications": top_patent_country['num_patent_applications__field_all'].iloc[0],
+        "countries_with_bills": (df_bill['number_of_ai_related_bills_passed_into_law'] != 0).sum(),
+        "bill_year": latest_year("df_bill"),
+    }
+
+
+def innovation_kpis(data):
+    df_affiliation = data["df_affiliation"]
+    tot_research = df_affiliation.groupby('entity', observed=True)['yearly_count'].sum()
+    df_academia = df_affiliation[df_affiliation['entity'] == 'Academia']
+    # Affiliations count the systems of df_parameter, so their last year is partial whenever that one's is
+    academia_year = min(latest_year("df_affiliation"), complete_year("df_parameter"))
+    prev_academia = df_academia.loc[df_academia['year'] == academia_year - 1, 'yearly_count'].sum()
+    last_academia = df_academia.loc[df_academia['year'] == academia_year, 'yearly_count'].sum()
+    df_patent_world = data["df_patent_world"]
+    patent_year = latest_year("df_patent_world")
+    last_year = df_patent_world.loc[df_patent_world['year'] == patent_year, 'num_patent_granted__field_all'].sum()
+    prev_year = df_patent_world.loc[df_patent_world['year'] == patent_year - 1, 'num_patent_granted__field_all'].sum()
+    top_industry = data["df_patent_world2"].groupby('industry', observed=True)['patent_count'].sum()
+    return {
+        "industry_percent": tot_research['Industry'] / tot_research.sum() * 100,
+        "academia_year": academia_year,
+        "academia_yoy": (last_academia - prev_academia) / prev_academia * 100,
+        "patent_year": patent_year,
+        "granted_patents": df_patent_world['num_patent_granted__field_all'].sum(),
+        "granted_patents_yoy": (last_year - prev_year) / prev_year * 100,
+        "top_industry": top_industry.idxmax(),
+        "top_industry_patents": top_industry.max(),
+    }
+
+
+def investment_kpis(data):
+    df_investment = data["df_investment"]
+    investment_year = latest_year("df_investment")
+    df_investment_year = df_investment[df_investment['year'] == investment_year]
+    sectors = sector_metrics(data["df_invest_general"])
+    top_volatility = sectors.loc[sectors['volatility_score'].idxmax()]
+    latest_sectors = sectors[sectors['last_year'] == sectors['last_year'].max()]
+    gen_ai_year = latest_year("df_investment3")
+    df_investment3 = read_window("df_investment3", years=(gen_ai_year - 1, gen_ai_year))
+    latest = df_investment3.loc[df_investment3['year'] == gen_ai_year, 'generative_ai'].sum()
+    prev = df_investment3.loc[df_investment3['year'] == gen_ai_year - 1, 'generative_ai'].sum()
+    return {
+        "investment_years": list(years("df_investment")),
+        "total_investment": df_investment['world'].sum(),
+        "us_vs_china": df_investment_year['united_states'].sum() / df_investment_year['china'].sum(),
+        "top_volatility_sector": top_volatility['entity'],
+        "top_volatility": top_volatility['volatility_score'],
+        "top_concentration_sector": latest_sectors.loc[latest_sectors['geo_concentration'].idxmax(), 'entity'],
+        "gen_ai_year": gen_ai_year,
+        "gen_ai_growth": (latest - prev) / prev * 100,
+    }
+
+
+# Survey cells behind the Public View gap KPIs: (survey, answer, first entity, second entity)
+AGE_GAP = ("df_automated_survey", "Not Worried", "18-29 years", "65+ years")  # first survey wave
+GENDER_GAP = ("df_view_gender", "Mostly Helpful", "Male", "Female")  # mean over the waves
+SAFETY_GAP = ("df_view3", "Feel Safe", "Richest 20%", "Poorest 20%")
+
+
+def public_kpis(data):
+    # Survey lookups go through the (entity, answer, year) indexes in horizon/surveys.py
+    survey = get_index(AGE_GAP[0])
+    first_wave = survey.years[0]
+    view_gender = get_index(GENDER_GAP[0])
+    view3 = get_index(SAFETY_GAP[0])
+    return {
+        "worried_work": answer_share(survey, "Very Worried"),
+        "automation_age_gap": value(survey, AGE_GAP[2], AGE_GAP[1], first_wave) - value(survey, AGE_GAP[3], AGE_GAP[1], first_wave),
+        "ai_impact_sentiment": answer_share(get_index("df_view_country"), "Mostly Helpful"),
+        "gender_sentiment_gap": wave_mean(view_gender, GENDER_GAP[2], GENDER_GAP[1]) - wave_mean(view_gender, GENDER_GAP[3], GENDER_GAP[1]),
+        "safety_gap": value(view3, SAFETY_GAP[2], SAFETY_GAP[1]) - value(view3, SAFETY_GAP[3], SAFETY_GAP[1]),
+    }
+
+
+def public_gaps():
+    """{KPI: reasons} for the Public View gap KPIs whose survey cells have no row"""
+    reasons = {}
+    for kpi, (name, answer, *entities) in [("automation_age_gap", AGE_GAP), ("gender_sentiment_gap", GENDER_GAP), ("safety_gap", SAFETY_GAP)]:
+        index = get_index(name)
+        # The age gap reads the first wave; the gender gap is missing only for an entity absent from every wave
+        waves = index.years[:1] if kpi == "automation_age_gap" else index.years or (None,)
+        for entity in entities:
+            why = [missing(index, entity, answer, year) for year in waves]
+            if all(why):
+                reasons.setdefault(kpi, []).append(why[-1])
+    return reasons
+
+
+# Section -> (KPI function, datasets it reads)
+SECTION_KPIS = {
+    "🔧 AI Development": (dev_kpis, ["df_hardware", "df_computation", "df_datapoint", "df_parameter", "df_cost_hardware"]),
+    "🌍 Geographic Distribution": (geo_kpis, ["df_cumulative", "df_patent_agg", "df_bill"]),
+    "💡 Innovation": (innovation_kpis, ["df_affiliation", "df_patent_world", "df_patent_world2", "df_parameter"]),
+    "💵 Investment": (investment_kpis, ["df_investment", "df_invest_general", "df_investment3"]),
+    "👥 Public View": (public_kpis, ["df_automated_survey", "df_view_country", "df_view_gender", "df_view3"]),
+}
+
+
+def _plain(value):
+    """Convert numpy scalars to JSON-serializable Python values"""
+    return value.item() if hasattr(value, "item") else value
+
+
+def compute_section(section):
+    kpi_fn, names = SECTION_KPIS[section]
+    # Datasets load on first access; single-year KPIs read only their row groups through read_window
+    kpis = kpi_fn(SectionData(section))
+    return {"fingerprint": fingerprint(names), "kpis": {k: _plain(v) for k, v in kpis.items()}}
+
+
+def read_snapshot(path=SNAPSHOT_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return {"version": KPI_VERSION, "sections": {}}
+    if snapshot.get("version") != KPI_VERSION:
+        return {"version": KPI_VERSION, "sections": {}}
+    return snapshot
+
+
+def write_snapshot(snapshot, path=SNAPSHOT_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_snapshot(path=SNAPSHOT_PATH):
+    """Compute every section's KPIs and write the snapshot file"""
+    snapshot = {"version": KPI_VERSION, "sections": {section: compute_section(section) for section in SECTION_KPIS}}
+    write_snapshot(snapshot, path)
+    return snapshot
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()  # sessions and the warm-up update the snapshot from several threads
+
+
+def section_kpis(section):
+    """KPI values of a section, served from the snapshot while its source files are unchanged"""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = read_snapshot()
+    _, names = SECTION_KPIS[section]
+    entry = _snapshot["sections"].get(section)
+    if entry is not None and entry["fingerprint"] == fingerprint(names):
+        telemetry.count("kpi_snapshot", "hit")
+    else:
+        telemetry.count("kpi_snapshot", "miss")
+        with telemetry.span(f"kpi_compute:{section}"):
+            entry = compute_section(section)
+        with _snapshot_lock:
+            _snapshot = {**_snapshot, "sections": {**_snapshot["sections"], section: entry}}
+            try:
+                write_snapshot(_snapshot)
+            except OSError:
+                pass  # read-only deployments keep the recomputed values in memory
+    return entry["kpis"]
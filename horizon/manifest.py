@@ -0,0 +1,160 @@
+"""Dataset manifest: what each parquet file in ./data holds, read from its footer.
+
+For every catalog dataset the manifest records the file's size, mtime and
+content hash, its row and row-group counts, column schema, year range and
+distinct entities. Row counts, schema and the year range come from the
+parquet footer (row-group min/max statistics of `year`, or of `day` for
+datasets whose year is derived from it); only the entity list reads a column.
+The last day of day-dated datasets marks a final year that is still partial.
+The manifest is written to data/build/manifest.json by the offline build and
+kept in memory by the app. An entry is re-described only when its file's
+size or mtime changes, so slider bounds, "latest year" KPIs and the dataset
+fingerprints behind every cache key come from a dictionary lookup instead of
+scanning frames or hashing files: python -m horizon.manifest
+"""
+import json
+import os
+import threading
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from horizon.catalog import BUILD_DIR, CATALOG, dataset_path, hash_file
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = f"{BUILD_DIR}/manifest.json"
+
+
+def _year(value):
+    return value.year if hasattr(value, "year") else int(value)
+
+
+def _bounds(pf, column):
+    """(min, max) of a column from the row-group statistics, reading the column only where they are missing"""
+    position = pf.schema_arrow.get_field_index(column)
+    stats = [pf.metadata.row_group(i).column(position).statistics for i in range(pf.num_row_groups)]
+    if stats and all(s is not None and s.has_min_max for s in stats):
+        return min(s.min for s in stats), max(s.max for s in stats)
+    bounds = pc.min_max(pf.read(columns=[column]).column(column))
+    return (bounds["min"].as_py(), bounds["max"].as_py()) if bounds["min"].is_valid else None
+
+
+def describe(name):
+    """Manifest entry of one catalog dataset"""
+    path = dataset_path(name)
+    stat = os.stat(path)
+    pf = pq.ParquetFile(path)
+    schema = pf.schema_arrow
+    time_col = next((col for col in ('year', 'day') if col in schema.names), None)
+    bounds = _bounds(pf, time_col) if time_col else None
+    day_bounds = _bounds(pf, 'day') if 'day' in schema.names else None
+    entities = None
+    if 'entity' in schema.names:
+        entities = sorted(v for v in pf.read(columns=['entity']).column('entity').unique().to_pylist() if v is not None)
+    return {
+        "file": CATALOG[name][0],
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": hash_file(path),
+        "rows": pf.metadata.num_rows,
+        "row_groups": pf.num_row_groups,
+        "columns": {field.name: str(field.type) for field in schema},
+        "years": [_year(bounds[0]), _year(bounds[1])] if bounds else None,
+        "last_day": pd.Timestamp(day_bounds[1]).date().isoformat() if day_bounds else None,
+        "entities": entities,
+    }
+
+
+def _current(entry, name):
+    """True while the entry still describes the dataset's file"""
+    stat = os.stat(dataset_path(name))
+    return entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+
+
+def read_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "datasets": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "datasets": {}}
+    return manifest
+
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_manifest(path=MANIFEST_PATH):
+    """Describe every catalog dataset and write the manifest file"""
+    manifest = {"version": MANIFEST_VERSION, "datasets": {name: describe(name) for name in CATALOG}}
+    write_manifest(manifest, path)
+    return manifest
+
+
+_manifest = None
+_manifest_lock = threading.Lock()  # sessions and the warm-up refresh entries from several threads
+
+
+def entry(name):
+    """Manifest entry of a dataset, re-described when its file has changed since the manifest was written"""
+    global _manifest
+    if _manifest is None:
+        _manifest = read_manifest()
+    current = _manifest["datasets"].get(name)
+    if not _current(current, name):
+        current = describe(name)
+        with _manifest_lock:
+            _manifest = {**_manifest, "datasets": {**_manifest["datasets"], name: current}}
+            try:
+                write_manifest(_manifest)
+            except OSError:
+                pass  # read-only deployments keep the refreshed entry in memory
+    return current
+
+
+def years(name):
+    """Inclusive (first, last) year of a dataset, or None when it has no time column"""
+    span = entry(name)["years"]
+    return tuple(span) if span else None
+
+
+def latest_year(name):
+    return entry(name)["years"][1]
+
+
+def complete_year(name):
+    """Latest year a dataset covers in full: for datasets dated by day, the year before a last day short of December"""
+    item = entry(name)
+    last_day = item["last_day"]
+    return item["years"][1] - 1 if last_day and int(last_day[5:7]) < 12 else item["years"][1]
+
+
+def year_bounds(names):
+    """Inclusive (first, last) year covered by any of the datasets, or None when none has years"""
+    spans = [span for span in map(years, names) if span]
+    return (min(lo for lo, _ in spans), max(hi for _, hi in spans)) if spans else None
+
+
+def entities(name):
+    """Sorted distinct entities of a dataset, or None when it has no entity column"""
+    return entry(name)["entities"]
+
+
+def main():
+    manifest = build_manifest()
+    for name, item in manifest["datasets"].items():
+        span = "-".join(map(str, item["years"])) if item["years"] else "no years"
+        count = len(item["entities"]) if item["entities"] is not None else 0
+        print(f"{name}: {item['rows']} rows, {len(item['columns'])} columns, {span}, {count} entities, {item['hash']}")
+    print(f"-> {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""One module per sidebar section, each exposing render(section, data).
+
+Page modules are imported on first visit, so a rerun only imports and runs
+the code, plotting libraries and datasets of the selected section. Figure
+builders take their datasets as arguments named after the catalog entries
+(cost_chart(df_hardware)), which is how chart_builders() finds them.
+"""
+import importlib
+import inspect
+import os
+
+from horizon.catalog import CATALOG
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "AIHorizonScannerApp.py")
+
+PAGES = {
+    "🔧 AI Development": "development",
+    "🌍 Geographic Distribution": "geography",
+    "💡 Innovation": "innovation",
+    "💵 Investment": "investment",
+    "👥 Public View": "public_view",
+    "🔍 Comparison Tool": "comparison_tool",
+}
+
+
+def page_module(section):
+    return importlib.import_module(f"{__name__}.{PAGES[section]}")
+
+
+def render(section, data):
+    page_module(section).render(section, data)
+
+
+def chart_builders(section):
+    """(builder, dataset names) for every figure builder of a section's page module"""
+    module = page_module(section)
+    builders = []
+    for fn in vars(module).values():
+        if inspect.isfunction(fn) and fn.__module__ == module.__name__:
+            names = list(inspect.signature(fn).parameters)
+            if names and all(name in CATALOG for name in names):
+                builders.append((fn, names))
+    return builders
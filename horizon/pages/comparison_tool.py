@@ -0,0 +1,115 @@
+"""🔍 Comparison Tool: compare AI development metrics across countries, domains or organization types."""
+import streamlit as st
+
+from horizon import comparison, export, manifest
+from horizon.figures import show_figure
+
+
+def render(section, data):
+    st.subheader("🔍 AI Development Comparison Tool")
+    st.markdown(''':orange-background[Compare key AI development metrics across countries, domains, or organization types.]''')
+    
+    # Create comparison controls
+    col1, col2 = st.columns(2)
+    with col1:
+        comparison_type = st.selectbox("Compare by:", comparison.dimensions(), help="Select the primary dimension for comparison")
+    with col2:
+        metric = st.selectbox("Metric:", comparison.metrics_for(comparison_type), help="Select the metric to compare")
+    
+    # Add time range filter (the dataset store precomputes 'year' from 'day'); bounds come from the manifest
+    min_year, max_year = (manifest.years(comparison.METRICS[(comparison_type, metric)].dataset)
+                          or manifest.year_bounds(entry.dataset for entry in comparison.REGISTRY))
+    year_range = st.slider("Select year range:", min_value=min_year, max_value=max_year, value=(max(min_year, max_year - 6), max_year), help="Filter data by publication/training year")
+    
+    if st.button("Generate Comparison", type="primary"):
+        with st.spinner("Generating comparison..."):
+            try:
+                # Per-year cube lookup for the selected registry entry (horizon/comparison.py)
+                comparison_df = comparison.compare(comparison_type, metric, year_range)
+                metric_label = comparison_df.columns[1]
+                formatter = comparison.METRICS[(comparison_type, metric)].formatter
+                
+                # Check if we have valid comparison data
+                if comparison_df.empty:
+                    st.warning("No data available for the selected combination. Try different filters.")
+                    st.stop()
+                
+                # Create visualization
+                import plotly.express as px  # only needed once a comparison is requested
+
+                col1, col2 = st.columns([3, 1])
+                
+                with col1:
+                    # Bar chart
+                    fig = px.bar(comparison_df, x=comparison_type, y=metric_label, color=comparison_type,
+                                 text=formatter(comparison_df[metric_label]).to_numpy(),
+                                 title=f"{metric} Comparison by {comparison_type} ({year_range[0]}-{year_range[1]})",
+                                 labels={comparison_type: comparison_type, metric_label: metric_label})
+                    
+                    fig.update_traces(textposition='outside', marker_line_color='rgb(60,60,60)', marker_line_width=1)
+                    fig.update_layout(showlegend=False, yaxis_title=metric_label, xaxis_title="", plot_bgcolor='rgba(240,247,244,0.5)')
+                    show_figure(fig, "comparison", use_container_width=True)
+                
+                with col2:
+                    # Show data table
+                    st.markdown("**Comparison Data**")
+                    
+                    # Format values based on type
+                    display_df = comparison_df.copy()
+                    display_df[metric_label] = formatter(display_df[metric_label])
+                    
+                    st.dataframe(display_df,height=300, width=600, hide_index=True)
+                    
+                    # Add download button for raw data (encoded only when clicked, horizon/export.py)
+                    # Cubes without years hold all-time totals: no year range, as in export.combinations()
+                    has_years = len(comparison.get_cube(comparison_type, metric).years)
+                    combo = [export.Combination(comparison_type, metric, year_range if has_years else None)]
+                    st.download_button("Download Data", data=export.deferred(combo, "csv"), file_name=export.file_name(combo, "csv"),
+                                       mime=export.FORMATS["csv"].mime, on_click="ignore")
+                
+                # Add insights based on comparison
+                with st.expander("🔍 Analysis Insights", expanded=True):
+                    top_value = comparison_df.iloc[0][metric_label]
+                    top_name = comparison_df.iloc[0][comparison_type]
+                    
+                    insights = [f"- **{top_name}** leads with {formatter(top_value)} {metric}"]
+                    
+                    if len(comparison_df) > 1:
+                        bottom_value = comparison_df.iloc[-1][metric_label]
+                        bottom_name = comparison_df.iloc[-1][comparison_type]
+                        insights.append(f"- **{bottom_name}** has the lowest at {formatter(bottom_value)}")
+                    
+                    if len(comparison_df) >= 3:
+                        top3_share = (comparison_df.head(3)[metric_label].sum() / comparison_df[metric_label].sum()) * 100
+                        insights.append(f"- The top 3 account for {top3_share:.1f}% of total")
+                    
+                    # Domain-specific insights
+                    if comparison_type == "Domain":
+                        if metric == "Training Cost":
+                            insights.append("\n**Training Cost Insights:**")
+                            insights.append("- Language models typically have the highest training costs")
+                            insights.append("- Vision systems show more cost efficiency")
+                        
+                        elif metric == "Parameters":
+                            insights.append("\n**Parameters Insights:**")
+                            insights.append("- Parameter count correlates with model capability but also computational requirements")
+                            insights.append("- Recent models show exponential growth in parameters")
+                    
+                    st.markdown("\n".join(insights))
+            
+            except Exception as e:
+                st.error(f"Error generating comparison: {str(e)}")
+                st.info("Please check the data availability for your selected filters.")
+
+    with st.expander("📦 Bulk Export"):
+        st.caption("Export several comparisons at once, or the per-system rows behind them, for the selected year range.")
+        entries = {f"{entry.dimension} / {entry.metric}": entry for entry in comparison.REGISTRY}
+        selected = st.multiselect("Comparisons:", list(entries), default=list(entries))
+        col1, col2, col3 = st.columns(3)
+        fmt = col1.selectbox("Format:", list(export.FORMATS), format_func=str.upper)
+        rows = col2.checkbox("Per-system rows", help="Every AI system or country row instead of the ranked comparison table")
+        per_year = col3.checkbox("One range per year", help="Split the year range into single years")
+        combos = [combo for option in selected for combo in
+                  export.combinations([entries[option].dimension], [entries[option].metric], [year_range], per_year)]
+        st.download_button(f"Download {len(combos)} Combinations", data=export.deferred(combos, fmt, rows), file_name=export.file_name(combos, fmt, rows),
+                           mime=export.FORMATS[fmt].mime, on_click="ignore", disabled=not combos)
@@ -0,0 +1,100 @@
+"""🌍 Geographic Distribution: AI systems, patents and AI bills by country."""
+import plotly.express as px
+import streamlit as st
+
+from horizon import manifest, playback, telemetry
+from horizon.figures import show_chart
+from horizon.formatting import humanize
+from horizon.kpis import section_kpis
+
+
+def cumulative_systems_chart(df_cumulative):
+    """Cumulative large-scale AI systems by country"""
+    color_discrete_map6 = {'Canada': 'rgb(192, 43, 61)', 'China': 'rgb(20, 19, 1)', 'Finland': 'rgb(206, 162, 172)', 'France': 'rgb(166, 117, 161)', 'Germany': 'rgb(252, 100, 113)', 
+                           'Hong Kong': 'rgb(163, 67, 133)', 'Israel': 'rgb(112, 110, 96)', 'Japan': 'rgb(170, 83, 98)', 'Russia': 'rgb(237, 174, 73)', 'Saudi Arabia': 'rgb(223, 87, 188)', 
+                           'Singapore': 'rgb(249, 220, 92)', 'South Korea': 'rgb(297, 40, 61)', 'United Arab Emirates': 'rgb(183, 181, 179)', 'United Kingdom': 'rgb(237, 174, 73)', 'United States': 'rgb(184, 12, 9)'}
+    
+    fig6 = px.line(df_cumulative, x="year", y="cumulative_count", color="entity", markers=True, color_discrete_map=color_discrete_map6, 
+                   labels={"entity": "Country", "year": "Year", "cumulative_count": "AI System Count"}, title="Cumulative Number of Large-Scale AI Systems by Country", width=550, height=450)
+    fig6.update_traces(hovertemplate="%{fullData.name}: %{y:.0f}<extra>%{fullData.name}</extra>", 
+                       marker=dict(size=7, opacity=0.8, line=dict(width=0.5, color='black')))
+    fig6.update_layout(xaxis=dict(tickmode="linear", dtick=1), legend_title="Country", yaxis=dict(title="Cumulative AI System Count"), title_x=0.22, 
+                       margin=dict(l=5, r=5, t=35, b=5), plot_bgcolor='rgba(229, 231, 230, 0.5)')
+    return fig6
+
+
+def cumulative_map(df_cumulative):
+    """Cumulative large-scale AI systems on a world map, played back year by year"""
+    # Frames carry only each year's counts, aligned to the countries of the base trace (horizon/playback.py)
+    frames = playback.year_frames(df_cumulative, 'cumulative_count')
+    fig = playback.animated_choropleth(frames, "Cumulative Number of Large-Scale AI Systems by Country", "AI Systems", colorscale="Reds", height=450)
+    fig.update_layout(title_x=0.22, plot_bgcolor='rgb(249, 248, 248)')
+    return fig
+
+
+def patent_map(df_patent_agg):
+    """World map of AI patent applications"""
+    # iso3 codes come from the dataset store (horizon/countries.py); aggregates such as "World" have none
+    df_patent_agg = df_patent_agg[df_patent_agg['iso3'].notna()]
+    fig7 = px.choropleth(df_patent_agg, locations='iso3', color="num_patent_applications__field_all", hover_name=None, 
+                         hover_data={"entity": True, "iso3": False, "num_patent_applications__field_all": True}, color_continuous_scale="Viridis_r", width=500, height=400, 
+                         labels={"entity": "Country", "num_patent_applications__field_all": "Application Count"}, title="Country-Wise AI-Related Total Patent Applications by 2024")
+    fig7.update_layout(geo=dict(showcoastlines=True, showframe=True), title_x=0.22, margin=dict(l=5, r=5, t=25, b=5), plot_bgcolor='rgb(249, 248, 248)', coloraxis_colorbar=dict(title="Count"))
+    return fig7
+
+
+def bill_map(df_bill):
+    """World map of AI-related bills passed into law"""
+    df_bill = df_bill[df_bill['iso3'].notna()]
+    fig8 = px.choropleth(df_bill, locations='iso3', color="number_of_ai_related_bills_passed_into_law", 
+                         hover_data={"entity": True, "iso3": False, "number_of_ai_related_bills_passed_into_law": True}, hover_name=None, color_continuous_scale="Inferno_r", 
+                         labels={"entity": "Country", "number_of_ai_related_bills_passed_into_law": "Passed Bill Count"}, title=f"Country-Wise AI-Related Passed Bill into Law by {manifest.latest_year('df_bill')}", width=500, height=400)
+    fig8.update_layout(geo=dict(showcoastlines=True, showframe=True), title_x=0.25, margin=dict(l=5, r=5, t=25, b=5), plot_bgcolor='rgb(249, 248, 248)', coloraxis_colorbar=dict(title="Count"))
+    return fig8
+
+
+def render(section, data):
+    st.subheader("🌍 Geographic Distribution Interactive Plots")
+    with telemetry.span(f"kpis:{section}"):
+        kpis = section_kpis(section)
+               
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Leading Country", "USA", help=f"Country with highest AI systems by {kpis['cumulative_year']}")
+    col2.metric("USA Market Share:", f"{kpis['us_share']:.1%}", help="USA share in global AI systems")
+    col3.metric("Highest Patent Application:", humanize(kpis['top_patent_applications']), f"{kpis['top_patent_country']}", help=f"Country with highest patent application")
+    col4.metric("In Europe", f"{kpis['countries_with_bills']}", "Country", help=f"Number of European countries passed AI-related bill into law")
+
+    matter_text = '''The geographic concentration of AI development affects global power dynamics and determines which cultural perspectives are embedded in these influential technologies'''
+    explain_text = '''**Dominance**: The US leads significantly in large-scale AI systems, followed by China, with other countries far behind.   
+    **Emerging Players**: The UK and South Korea began showing notable AI development in 2021.   
+    **Policy Implication**: This indicates a significant concentration of AI development power in a few nations.'''
+    explain_text2 = '''**Dominance**: China leads with 365K patent applications, followed by the USA with 72K.   
+    **Emerging Players**: Germany leads the EU region.'''
+    explain_text3 = '''**Concern**: Few countries have enacted AI-related legislation.   
+    **Finding**: The USA has passed 23 bills, with Portugal in second place.   
+    **Surprise**: Despite being a major AI player, China has passed only 3 bills.'''
+    col1, col2, col3, col4 = st.columns(4)
+    with col1: 
+        with st.popover("❓❓ Why This Matters"):
+            st.markdown(matter_text)
+    with col2:
+        with st.popover("🤖 Explain AI Count Chart"):
+            st.markdown(explain_text)
+    with col3:
+        with st.popover("📝 Explain Patent Chart"):
+            st.markdown(explain_text2)
+    with col4:
+        with st.popover("💼 Explain Bill Chart"):
+            st.markdown(explain_text3)
+ 
+    # Cumulative Number of Large-Scale AI Systems by Country, as lines or as a map with year-by-year playback
+    if st.toggle("🗺️ Play back on a world map", help="Step through the years with the slider or ▶ below the map"):
+        show_chart(cumulative_map, data, ["df_cumulative"], use_container_width=True)
+    else:
+        show_chart(cumulative_systems_chart, data, ["df_cumulative"], use_container_width=True)
+
+    # World Map for 'Country-Wise AI-Related Total Patent Applications by 2024'
+    show_chart(patent_map, data, ["df_patent_agg"], use_container_width=True)
+
+    # World Map for 'AI-Related Passed Bill into Law by Country'
+    show_chart(bill_map, data, ["df_bill"], use_container_width=True)
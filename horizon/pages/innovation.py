@@ -0,0 +1,88 @@
+"""💡 Innovation: research affiliations and AI patents."""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from horizon import telemetry
+from horizon.figures import show_chart
+from horizon.formatting import humanize
+from horizon.kpis import section_kpis
+
+
+def affiliation_chart(df_affiliation):
+    """Affiliation of research teams building AI systems"""
+    color_discrete_map9={'Academia': 'rgb(238, 99, 82)', 'Industry': 'rgb(121, 132, 120)', 'Academia & Industry Collab': 'rgb(76, 134, 168)', 'Other': 'rgb(170, 109, 163)'}
+    fig9 = px.bar(df_affiliation, x="year", y="yearly_count", color="entity", text_auto=False, color_discrete_map = color_discrete_map9, 
+                  labels={"entity": "Sector", "year": "Year", "yearly_count": "Count"}, title="Affiliation of Research Teams Building AI systems", width=700, height=400)
+    fig9.update_traces(hoverinfo="text+name")
+    fig9.update_layout(barmode="stack", yaxis=dict(title="Count"), xaxis=dict(title = "Publication Year", tickmode="linear", dtick=1, tickangle=-45), legend_title="Sector", 
+                       hovermode="x unified", title_x = 0.22, margin=dict(l=10, r=5, t=35, b=5, pad=5), plot_bgcolor='rgb(249, 248, 248)')
+    return fig9
+
+
+def patent_status_chart(df_patent_world):
+    """Worldwide AI patent applications by status"""
+    fig10 = go.Figure()
+    fig10.add_trace(go.Bar(x=df_patent_world['year'], name="Granted", y=df_patent_world['num_patent_granted__field_all'], text=df_patent_world['num_patent_granted__field_all'],
+                           textfont=dict(size=10, weight='bold'), marker_color='rgb(97, 152, 142)'))
+    fig10.add_trace(go.Bar(x=df_patent_world['year'], name="Applied", y=df_patent_world['num_patent_applications__field_all'],
+                           text=df_patent_world['num_patent_applications__field_all'], textfont=dict(size=10, weight='bold'), marker_color='rgb(222, 143, 110)'))
+    fig10.update_traces(hoverinfo="text+name", marker=dict(opacity=0.8))
+    fig10.update_layout(barmode="stack", yaxis=dict(title="Patent Count"), xaxis=dict(title="Year", tickmode="linear", dtick=1, tickangle=0), legend_title="Status", 
+                        hovermode="x unified", margin=dict(l=10, r=5, t=35, b=5, pad=5), width=250, height=400, plot_bgcolor='rgba(249, 248, 248, 0.5)', 
+                        title="Worldwide AI Related Patent Applications by Status", title_x=0.27)
+    return fig10
+
+
+def patent_industry_chart(df_patent_world2):
+    """Worldwide granted AI patents by industry"""
+    color_discrete_map11={'Banking & Finance': 'rgb(18, 19, 15)', 'Industry & Manufacturing': 'rgb(214, 143, 214)', 'Energy & Management': 'rgb(214, 69, 80)', 
+                          'Business': 'rgb(119, 133, 172)', 'Security': 'rgb(139, 93, 51)', 'Life Sciences': 'rgb(134, 157, 122)', 'Transportation': 'rgb(255, 133, 82)', 
+                          'Physical Sciences & Engineering': 'rgb(60, 79, 118)','Telecommunication': 'rgb(127, 5, 95)', 'Personal Devices & Computing': 'rgb(11, 122, 117)'}
+    fig11 = px.bar(df_patent_world2, x="year", y="patent_count", color="industry", text_auto=False, color_discrete_map = color_discrete_map11,
+                   labels={"industry": "Industry", "year": "Year", "patent_count": "Patent Count"}, title="Worldwide Annual Granted AI Related Patents by Industry", width=700, height=400)
+    fig11.update_traces(hoverinfo="text+name")
+    fig11.update_layout(barmode="stack", xaxis=dict(title = "Year", tickmode="linear", dtick=1, tickangle=0), yaxis=dict(title="Granted Patent Count"), 
+                        legend_title="Industry", title_x=0.22, margin=dict(l=100, r=5, t=35, b=5, pad=5), plot_bgcolor='rgb(249, 248, 248)')
+    return fig11
+
+
+def render(section, data):
+    st.subheader("💡 Innovation Interactive Plots")
+
+    # Innovation KPIs
+    with telemetry.span(f"kpis:{section}"):
+        kpis = section_kpis(section)
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Industry Affiliation", f"{kpis['industry_percent']:.1f}%", help="Percentage of industry affiliated AI system developers")
+    col2.metric("Academia Affiliation YoY", f"{kpis['academia_yoy']:.1f}%", help=f"Change in academia affiliation, {kpis['academia_year'] - 1} → {kpis['academia_year']}")
+    col3.metric("Granted AI Patents", humanize(kpis['granted_patents']), help=f"Worldwide granted AI patent count by {kpis['patent_year']}")
+    col4.metric("Granted Patent YoY", f"{kpis['granted_patents_yoy']:.1f}%", help=f"Worldwide granted AI patent change, {kpis['patent_year'] - 1} → {kpis['patent_year']}")
+    col5.metric("Top Industry", humanize(kpis['top_industry_patents']), kpis['top_industry'], help=f"Leading industry with granted AI patent")
+    
+    matter_text = '''Tracking innovation through patents and research affiliations helps us understand where AI capabilities are being developed and who controls this intellectual property.'''
+    explain_text = '''**Shift**: Since 2015, industry involvement has grown dramatically while academic projects have declined, with no purely academic affiliations by 2024.   
+    **Current State**: The Industry now produces most notable AI systems research.'''
+    explain_text2 = '''**Explosion**: AI patent applications surged from 10K in 2013 to over 150K in 2021.   
+    **Trend**: The percentage of granted applications increased until 2021 and then decreased, suggesting stricter approval policies.    
+    **Industry Focus**: Personal Devices & Computing leads in granted patents, followed by Telecommunications. Banking & Finance holds the smallest share.'''
+    col1, col2, col3 = st.columns(3)
+    with col1: 
+        with st.popover("❓❓ Why This Matters"):
+            st.markdown(matter_text)
+    with col2:
+        with st.popover("💰 Explain Affiliation Chart"):
+            st.markdown(explain_text)
+    with col3:
+        with st.popover("🖥️ Explain Patent Charts"):
+            st.markdown(explain_text2)
+    
+    # 'Affiliation of Research Teams Building AI systems' Plot
+    show_chart(affiliation_chart, data, ["df_affiliation"], use_container_width=True)
+    
+    # Worldwide AI Related Patent Applications by Status
+    show_chart(patent_status_chart, data, ["df_patent_world"], use_container_width=True, width=250, height=400)
+
+    # 'Worldwide Annual Granted AI Related Patents by Industry' Plot
+    show_chart(patent_industry_chart, data, ["df_patent_world2"], use_container_width=True)
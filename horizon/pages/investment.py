@@ -0,0 +1,128 @@
+"""💵 Investment: private AI investment by region, sector and technology."""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from horizon import telemetry
+from horizon.analytics import volatility_table
+from horizon.figures import show_chart
+from horizon.formatting import humanize, usd
+from horizon.kpis import section_kpis
+
+
+def investment_location_chart(df_investment):
+    """Annual private AI investment by location"""
+    fig12 = go.Figure()
+    fig12.add_trace(go.Scatter(x=df_investment['year'], y=df_investment['china'], name='China', mode='lines+markers', marker_color='rgb(150, 2, 0)', marker_size = 8, opacity=0.7))
+    fig12.add_trace(go.Scatter(x=df_investment['year'], y=df_investment['united_states'], name='United States', mode='lines+markers', marker_size = 8, marker_color='rgb(225, 188, 41)', opacity=0.7))
+    fig12.add_trace(go.Scatter(x=df_investment['year'], y=df_investment['european_union_and_united_kingdom'], name='European Union & United Kingdom', mode='lines+markers', 
+                               marker_color='rgb(36, 30, 78)', marker_size = 8, opacity=0.7))
+    fig12.add_trace(go.Scatter(x=df_investment['year'], y=df_investment['world'],name='World', mode='lines+markers', marker_size = 8,marker_color='rgb(63, 124, 172)', opacity=0.7))
+    fig12.update_layout(xaxis=dict(title="Year", tickmode="linear", dtick=1, tickangle=0), yaxis=dict(title="Private Investment (USD)"), legend_title="Location",
+                        margin=dict(l=5, r=5, t=35, b=5, pad=5), hovermode="x unified", title="Annual Private Investment in AI by Location", title_x = 0.2, 
+                        plot_bgcolor = 'rgba(248, 247, 255, 0.7)', width=700, height=400)
+    return fig12
+
+
+def investment_domain_chart(df_investment1):
+    """Annual private AI investment by application domain"""
+    color_discrete_map13={'Insurance Tech': 'rgb(128, 94, 115)', 'Marketing & Digital Ads': 'rgb(255, 93, 115)', 'Manufacturing': 'rgb(45, 70, 84)', 'Creative Content': 'rgb(183, 68, 184)',
+                          'Educational Tech': 'rgb(96, 147, 93)','Energy Industry': 'rgb(198, 202, 83)','Medical & Healthcare': 'rgb(170, 80, 66)', 'Retail': 'rgb(243, 156, 107)'}
+    fig13 = px.line(df_investment1, x="year", y="world", color="entity", markers=True, labels={"entity":"Domain","year": "Year", "world": "Private Investment"}, 
+                    title="Worldwide Annual Private Investment in AI by Domain", width=700, height=400, color_discrete_map = color_discrete_map13)
+    fig13.update_traces(hovertemplate="%{fullData.name}: %{y:.0f}<extra>%{fullData.name}</extra>")
+    fig13.update_traces(marker=dict(size=8, opacity=0.7, line=dict(width=0.5, color='black')))
+    fig13.update_layout(xaxis=dict(tickmode="linear", dtick=1, tickangle=0), yaxis=dict(title="Private Investment (USD)"), title_x = 0.195, legend_title="Domain", 
+                        margin=dict(l=5, r=5, t=35, b=5, pad=5), hovermode="closest", plot_bgcolor = 'rgba(248, 247, 255, 0.7)')
+    return fig13
+
+
+def investment_technology_chart(df_investment2):
+    """Annual private AI investment by technology domain"""
+    color_discrete_map14={'AI Infrastructure & Governance': 'rgb(74, 13, 103)', 'Hardware': 'rgb(198, 202, 83)','Augmented & Virtual Reality': 'rgb(104, 216, 155)',
+                          'Autonomous Vehicles': 'rgb(255, 127, 17)', 'Quantum Computing': 'rgb(99, 105, 209)','Cybersecurity & Data Protection': 'rgb(59, 65, 60)',
+                          'Data Management & Processing': 'rgb(0, 175, 185)','Facial Recognition': 'rgb(214, 69, 80)', 'NLP & Customer Support': 'rgb(227, 101, 193)'}
+    fig14 = px.line(df_investment2, x="year", y="world", color="entity", markers=True, labels={"entity":"Domain","year": "Year", "world": "Private Investment"},
+                    title="Worldwide Annual Private Investment in AI by Domain", width=600, height=400, color_discrete_map = color_discrete_map14)
+    fig14.update_traces(hovertemplate="%{fullData.name}: %{y:.0f}<extra>%{fullData.name}</extra>", 
+                        marker=dict(size=8, opacity=0.7, line=dict(width=0.5, color='black')))
+    fig14.update_layout(xaxis=dict(tickmode="linear", dtick=1, tickangle=0), title_x = 0.157, yaxis=dict(title="Private Investment (USD)"), hovermode="closest",
+                        legend_title="Domain", margin=dict(l=5, r=5, t=35, b=5, pad=5),plot_bgcolor='rgba(248, 247, 255, 0.7)')
+    return fig14
+
+
+def volatility_chart(df_invest_general):
+    """Volatility score of private investment per AI sector"""
+    volatility_df = volatility_table(df_invest_general)
+
+    fig141 = px.bar(volatility_df, x='entity', y='volatility_score', color='volatility_score', title='AI Sector Volatility Scores',
+                    labels={'volatility_score': 'Volatility Score', 'entity': 'Sector'}, color_continuous_scale='thermal_r', width=700, height=600)
+
+    fig141.update_layout(hovermode='x unified', xaxis={'categoryorder':'total descending'}, xaxis_tickangle=-45, yaxis_title="Volatility Score (Percentage)", 
+                         plot_bgcolor='rgba(248, 247, 255, 0.7)', title_x = 0.3)
+    avg_score = volatility_df['volatility_score'].mean()
+    fig141.add_hline(y=avg_score, line_dash="dot", annotation_text=f'Average: {avg_score:.0f}', annotation_position="top right")
+    return fig141
+
+
+def generative_ai_chart(df_investment3):
+    """Worldwide private investment in generative AI"""
+    fig15 = px.bar(df_investment3, x="year", y="generative_ai",labels={"year": "Year", "generative_ai": "Amount($)"}, title="Worldwide Private Investment in Generative AI", width=600, height=400)
+    fig15.update_traces(text=humanize(df_investment3['generative_ai'], decimals=2),textfont_size=12.5, textfont_weight='bold', textangle=0,textfont_color='rgb(60, 60, 60)', 
+                        textposition="outside",hoverinfo="text", marker_color='rgb(255, 90, 95)', marker_opacity=0.7,marker_line_color='rgb(60, 60, 60)', marker_line_width=1.5)
+    fig15.update_layout(xaxis=dict(title="Year", tickmode="linear", dtick=1, tickangle=0),yaxis=dict(title="Private Investment (USD)"), title_x = 0.32,
+                        margin=dict(l=0, r=5, t=35, b=5, pad=5), plot_bgcolor='rgba(248, 247, 255, 0.7)')
+    return fig15
+
+
+def render(section, data):
+    st.subheader("💵 Investment Interactive Plots")
+
+    with telemetry.span(f"kpis:{section}"):
+        kpis = section_kpis(section)
+
+
+    #KPIs
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Total AI Investment", usd(kpis['total_investment']),  help=f"Worldwide total private investment in AI, {kpis['investment_years'][0]}-{kpis['investment_years'][1]}")
+    col2.metric("US vs China", f"{kpis['us_vs_china']:.1f}x", help=f"Private investment USA to China ratio in {kpis['investment_years'][1]}")
+    col3.metric("Highest Volatility", f"{kpis['top_volatility']:.1f}%", kpis['top_volatility_sector'], help=f"Private investment volatility score of AI sectors")
+    col4.metric("Geographic Monopoly", kpis['top_concentration_sector'], help=f"Concentration private investment in AI sectors")
+    col5.metric("Generative AI Growth", f"{kpis['gen_ai_growth']:.1f}%", help=f"Generative AI private investment growth, {kpis['gen_ai_year'] - 1} → {kpis['gen_ai_year']}")
+
+    matter_text = '''Investment patterns reveal which AI applications and regions are attracting capital, shaping the future direction of AI development and commercialization.'''
+    explain_text = '''**Geographic**: The US dominates investments, followed by China.    
+    **Trend**: Worldwide annual private investment increased until 2021, then declined in 2022 due to the COVID-19 pandemic.    
+    **Recovery:** After 2022, the USA showed elevated investment growth while China and the EU region began recovery.'''
+    explain_text2 = '''**Dominance:** Natural Language Processing & Customer Support claim the largest share of private investment.    
+    **Infrastructure Investment Surge**: AI Infrastructure & Governance showed massive investment spikes ($16B in 2023), suggesting a fundamental shift toward building robust AI foundations.'''
+    explain_text3 = '''**Hockey Stick**: Investment exploded from $89M in 2019 to $4B in 2023—a 250x growth in 4 years.         
+    **Warning Sign**: The 2022 dip suggests potential sector volatility.'''
+    col1, col2, col3, col4 = st.columns(4)
+    with col1: 
+        with st.popover("❓❓ Why This Matters"):
+            st.markdown(matter_text)
+    with col2:
+        with st.popover("💸 Explain Regional Chart"):
+            st.markdown(explain_text)
+    with col3:
+        with st.popover("🧰 Explain Sectoral Charts"):
+            st.markdown(explain_text2)
+    with col4:
+        with st.popover("🤖 Explain GenAI Chart"):
+            st.markdown(explain_text3)
+    
+    # Annual Private Investment in AI by Location
+    show_chart(investment_location_chart, data, ["df_investment"], use_container_width=True)
+
+    # 'Worldwide Annual Private Investment in AI by Domain' Plot
+    show_chart(investment_domain_chart, data, ["df_investment1"], use_container_width=True)
+
+    # 'Worldwide Annual Private Investment in AI by Domain' Second Plot
+    show_chart(investment_technology_chart, data, ["df_investment2"], use_container_width=True)
+
+    # Volatility Visualization
+    show_chart(volatility_chart, data, ["df_invest_general"], use_container_width=True)
+    
+    # 'Worldwide Private Investment in Generative AI' Bar Plot
+    show_chart(generative_ai_chart, data, ["df_investment3"], use_container_width=True)
@@ -0,0 +1,135 @@
+"""👥 Public View: survey opinions on automation, AI's societal impact and self-driving cars."""
+import pandas as pd
+import plotly.express as px
+from plotly.subplots import make_subplots
+import streamlit as st
+
+from horizon import manifest, telemetry
+from horizon.figures import show_chart
+from horizon.formatting import humanize
+from horizon.kpis import public_gaps, section_kpis
+
+
+def automation_survey_chart(df_automated_survey):
+    """Americans opinion about their work being automated"""
+    color_discrete_map16={"Don't Know": "rgb(58, 45, 50)", "Worried": "rgb(221, 96, 49)", "Not Worried": "rgb(68, 114, 202)", "Very Worried": "rgb(147, 3, 46)"}
+    fig16 = px.bar(df_automated_survey, x='year', y='opinion_count', color='opinion', barmode='stack', facet_col='entity', color_discrete_map = color_discrete_map16,
+                   labels = {'entity': 'Age Group', 'opinion': 'Opinion', 'year': 'Year','opinion_count': 'Count'})
+    fig16.update_traces(marker_line_color='rgb(60, 60, 60)',marker_line_width = 1.5, marker_opacity=0.8)
+    fig16.update_layout(title_text='Americans Opinion About Their Work Being Automated',title_x=0.25, xaxis_title='Year', yaxis_title='Opinion Count',legend_title='Opinion', 
+                        width = 1000, height = 450, plot_bgcolor='rgb(250, 249, 249)')
+    return fig16
+
+
+def view_country_chart(df_view_country):
+    """Views on AI's societal impact by country"""
+    color_discrete_map17 = {'Mostly Helpful':'rgb(0, 127, 255)', 'No Opinion':'rgb(128, 138, 159)','Mostly Harmful':'rgb(196, 32, 33)', 'Neither':'rgb(213, 137, 54)'}
+    fig17 = px.bar(df_view_country, x='opinion_percent', y='entity', color='opinion', color_discrete_map = color_discrete_map17, barmode='stack',
+                   labels = {'entity': 'Country', 'opinion': 'Opinion', 'year': 'Year', 'opinion_percent': 'Percentage'})
+    fig17.update_traces(texttemplate='%{x:.1f}%', textposition='inside', textfont = dict(size = 10.5, weight = 'bold'), marker_line_color='rgb(60, 60, 60)', marker_line_width=1.5, marker_opacity=0.7)
+    fig17.update_layout(title_text="Views on AI's Societal Impact in Next 20 Years by Country", title_x=0.25, xaxis_title = '',yaxis_title='',legend_title='Opinion',
+                        margin=dict(l=100, r=5, t=35, b=5, pad=5), width=900, height=400, plot_bgcolor='rgb(250, 249, 249)')
+    return fig17
+
+
+def view_region_chart(df_view_continent21):
+    """Views on AI's societal impact by region"""
+    color_discrete_map18 = {'Mostly Helpful':'rgb(14, 177, 210)', 'No Opinion':'rgb(66, 75, 84)','Mostly Harmful':'rgb(255, 0, 53)', 'Neither':'rgb(206, 141, 102)'}
+    fig18 = px.bar(df_view_continent21, x='opinion_percent', y='entity', color='opinion', color_discrete_map= color_discrete_map18, barmode='stack',
+                   labels = {'entity': 'Country', 'opinion': 'Opinion', 'year': 'Year', 'opinion_percent': 'Percentage'})
+    fig18.update_traces(texttemplate='%{x:.1f}%', textposition='inside',textfont = dict(size = 10.5, weight = 'bold'),marker_line_color='rgb(60, 60, 60)',marker_line_width=1.5, marker_opacity=0.8)
+    fig18.update_layout(title_text="Views on AI's Societal Impact in Next 20 Years by Region",title_x=0.25, xaxis_title = '',yaxis_title='',legend_title='Opinion',
+                        margin=dict(l=100, r=5, t=35, b=5, pad=5),width=800, height=400, plot_bgcolor='rgb(250, 249, 249)')
+    return fig18
+
+
+def gender_view_chart(df_view_gender):
+    """Male/female views on AI's societal impact, first vs latest survey wave"""
+    # px.sunburst aggregates its path columns, which unordered categoricals don't support
+    df_view_gender = df_view_gender.astype({'entity': str, 'opinion': str})
+    first_wave, last_wave = manifest.years("df_view_gender")
+    df_view_gender19 = df_view_gender[df_view_gender['year'] == first_wave]
+    df_view_gender21 = df_view_gender[df_view_gender['year'] == last_wave]
+    color_discrete_map19 = {'Mostly Helpful': 'rgb(64, 71, 109)', 'No Opinion': 'rgb(172, 190, 163)','Mostly Harmful': 'rgb(242, 71, 48)', 'Neither': 'rgb(189, 160, 188)'}
+    fig19 = make_subplots(rows=1, cols=2, specs=[[{'type': 'domain'}, {'type': 'domain'}]],subplot_titles=(f"Male/Female Views on AI's Societal Impact ({first_wave})",
+                                                                                                           f"Male/Female Views on AI's Societal Impact ({last_wave})"))
+    sunburst1 = px.sunburst(df_view_gender19, path=['entity', 'opinion'], color='opinion', values='opinion_percent',color_discrete_map=color_discrete_map19,
+                            custom_data=['entity', 'opinion', 'opinion_percent'],hover_data=['entity', 'opinion', 'opinion_percent'])
+    sunburst2 = px.sunburst(df_view_gender21, path=['entity', 'opinion'], color='opinion', values='opinion_percent', color_discrete_map=color_discrete_map19,
+                            custom_data=['entity', 'opinion', 'opinion_percent'], hover_data=['entity', 'opinion', 'opinion_percent'])
+    fig19.add_trace(sunburst1.data[0], row=1, col=1)
+    fig19.add_trace(sunburst2.data[0], row=1, col=2)
+    fig19.update_traces(hovertemplate='<b>%{label}</b><br>Value: %{value}<br>Gender: %{customdata[0]}', texttemplate='%{label}<br>%{percentEntry:.1%}',
+                        insidetextorientation='auto', textfont=dict(size=11.5))
+    fig19.update_layout(margin=dict(t=50, l=30, r=0, b=0), plot_bgcolor='rgb(14, 177, 210)', width = 900, height = 450)
+    return fig19
+
+
+def self_driving_chart(df_view3):
+    """Views on self-driving cars by demographic group"""
+    color_discrete_map20={'Feel Safe': 'rgb(23, 190, 187)', 'Not Feel Safe': 'rgb(255, 49, 46)',"Don't Know": 'rgb(242, 187, 5)', 'No Response': 'rgb(34, 12, 16)'}
+    fig20 = px.bar(df_view3, y="entity", x="view_percent", color="view", text_auto=False,labels={"view": "View", "entity": "Group", "view_percent": "Percent"},
+                   title="Global Views on Self-Driving Cars by Demographic Group (2021)", width=900, height=400, color_discrete_map = color_discrete_map20)
+    fig20.update_traces(hoverinfo="text+name", texttemplate='%{x:.0f}%', textposition='inside',textfont = dict(size = 10.5, weight = 'bold'),
+                        marker_line_color='rgb(60, 60, 60)', marker_line_width=1.5, marker_opacity=0.8)
+    fig20.update_layout(barmode="stack", xaxis=dict(title = "", tickmode="linear", dtick=10, tickangle=0), title_x = 0.3, 
+                        yaxis={'categoryorder': 'array', 'categoryarray': ['65+ years', '50-64 years', '30-49 years', '15-29 years', 'Poorest 20%', 'Richest 20%']},
+                        yaxis_title="", legend_title="View", margin=dict(l=100, r=5, t=35, b=5, pad=5), width=800, height=400, plot_bgcolor='rgb(250, 249, 249)')
+    return fig20
+
+
+def render(section, data):
+    with telemetry.span(f"kpis:{section}"):
+        kpis = section_kpis(section)
+    
+    # Survey keys without a row come back as NaN, show as n/a and get a note saying which part of the key is missing
+    col1, col2, col3, col4, col5= st.columns(5)
+    col1.metric("Work Automation Concern", humanize(kpis['worried_work'], suffix="%", na_rep="n/a"), "Very worried", help="Very Worried response percentage in total")
+    col2.metric("Age Perception Gap", humanize(kpis['automation_age_gap'], na_rep="n/a"), "- Young vs Elderly", help="Not Worried distribution difference between young and aged groups")
+    col3.metric("Positive AI Sentiment", humanize(kpis['ai_impact_sentiment'], suffix="%", na_rep="n/a"), help=f"Percentage of positive sentiment on AI's societal impact")
+    col4.metric("Gender Sentiment Gap", humanize(kpis['gender_sentiment_gap'], suffix="%", na_rep="n/a"), help=f"Difference of positive sentiment on AI's societal impact between gender groups")
+    col5.metric("Safety Perception Gap",humanize(kpis['safety_gap'], suffix="%", na_rep="n/a"), "Rich vs Poor", help=f"Difference of Feel Safe response on autonomous cars between rich and poor groups")
+    if any(pd.isna(kpis[kpi]) for kpi in ("automation_age_gap", "gender_sentiment_gap", "safety_gap")):
+        for kpi, reasons in public_gaps().items():
+            st.caption(f"ℹ️ No data for {kpi.replace('_', ' ')}: " + "; ".join(reasons))
+    
+    matter_text = '''Public perception influences policy decisions, adoption rates, and the social license for AI development, making it crucial to understand diverse perspectives.'''
+    explain_text = '''**Age Divide:** Younger workers worry more about automation over time, while the 65+ group shows the least concern.   
+    **Trend:** From 2022 to 2024, the "Not Worried" category is shrinking across most age groups, implying growing anxiety about automation.'''
+    explain_text2 = '''**Optimism Gap:** Countries like South Korea and China show strong optimism about AI, while Turkey shows the highest skepticism.     
+    **Uncertainty:** Countries with higher "No Opinion" responses (Russia, Canada) may have less public discourse or education about AI technologies.          
+    **Regional Gap:** More economically developed regions (East Asia, Europe, Australia) show higher optimism than developing regions.     
+    **Negativity:** Overall perception of AI as "Mostly Harmful" decreased from 2019 to 2021.          
+    **Gender Gap:** Males consistently show more optimism about AI's societal impact than females across both years.'''
+    explain_text3 = '''**Safety Concerns:** Across all demographic groups, the majority (64-71%) do not feel safe with self-driving car technology.      
+    **Trend:** Trust in self-driving technology decreases with age. The younger 15-29 group and the richest 20% show the highest comfort levels, while only 22% of those 65+ feel safe.      
+    **Economic Disparity:** The richest 20% are significantly more likely to feel safe with autonomous vehicles than the poorest 20%.'''
+    col1, col2, col3, col4 = st.columns(4)
+    with col1: 
+        with st.popover("❓❓ Why This Matters"):
+            st.markdown(matter_text)
+    with col2:
+        with st.popover("🗂 Explain Work Chart"):
+            st.markdown(explain_text)
+    with col3:
+        with st.popover("🚀 Explain Impact Charts"):
+            st.markdown(explain_text2)
+    with col4:
+        with st.popover("🦺 Explain Safety Chart"):
+            st.markdown(explain_text3)
+    
+    st.subheader("👥 Public View Interactive Plots")
+    # Americans Opinion About Their Work Being Automated
+    show_chart(automation_survey_chart, data, ["df_automated_survey"], use_container_width=True)
+
+    # 'Views on AI's Societal Impact in Next 20 Years by Country' Stacked Bar Plot
+    show_chart(view_country_chart, data, ["df_view_country"], use_container_width=True)
+    
+    # 'Views on AI's Societal Impact in Next 20 Years by Region' Plot
+    show_chart(view_region_chart, data, ["df_view_continent21"], use_container_width=True)
+
+    # 'Male/Female Views on AI's Societal Impact' Sunburst Charts
+    show_chart(gender_view_chart, data, ["df_view_gender"], use_container_width=True)
+
+    # 'Global Views on Self-Driving Cars by Demographic Group (2021)' Plot
+    show_chart(self_driving_chart, data, ["df_view3"], use_container_width=True)
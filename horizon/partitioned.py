@@ -0,0 +1,123 @@
+"""Year-sorted parquet copies of the datasets and a read path with predicate pushdown.
+
+The build writes each dataset sorted by (year, entity) into
+data/build/partitioned, starting a new row group at every year boundary (and
+every ROW_GROUP_ROWS rows), so the min/max statistics in the footer describe
+tight year and entity ranges. read_window() checks those statistics and only
+decodes row groups that can contain matching rows; a query for one year costs
+the same however long the history grows.
+"""
+import glob
+import os
+import threading
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from horizon import telemetry
+from horizon.catalog import BUILD_DIR, CATALOG, build_frame, frame_key
+
+PARTITIONED_DIR = f"{BUILD_DIR}/partitioned"
+ROW_GROUP_ROWS = 65536
+# One writer per dataset: the warm-up and first sessions can ask for a missing copy at the same time
+_write_locks = {name: threading.Lock() for name in CATALOG}
+
+
+def partitioned_path(name):
+    return f"{PARTITIONED_DIR}/{name}-{frame_key(name)}.parquet"
+
+
+def write_sorted(df, path):
+    """Write a frame sorted by (year, entity) with a row group per year"""
+    keys = [col for col in ('year', 'entity') if col in df.columns]
+    if keys:
+        df = df.sort_values(keys, kind='stable', ignore_index=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Row group boundaries at every year change, then every ROW_GROUP_ROWS rows within a year
+    starts = np.flatnonzero(np.diff(df['year'].to_numpy())) + 1 if 'year' in df.columns else np.array([], dtype=int)
+    bounds = np.concatenate([[0], starts, [len(df)]])
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pq.ParquetWriter(tmp_path, table.schema, write_statistics=True) as writer:
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            writer.write_table(table.slice(start, stop - start), row_group_size=ROW_GROUP_ROWS)
+    os.replace(tmp_path, path)
+
+
+def write_partitioned(name):
+    """Write a dataset's year-sorted parquet file and drop files of older versions"""
+    path = partitioned_path(name)
+    os.makedirs(PARTITIONED_DIR, exist_ok=True)
+    write_sorted(build_frame(name), path)
+    for stale in glob.glob(f"{PARTITIONED_DIR}/{name}-*.parquet"):
+        if stale != path:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass  # another process removed it first
+    return path
+
+
+def build_partitioned():
+    for name in CATALOG:
+        write_partitioned(name)
+
+
+def _may_match(row_group, positions, years, entities):
+    """False only when the row group's statistics rule out every matching row"""
+    if years and 'year' in positions:
+        stats = row_group.column(positions['year']).statistics
+        if stats is not None and stats.has_min_max and (stats.max < years[0] or stats.min > years[1]):
+            return False
+    if entities and 'entity' in positions:
+        stats = row_group.column(positions['entity']).statistics
+        if stats is not None and stats.has_min_max and not any(stats.min <= e <= stats.max for e in entities):
+            return False
+    return True
+
+
+def _matching_row_groups(pf, years, entities):
+    positions = {pf.metadata.row_group(0).column(i).path_in_schema: i for i in range(pf.metadata.num_columns)} if pf.num_row_groups else {}
+    return [i for i in range(pf.num_row_groups) if _may_match(pf.metadata.row_group(i), positions, years, entities)]
+
+
+def read_file_window(path, years=None, entities=None, columns=None):
+    """Matching rows of a file written by write_sorted, decoding only row groups that can match"""
+    pf = pq.ParquetFile(path)
+    groups = _matching_row_groups(pf, years, entities)
+    wanted = None if columns is None else list(dict.fromkeys([*columns, *(['year'] if years else []), *(['entity'] if entities else [])]))
+    df = pf.read_row_groups(groups, columns=wanted).to_pandas()
+    mask = np.ones(len(df), dtype=bool)
+    if years:
+        mask &= df['year'].between(*years).to_numpy()
+    if entities:
+        mask &= df['entity'].isin(entities).to_numpy()
+    df = df[mask].reset_index(drop=True)
+    return df if columns is None else df[columns]
+
+
+def _ensure_partitioned(name):
+    path = partitioned_path(name)
+    with _write_locks[name]:
+        if not os.path.exists(path):
+            write_partitioned(name)
+    return path
+
+
+def read_window(name, years=None, entities=None, columns=None):
+    """Rows of a dataset within an inclusive (first, last) year range and/or entity list"""
+    path = _ensure_partitioned(name)
+    with telemetry.span(f"window:{name}"):
+        return read_file_window(path, years, entities, columns)
+
+
+def iter_window(name, years=None, columns=None):
+    """Rows of a dataset within a year range as Arrow tables, one matching row group at a time"""
+    pf = pq.ParquetFile(_ensure_partitioned(name))
+    wanted = None if columns is None else list(dict.fromkeys([*columns, *(['year'] if years else [])]))
+    for i in _matching_row_groups(pf, years, None):
+        table = pf.read_row_group(i, columns=wanted)
+        if years:
+            table = table.filter(pc.and_(pc.greater_equal(table['year'], years[0]), pc.less_equal(table['year'], years[1])))
+        yield table if columns is None else table.select(columns)
@@ -0,0 +1,67 @@
+"""Year-by-year playback of choropleth maps with frames that carry only z.
+
+Plotly Express animations (animation_frame=) give every frame a full copy of
+its traces: locations, hover names, customdata and the per-frame hover
+template, so the spec grows with years x countries x everything shown per
+country. Here the countries are laid out once on the base trace. Each year's
+frame restyles only that trace's z: the full array of that year's values,
+aligned to the base locations, so a frame costs one number per country. These
+are whole values, not changes from the previous year, and every frame goes
+to the browser up front in the one figure spec. The color range is fixed
+over all years, so colors compare across frames and no frame has to resend
+the color axis. The frames are built by the page's figure builder, so they
+are precomputed and shared through the figure cache like any other chart.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import plotly.graph_objects as go
+
+FRAME_MS = 700
+TRANSITION_MS = 300
+
+
+class YearFrames(NamedTuple):
+    locations: np.ndarray  # ISO-3 codes, the base trace's location order
+    names: np.ndarray  # display name per location
+    years: np.ndarray
+    values: np.ndarray  # years x locations, NaN where a country has no row that year
+
+
+def year_frames(df, value_col, location_col='iso3', name_col='entity'):
+    """Values per year aligned to one location order; rows without a location are dropped"""
+    df = df[df[location_col].notna()]
+    table = df.pivot_table(index='year', columns=location_col, values=value_col, aggfunc='sum', observed=True)
+    names = df.drop_duplicates(location_col).set_index(location_col)[name_col].astype(str)
+    locations = table.columns.astype(str).to_numpy()
+    return YearFrames(locations, names.reindex(locations).to_numpy(), table.index.to_numpy(), table.to_numpy(dtype=float))
+
+
+def _z(values):
+    """Frame values, as integers when they all are (shorter JSON); NaN becomes null"""
+    if np.isnan(values).any() or not np.array_equal(values, np.round(values)):
+        return [None if np.isnan(v) else float(v) for v in values]
+    return values.astype(np.int64)
+
+
+def animated_choropleth(frames, title, label, colorscale="Viridis_r", **layout):
+    """Choropleth starting at the latest year, with a slider and play button stepping through the years"""
+    zmax = np.nanmax(frames.values) if np.isfinite(frames.values).any() else 1
+    fig = go.Figure(go.Choropleth(locations=frames.locations, z=_z(frames.values[-1]), text=frames.names, locationmode="ISO-3",
+                                  colorscale=colorscale, zmin=0, zmax=zmax, marker_line_color="rgb(180, 180, 180)",
+                                  colorbar=dict(title=label), hovertemplate=f"%{{text}}<br>{label}: %{{z:,}}<extra></extra>"))
+    # Frames restyle trace 0 only, and only its z
+    fig.frames = [go.Frame(name=str(year), data=[go.Choropleth(z=_z(values))], traces=[0])
+                  for year, values in zip(frames.years, frames.values)]
+    play = dict(frame=dict(duration=FRAME_MS, redraw=True), transition=dict(duration=TRANSITION_MS), fromcurrent=True, mode="immediate")
+    pause = dict(frame=dict(duration=0, redraw=False), transition=dict(duration=0), mode="immediate")
+    fig.update_layout(
+        title=title, geo=dict(showcoastlines=True, showframe=True), margin=dict(l=5, r=5, t=35, b=5),
+        updatemenus=[dict(type="buttons", direction="left", x=0.1, y=0, xanchor="right", yanchor="top", pad=dict(r=10, t=30),
+                          buttons=[dict(label="▶", method="animate", args=[None, play]),
+                                   dict(label="⏸", method="animate", args=[[None], pause])])],
+        sliders=[dict(active=len(frames.years) - 1, x=0.1, y=0, len=0.9, pad=dict(t=20), currentvalue=dict(prefix="Year: "),
+                      steps=[dict(label=str(year), method="animate", args=[[str(year)], {**pause, "frame": dict(duration=0, redraw=True)}])
+                             for year in frames.years])],
+        **layout)
+    return fig
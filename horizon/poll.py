@@ -0,0 +1,140 @@
+"""Append-only storage and live counts for the sidebar opinion poll.
+
+Submissions go onto an in-memory queue and return immediately; a background
+thread appends them to a JSON-lines file in batches, holding an advisory file
+lock so several app processes can share one file. Counts are maintained
+incrementally by reading only the bytes appended since the last read, so the
+results chart never rescans the whole vote history. A corrupt line (a crash
+mid-write, a manual edit) is logged and skipped, and a file that shrank
+(truncated or rotated) is counted again from the start.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: rely on O_APPEND without cross-process locking
+    fcntl = None
+
+import pandas as pd
+import streamlit as st
+
+from horizon.catalog import DATA_DIR
+
+POLL_PATH = os.environ.get("HORIZON_POLL_PATH", f"{DATA_DIR}/poll/votes.jsonl")
+
+logger = logging.getLogger(__name__)
+
+
+class PollStore:
+    def __init__(self, path, flush_interval=0.5, max_batch=5000):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._flush_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._counts = Counter()
+        self._offset = 0
+        self._partial = False  # a failed write left a line without its newline
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        except OSError:
+            logger.exception("Could not create poll directory for %s", path)
+        threading.Thread(target=self._run, name="poll-flusher", daemon=True).start()
+        atexit.register(self.flush)
+
+    def submit(self, opinion, age_group):
+        """Queue one vote; never blocks on disk"""
+        record = {"ts": datetime.now(timezone.utc).isoformat(timespec="seconds"), "opinion": opinion, "age_group": age_group}
+        self._queue.put(json.dumps(record, ensure_ascii=False))
+
+    def flush(self):
+        """Write every queued vote to disk"""
+        with self._flush_lock:
+            lines = []
+            while len(lines) < self.max_batch:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not lines:
+                return 0
+            lead = b"\n" if self._partial else b""
+            payload = lead + ("\n".join(lines) + "\n").encode("utf-8")
+            written = 0
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    if fcntl:
+                        fcntl.flock(fd, fcntl.LOCK_EX)
+                    # os.write may write less than asked (full disk, signal); a line cut off part-way
+                    # is ended by the next write, so it is skipped as one corrupt line, not glued to the next
+                    while written < len(payload):
+                        written += os.write(fd, payload[written:])
+                        self._partial = payload[written - 1:written] != b"\n"
+                finally:
+                    os.close(fd)  # also releases the lock
+            except OSError:
+                done = payload[len(lead):written].count(b"\n")  # complete lines on disk, the rest is retried
+                for line in lines[done:]:
+                    self._queue.put(line)
+                raise
+            return len(lines)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                while self.flush() == self.max_batch:
+                    pass
+            except OSError:
+                logger.exception("Could not write poll votes to %s, retrying", self.path)
+
+    def counts(self):
+        """Votes per (opinion, age_group), including other processes' writes"""
+        with self._read_lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if size < self._offset:
+                logger.warning("Poll file %s shrank (truncated or rotated), recounting", self.path)
+                self._counts, self._offset = Counter(), 0
+            if size > self._offset:
+                with open(self.path, "rb") as f:
+                    f.seek(self._offset)
+                    chunk = f.read(size - self._offset)
+                # Only consume complete lines; a concurrent writer may be mid-append
+                complete = chunk[:chunk.rfind(b"\n") + 1]
+                for line in complete.splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        key = (record["opinion"], record["age_group"])
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning("Skipping corrupt poll line in %s: %r", self.path, line[:200])
+                        continue
+                    self._counts[key] += 1
+                self._offset += len(complete)
+            return Counter(self._counts)
+
+
+@st.cache_resource
+def poll_store():
+    """Process-wide poll store shared by every session"""
+    return PollStore(POLL_PATH)
+
+
+def results_table(counts):
+    """Vote counts as a long table for the sidebar results chart"""
+    return pd.DataFrame([(opinion, age_group, n) for (opinion, age_group), n in counts.items()],
+                        columns=["Opinion", "Age group", "Votes"])
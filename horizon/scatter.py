@@ -0,0 +1,71 @@
+"""Bounded-size rendering for the large training-system scatter plots.
+
+Above WEBGL_POINTS points a scatter switches to WebGL (Scattergl). Above
+MAX_POINTS it is decimated per color group on an (x, log y) grid, keeping
+the highest and lowest point of every occupied cell, so the cloud's outline
+and its extremes survive while the payload stays bounded. Per-point text
+labels are limited to the MAX_LABELS points farthest from the overall
+log-linear trend.
+"""
+import numpy as np
+import pandas as pd
+
+WEBGL_POINTS = 2000
+MAX_POINTS = 20000
+MAX_LABELS = 60
+
+
+def _axis(values, log):
+    values = values.astype('int64') if np.issubdtype(values.dtype, np.datetime64) else values.astype(float)
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.log10(values)
+    return values
+
+
+def _bins(values, n):
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.zeros(len(values), dtype=np.int64)
+    lo, hi = values[finite].min(), values[finite].max()
+    scaled = (values - lo) / (hi - lo) * n if hi > lo else np.zeros(len(values))
+    # Non-finite values (zero or negative on a log axis) share an extra bin
+    return np.where(finite, np.clip(scaled, 0, n - 1), n).astype(np.int64)
+
+
+def decimate(df, x, y, group, log_x=False, max_points=MAX_POINTS):
+    """At most about max_points rows: the highest and lowest point per group and grid cell"""
+    if len(df) <= max_points:
+        return df
+    codes, uniques = pd.factorize(df[group])
+    # Each cell keeps up to two points, so size the grid for max_points / 2 cells
+    side = max(int(np.sqrt(max_points / 2 / max(len(uniques), 1))), 1)
+    yv = _axis(df[y].to_numpy(), True)
+    cell = (codes.astype(np.int64) * (side + 1) + _bins(_axis(df[x].to_numpy(), log_x), side)) * (side + 1) + _bins(yv, side)
+    order = np.lexsort((np.nan_to_num(yv, nan=-np.inf), cell))
+    sorted_cell = cell[order]
+    first = np.r_[True, sorted_cell[1:] != sorted_cell[:-1]]
+    last = np.r_[sorted_cell[1:] != sorted_cell[:-1], True]
+    return df.iloc[np.unique(np.concatenate([order[first], order[last]]))]
+
+
+def display_points(df, x, y, group, log_x=False):
+    """Rows to plot and the px.scatter render_mode for them"""
+    df = decimate(df, x, y, group, log_x)
+    return df, "webgl" if len(df) > WEBGL_POINTS else "auto"
+
+
+def outlier_text(df, x, y, label='entity', log_x=False, top_n=MAX_LABELS):
+    """px.scatter text kwargs: every label for small frames, else only the top_n trend outliers"""
+    if len(df) <= top_n:
+        return {"text": label}
+    xv, yv = _axis(df[x].to_numpy(), log_x), _axis(df[y].to_numpy(), True)
+    finite = np.isfinite(xv) & np.isfinite(yv)
+    residual = np.zeros(len(df))
+    if finite.sum() > 1:
+        xs = xv[finite] - xv[finite].mean()  # centre x; nanosecond timestamps are ~1e18
+        slope, intercept = np.polyfit(xs, yv[finite], 1)
+        residual[finite] = np.abs(yv[finite] - (slope * xs + intercept))
+    keep = np.zeros(len(df), dtype=bool)
+    keep[np.argpartition(-residual, top_n - 1)[:top_n]] = True
+    return {"text": np.where(keep, df[label].astype(str).to_numpy(), ""), "hover_name": label}
@@ -0,0 +1,273 @@
+"""Entity search across all datasets, and the per-entity profile view.
+
+The index maps every entity name, domain and organization type in the
+catalog to the datasets and columns it appears in. It is built once per
+fingerprint of the catalog files and written to data/build/search_index.json
+(python -m horizon.build), then held in memory per process. Names are split
+into normalized tokens (case, accents and punctuation ignored) with an
+inverted index from token to names. A query token matches a name's token
+exactly, as a prefix (a bisect range of the sorted token list) or, when it has
+no prefix match, fuzzily: candidate tokens come from a trigram index and are
+scored with difflib. Every query token has to match, so a keystroke costs a
+few dictionary and bisect lookups instead of scanning the frames.
+
+Results link to ?entity=<name>, which replaces the section page with the
+entity's profile: its rows in every dataset it appears in.
+"""
+import bisect
+import difflib
+import json
+import os
+import re
+import unicodedata
+from collections import defaultdict
+from functools import partial
+from typing import NamedTuple
+
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import BUILD_DIR, CATALOG, SECTIONS, fingerprint, load_dataset
+
+INDEX_VERSION = 1
+INDEX_PATH = f"{BUILD_DIR}/search_index.json"
+FIELDS = ["entity", "domain", "organization_categorization"]  # searchable columns, where a dataset has them
+FUZZY_CUTOFF = 0.75  # difflib ratio a token needs to count as a fuzzy match
+FUZZY_CANDIDATES = 50  # tokens sharing the most trigrams with a query token that are scored
+MAX_RESULTS = 10
+PROFILE_ROWS = 200  # rows shown per dataset on a profile
+
+FIELD_LABELS = {"entity": "Entity", "domain": "Domain", "organization_categorization": "Organization type"}
+
+# Dataset -> what its rows are, for profile headings
+LABELS = {
+    "df_hardware": "Training cost of AI systems",
+    "df_computation": "Training computation of AI systems",
+    "df_datapoint": "Training datapoints of AI systems",
+    "df_parameter": "Parameters of AI systems",
+    "df_cost_hardware": "Training computation and parameters of AI systems",
+    "df_cumulative2": "Cumulative AI systems by domain",
+    "df_cumulative": "Cumulative large-scale AI systems by country",
+    "df_patent_agg": "AI patent applications by country",
+    "df_bill": "AI-related bills passed into law by country",
+    "df_affiliation": "Affiliation of research teams building AI systems",
+    "df_patent_world": "Worldwide AI patents by status",
+    "df_patent_world2": "Worldwide granted AI patents by industry",
+    "df_investment": "Private investment in AI by location",
+    "df_investment1": "Private investment in AI by domain",
+    "df_investment2": "Private investment in AI by technology",
+    "df_investment3": "Private investment in generative AI",
+    "df_invest_general": "Private investment in AI by sector",
+    "df_automated_survey": "Worry about work automation by age group",
+    "df_view_country": "Views on AI's societal impact by country",
+    "df_view_continent21": "Views on AI's societal impact by region",
+    "df_view_gender": "Views on AI's societal impact by gender",
+    "df_view3": "Views on self-driving cars by demographic group",
+}
+
+
+class Posting(NamedTuple):
+    dataset: str
+    field: str
+    rows: int
+
+
+class Hit(NamedTuple):
+    name: str
+    score: float
+    postings: tuple
+
+
+class SearchIndex(NamedTuple):
+    names: tuple  # display names; a name's id is its position
+    ids: dict  # name -> id
+    postings: tuple  # per name id, the Postings of every dataset and column it appears in
+    tokens: list  # sorted distinct tokens of all names
+    token_names: dict  # token -> name ids containing it
+    trigrams: dict  # trigram -> positions in tokens
+
+
+def tokenize(text):
+    """Lowercase ASCII words of a name or query"""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode().lower()
+    return re.findall(r"[a-z0-9]+", text)
+
+
+def _trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def collect(frames):
+    """{name: [[dataset, field, rows], ...]} over the FIELDS of every frame"""
+    entries = defaultdict(list)
+    for dataset, df in frames.items():
+        for field in FIELDS:
+            if field not in df.columns:
+                continue
+            counts = df[field].astype(str).value_counts(sort=False)
+            for name, rows in counts[counts > 0].items():
+                entries[name].append([dataset, field, int(rows)])
+    return dict(entries)
+
+
+def build_index(entries):
+    """In-memory index of collected entries"""
+    names = tuple(sorted(entries, key=str.lower))
+    token_names = defaultdict(set)
+    for i, name in enumerate(names):
+        for token in tokenize(name):
+            token_names[token].add(i)
+    tokens = sorted(token_names)
+    trigrams = defaultdict(list)
+    for position, token in enumerate(tokens):
+        for trigram in _trigrams(token):
+            trigrams[trigram].append(position)
+    postings = tuple(tuple(Posting(*p) for p in entries[name]) for name in names)
+    return SearchIndex(names, {name: i for i, name in enumerate(names)}, postings, tokens,
+                       {token: tuple(sorted(ids)) for token, ids in token_names.items()}, dict(trigrams))
+
+
+def read_entries(data_fingerprint, path=INDEX_PATH):
+    """Entries of the index file, or None when it is missing or was built from other data"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if stored.get("version") != INDEX_VERSION or stored.get("fingerprint") != data_fingerprint:
+        return None
+    return stored["entries"]
+
+
+def write_entries(entries, data_fingerprint, path=INDEX_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, "fingerprint": data_fingerprint, "entries": entries}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_index_file(path=INDEX_PATH):
+    """Collect every dataset's names and write the index file"""
+    entries = collect({name: load_dataset(name) for name in CATALOG})
+    write_entries(entries, fingerprint(CATALOG), path)
+    return entries
+
+
+@st.cache_resource(show_spinner=False)
+def _index(data_fingerprint):
+    telemetry.mark_miss()
+    with telemetry.span("search_index"):
+        entries = read_entries(data_fingerprint)
+        if entries is None:
+            entries = collect({name: load_dataset(name) for name in CATALOG})
+            try:
+                write_entries(entries, data_fingerprint)
+            except OSError:
+                pass  # read-only deployments keep the index in memory
+        return build_index(entries)
+
+
+def get_index():
+    """Shared search index, rebuilt when any catalog file changes"""
+    with telemetry.cache_lookup("search_index"):
+        return _index(fingerprint(CATALOG))
+
+
+def _token_matches(index, token):
+    """{name id: score} of names with a token equal to (1.0), starting with (0.8) or close to (< 0.7) the query token"""
+    scores = {}
+    lo = bisect.bisect_left(index.tokens, token)
+    hi = bisect.bisect_right(index.tokens, token + "\uffff")
+    for candidate in index.tokens[lo:hi]:
+        score = 1.0 if candidate == token else 0.8
+        for i in index.token_names[candidate]:
+            scores[i] = max(scores.get(i, 0), score)
+    if scores or len(token) < 3:
+        return scores
+    shared = defaultdict(int)
+    for trigram in _trigrams(token):
+        for position in index.trigrams.get(trigram, ()):
+            shared[position] += 1
+    for position in sorted(shared, key=shared.get, reverse=True)[:FUZZY_CANDIDATES]:
+        candidate = index.tokens[position]
+        ratio = difflib.SequenceMatcher(None, token, candidate).ratio()
+        if ratio >= FUZZY_CUTOFF:
+            for i in index.token_names[candidate]:
+                scores[i] = max(scores.get(i, 0), 0.7 * ratio)
+    return scores
+
+
+def search(query, index=None, limit=MAX_RESULTS):
+    """Best matching names for a query; every query token has to match a token of the name"""
+    index = get_index() if index is None else index
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+    scores = None
+    for token in tokens:
+        matches = _token_matches(index, token)
+        scores = matches if scores is None else {i: s + matches[i] for i, s in scores.items() if i in matches}
+        if not scores:
+            return []
+    whole = " ".join(tokens)
+    ranked = sorted(scores, key=lambda i: (-(scores[i] / len(tokens) + (" ".join(tokenize(index.names[i])) == whole)),
+                                           -len(index.postings[i]), len(index.names[i]), index.names[i]))
+    return [Hit(index.names[i], scores[i] / len(tokens), index.postings[i]) for i in ranked[:limit]]
+
+
+def profile_name():
+    """Entity whose profile is open (the ?entity= query parameter), or None"""
+    return st.query_params.get("entity")
+
+
+def open_profile(name):
+    st.query_params["entity"] = name
+
+
+def close_profile():
+    st.query_params.pop("entity", None)
+
+
+def _describe(postings):
+    datasets = len({p.dataset for p in postings})
+    return f"{datasets} dataset{'s' if datasets != 1 else ''}, {sum(p.rows for p in postings):,} rows"
+
+
+def render_search():
+    """Sidebar search box with result buttons that open a profile"""
+    query = st.sidebar.text_input("🔎 Search systems, countries, domains…", key="entity_search", placeholder="e.g. GPT-4, Germany, Vision")
+    if not query:
+        return
+    with telemetry.span("search"):
+        hits = search(query)
+    if not hits:
+        st.sidebar.caption("No matches.")
+    for hit in hits:
+        st.sidebar.button(hit.name, key=f"search:{hit.name}", help=_describe(hit.postings), on_click=partial(open_profile, hit.name),
+                          use_container_width=True)
+
+
+def render_profile(name):
+    """Everything the datasets hold about one entity, domain or organization type"""
+    index = get_index()
+    st.button("← Back to sections", on_click=close_profile)
+    st.subheader(f"🔎 {name}")
+    if name not in index.ids:
+        st.warning(f"Nothing is known about {name!r}. Try the search box in the sidebar.")
+        return
+    postings = index.postings[index.ids[name]]
+    st.caption(f"Appears in {_describe(postings)}, as " + ", ".join(dict.fromkeys(FIELD_LABELS[p.field].lower() for p in postings)))
+    for posting in sorted(postings, key=lambda p: list(CATALOG).index(p.dataset)):
+        df = load_dataset(posting.dataset)
+        rows = df[df[posting.field].astype(str) == name].drop(columns=['iso3'], errors='ignore')
+        if 'day' in rows.columns:
+            rows = rows.sort_values('day')
+        elif 'year' in rows.columns:
+            rows = rows.sort_values('year')
+        sections = [section for section, names in SECTIONS.items() if posting.dataset in names]
+        st.markdown(f"**{LABELS[posting.dataset]}** · {FIELD_LABELS[posting.field]} · {posting.rows:,} row{'s' if posting.rows != 1 else ''}")
+        if sections:
+            st.caption("Shown in " + ", ".join(sections))
+        st.dataframe(rows.head(PROFILE_ROWS), hide_index=True, use_container_width=True)
@@ -0,0 +1,227 @@
+"""Static export of the read-only sections: python -m horizon.static_site [--out DIR] [--workers N] [--app-url URL]
+
+Every section is run through the real app script with Streamlit's AppTest,
+so each exported page has the same KPIs, explanation text and figures as a
+live session. The rendered element tree is then written out as plain HTML:
+columns become flex rows, popovers and expanders become <details> blocks,
+dataframes become tables, and plotly.js draws each figure from the spec
+st.plotly_chart would have sent. Elements without a static form (widgets)
+are left out and listed in the export log. Sections render in parallel
+worker processes. The pages and a shared plotly.min.js can be served from
+any file server. Sections that need widgets (the Comparison Tool) and the
+poll link to --app-url instead.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from horizon.catalog import BUILD_DIR, SECTIONS
+from horizon.pages import APP_PATH, PAGES
+
+SITE_DIR = f"{BUILD_DIR}/site"
+INTERACTIVE_SECTIONS = {"🔍 Comparison Tool"}
+STATIC_SECTIONS = [section for section in SECTIONS if section not in INTERACTIVE_SECTIONS]
+# Streamlit's plotly theme uses placeholder colors that only its frontend resolves
+STATIC_TEMPLATE = "plotly_white"
+
+CSS = """
+body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; color: rgb(49, 51, 63); display: flex; }
+nav { width: 15rem; min-height: 100vh; padding: 2rem 1rem; background: rgb(240, 242, 246); box-sizing: border-box; flex-shrink: 0; }
+nav a { display: block; padding: 0.3rem 0; color: inherit; text-decoration: none; }
+nav a.current { font-weight: 600; }
+main { flex: 1; max-width: 80rem; padding: 2rem 3rem; min-width: 0; }
+.row { display: flex; flex-wrap: wrap; gap: 1rem; }
+.col { min-width: 0; }
+.metric .label { font-size: 0.9rem; }
+.metric .value { font-size: 2.2rem; line-height: 1.2; }
+.metric .delta { display: inline-block; font-size: 0.9rem; padding: 0 0.4rem; border-radius: 0.5rem; }
+.delta.green { color: rgb(9, 171, 59); background: rgba(9, 171, 59, 0.1); }
+.delta.red { color: rgb(255, 43, 43); background: rgba(255, 43, 43, 0.1); }
+.delta.gray { color: rgb(128, 132, 149); background: rgba(128, 132, 149, 0.1); }
+.alert { padding: 1rem; border-radius: 0.5rem; background: rgba(28, 131, 225, 0.1); color: rgb(0, 66, 128); }
+.alert.success { background: rgba(33, 195, 84, 0.1); color: rgb(23, 114, 51); }
+.alert.warning { background: rgba(255, 189, 69, 0.2); color: rgb(146, 108, 5); }
+.alert.error { background: rgba(255, 43, 43, 0.09); color: rgb(125, 53, 59); }
+.caption { font-size: 0.85rem; color: rgb(128, 132, 149); }
+table.dataframe { border-collapse: collapse; font-size: 0.9rem; margin: 0.5rem 0; }
+table.dataframe th, table.dataframe td { padding: 0.25rem 0.6rem; border-bottom: 1px solid rgba(49, 51, 63, 0.1); text-align: left; }
+table.dataframe th { font-weight: 600; }
+details { border: 1px solid rgba(49, 51, 63, 0.2); border-radius: 0.5rem; padding: 0.5rem 1rem; margin: 0.5rem 0; }
+summary { cursor: pointer; }
+.rainbow { background: linear-gradient(to right, #f00, #f80, #fc0, #0a0, #08f, #80f); -webkit-background-clip: text; background-clip: text; color: transparent; }
+"""
+
+
+def _directive(match):
+    color, text = match.group(1), match.group(2)
+    if color == "rainbow":
+        return f'<span class="rainbow">{text}</span>'
+    if color.endswith("-background"):
+        return f'<span style="background: {color[:-len("-background")]}; background: color-mix(in srgb, {color[:-len("-background")]} 20%, transparent)">{text}</span>'
+    return f'<span style="color: {color}">{text}</span>'
+
+
+def markdown_html(text):
+    """HTML for the Markdown subset the pages use: paragraphs, hard line breaks, rules, bold, italics, links and :color[...] directives"""
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = [line.strip() for line in block.splitlines()]
+        if lines == ["---"]:
+            paragraphs.append("<hr>")
+            continue
+        # Two trailing spaces end a line with a hard break
+        body = "".join(line + ("<br>" if raw.endswith("  ") else " ") for line, raw in zip(lines, block.splitlines()))
+        body = html.escape(body, quote=False).replace("&lt;br&gt;", "<br>")
+        body = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', body)
+        body = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", body)
+        body = re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", r"<em>\1</em>", body)
+        body = re.sub(r":([a-z]+(?:-background)?)\[([^\]]*)\]", _directive, body)
+        paragraphs.append(f"<p>{body.strip()}</p>")
+    return "\n".join(paragraphs)
+
+
+def figure_html(spec, chart_id):
+    """A div and the script drawing a st.plotly_chart spec into it at container width"""
+    import plotly.io as pio
+    figure = json.loads(spec)
+    layout = figure.get("layout", {})
+    layout["template"] = pio.templates[STATIC_TEMPLATE].to_plotly_json()
+    layout.pop("width", None)  # every chart is shown at container width
+    payload = json.dumps(figure, separators=(",", ":")).replace("</", "<\\/")
+    return (f'<div id="{chart_id}" class="chart"></div>\n'
+            f'<script>(function(f) {{ Plotly.newPlot("{chart_id}", f.data, f.layout, {{responsive: true}}); }})({payload});</script>')
+
+
+def dataframe_html(node):
+    """A st.dataframe as a plain table, with its index unless the page hid it"""
+    hidden = json.loads(node.proto.columns or "{}").get("_index", {}).get("hidden", False)
+    return node.value.to_html(index=not hidden, border=0, na_rep="")  # <table class="dataframe">, cells escaped
+
+
+def element_html(node, ids, skipped):
+    """HTML for an AppTest element or block and everything under it; element types left out are counted in skipped"""
+    kind = getattr(node, "type", None)
+    children = "\n".join(element_html(child, ids, skipped) for child in getattr(node, "children", {}).values())
+    if kind in ("header", "subheader", "title"):
+        return f"<{node.proto.tag}>{markdown_html(node.proto.body)[3:-4]}</{node.proto.tag}>"
+    if kind == "markdown":
+        return markdown_html(node.proto.body)
+    if kind == "caption":
+        return f'<div class="caption">{markdown_html(node.proto.body)}</div>'
+    if kind in ("info", "success", "warning", "error"):
+        return f'<div class="alert {kind}">{markdown_html(node.proto.body)}</div>'
+    if kind == "metric":
+        from streamlit.proto.Metric_pb2 import Metric
+        proto = node.proto
+        delta = ""
+        if proto.delta:
+            arrow = {"UP": "↑ ", "DOWN": "↓ "}.get(Metric.MetricDirection.Name(proto.direction), "")
+            delta = f'<div class="delta {Metric.MetricColor.Name(proto.color).lower()}">{arrow}{html.escape(proto.delta)}</div>'
+        return (f'<div class="metric" title="{html.escape(proto.help)}"><div class="label">{markdown_html(proto.label)[3:-4]}</div>'
+                f'<div class="value">{html.escape(proto.body)}</div>{delta}</div>')
+    if kind == "plotly_chart":
+        ids.append(f"chart-{len(ids)}")
+        return figure_html(node.proto.spec, ids[-1])
+    if kind in ("dataframe", "arrow_data_frame"):
+        return dataframe_html(node)
+    if kind == "flex_container":
+        return f'<div class="row">\n{children}\n</div>'
+    if kind == "column":
+        return f'<div class="col" style="flex: {node.proto.weight:.4f} 1 0">\n{children}\n</div>'
+    if kind == "expander":
+        return f'<details{" open" if node.proto.expanded else ""}><summary>{markdown_html(node.proto.label)[3:-4]}</summary>\n{children}\n</details>'
+    if kind == "popover":
+        return f"<details><summary>{markdown_html(node.proto.popover.label)[3:-4]}</summary>\n{children}\n</details>"
+    if not getattr(node, "children", None):
+        skipped[kind] += 1  # widgets and elements without a static form are left out
+    return children
+
+
+def render_section(section):
+    """Main-area HTML of one section, rendered by the app script itself"""
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+    set_log_level("error")
+    os.environ["HORIZON_WARMUP"] = "0"  # each worker renders one section, warming all of them is wasted work
+    start = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+    if at.sidebar.radio[0].value != section:
+        at.sidebar.radio[0].set_value(section).run()
+    if at.exception:
+        raise RuntimeError(f"{section}: {at.exception[0].message}")
+    skipped = Counter()
+    return element_html(at.main, [], skipped), time.perf_counter() - start, dict(skipped)
+
+
+def page_file(section):
+    return "index.html" if section == STATIC_SECTIONS[0] else f"{PAGES[section]}.html"
+
+
+def page_html(section, body, app_url=None):
+    links = [f'<a href="{page_file(s)}"{" class=current" if s == section else ""}>{html.escape(s)}</a>' for s in STATIC_SECTIONS]
+    if app_url:
+        links += [f'<a href="{html.escape(app_url)}">{html.escape(s)} ↗</a>' for s in INTERACTIVE_SECTIONS]
+        links.append(f'<a href="{html.escape(app_url)}">🗳️ Share your AI opinion ↗</a>')
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(section)} · AI Horizon Scanner App</title>
+<script src="plotly.min.js"></script>
+<style>{CSS}</style>
+</head>
+<body>
+<nav>
+<h3>Navigation</h3>
+{chr(10).join(links)}
+</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def _write(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def build_site(out=SITE_DIR, workers=None, app_url=None):
+    """Render every static section in parallel and write the pages and plotly.js to out"""
+    from plotly.offline import get_plotlyjs
+    os.makedirs(out, exist_ok=True)
+    _write(f"{out}/plotly.min.js", get_plotlyjs())
+    with ProcessPoolExecutor(max_workers=workers or min(len(STATIC_SECTIONS), os.cpu_count() or 1)) as pool:
+        for section, (body, elapsed, skipped) in zip(STATIC_SECTIONS, pool.map(render_section, STATIC_SECTIONS)):
+            _write(f"{out}/{page_file(section)}", page_html(section, body, app_url))
+            left_out = f" (left out: {', '.join(f'{n} {kind}' for kind, n in sorted(skipped.items()))})" if skipped else ""
+            print(f"{page_file(section)}: {elapsed:.2f}s{left_out}")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=SITE_DIR, help="output directory")
+    parser.add_argument("--workers", type=int, default=None, help="parallel section renders (default: one per section, up to the CPU count)")
+    parser.add_argument("--app-url", default=None, help="live app URL linked for the interactive sections and the poll")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    build_site(args.out, args.workers, args.app_url)
+    print(f"site: {time.perf_counter() - start:.2f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    # AppTest runs the app script as __main__ inside the workers, so hand them
+    # functions of the importable module rather than of this script
+    from horizon import static_site
+    static_site.main()
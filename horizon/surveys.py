@@ -0,0 +1,105 @@
+"""Indexed survey tables behind the Public View.
+
+Each survey dataset is indexed once per file fingerprint into dictionaries
+keyed by (entity, answer, year), where the answer is the opinion or view and
+year is None for single-wave surveys, so KPI lookups are O(1) dictionary hits
+instead of boolean-mask scans over the frame. A key without a row gives NaN
+instead of an IndexError; missing() says which part of the key is unknown,
+for the note the Public View shows under a KPI it cannot compute.
+"""
+from collections import defaultdict
+from typing import NamedTuple
+
+import numpy as np
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import fingerprint, load_dataset
+
+
+class Survey(NamedTuple):
+    answer_col: str  # "opinion" or "view"
+    value_col: str   # respondent count or percent
+
+
+SURVEYS = {
+    "df_automated_survey": Survey("opinion", "opinion_count"),
+    "df_view_country": Survey("opinion", "opinion_percent"),
+    "df_view_continent21": Survey("opinion", "opinion_percent"),
+    "df_view_gender": Survey("opinion", "opinion_percent"),
+    "df_view3": Survey("view", "view_percent"),
+}
+
+
+class SurveyIndex(NamedTuple):
+    name: str
+    entities: tuple
+    answers: tuple
+    years: tuple  # survey waves, empty for single-wave surveys
+    values: dict  # (entity, answer, year) -> value
+    answer_totals: dict  # answer -> value summed over entities and years
+    total: float
+
+
+def build_index(name, df):
+    """Dictionary index of a survey frame; duplicate keys are summed"""
+    survey = SURVEYS[name]
+    entities = df['entity'].to_numpy().tolist()
+    answers = df[survey.answer_col].to_numpy().tolist()
+    years = df['year'].to_numpy().tolist() if 'year' in df.columns else [None] * len(df)
+    values, answer_totals = defaultdict(float), defaultdict(float)
+    for entity, answer, year, value in zip(entities, answers, years, df[survey.value_col].to_numpy(dtype=float).tolist()):
+        values[(entity, answer, year)] += value
+        answer_totals[answer] += value
+    return SurveyIndex(name, tuple(dict.fromkeys(entities)), tuple(dict.fromkeys(answers)), tuple(sorted(set(years) - {None})),
+                       dict(values), dict(answer_totals), sum(answer_totals.values()))
+
+
+@st.cache_resource(show_spinner=False)
+def _index(name, data_fingerprint):
+    telemetry.mark_miss()
+    with telemetry.span(f"survey_index:{name}"):
+        return build_index(name, load_dataset(name))
+
+
+def get_index(name):
+    """Shared index of a survey dataset, rebuilt when its file changes"""
+    with telemetry.cache_lookup("survey_index"):
+        return _index(name, fingerprint([name]))
+
+
+def _key(index, entity, answer, year):
+    if index.years and year is None:
+        raise ValueError(f"{index.name} has survey waves {list(index.years)}: pass year=")
+    if not index.years and year is not None:
+        raise ValueError(f"{index.name} is a single-wave survey: leave year=None")
+    return (entity, answer, year)
+
+
+def value(index, entity, answer, year=None):
+    """Value of one answer for one entity (and wave); NaN when the survey has no such row"""
+    return index.values.get(_key(index, entity, answer, year), np.nan)
+
+
+def wave_mean(index, entity, answer):
+    """Mean value across the survey waves the entity answered; NaN when it never did"""
+    waves = [index.values[key] for key in ((entity, answer, year) for year in index.years or (None,)) if key in index.values]
+    return sum(waves) / len(waves) if waves else np.nan
+
+
+def answer_share(index, answer):
+    """Percent of all values, over every entity and wave, that went to this answer"""
+    return index.answer_totals[answer] / index.total * 100 if answer in index.answer_totals and index.total else np.nan
+
+
+def missing(index, entity, answer, year=None):
+    """Why a key has no value, or None when it has one"""
+    if (entity, answer, year) in index.values:
+        return None
+    if entity not in index.entities:
+        return f"{index.name} has no entity {entity!r}; known: {', '.join(map(str, index.entities))}"
+    if answer not in index.answers:
+        return f"{index.name} has no answer {answer!r}; known: {', '.join(map(str, index.answers))}"
+    if year is not None and year not in index.years:
+        return f"{index.name} has no {year} wave; waves: {', '.join(map(str, index.years))}"
+    return f"{index.name} has no row for {entity!r} answering {answer!r}" + (f" in {year}" if year is not None else "")
@@ -0,0 +1,205 @@
+"""Hot-path timing spans, cache hit/miss counters and chart payload sizes.
+
+Spans and counters are process-wide and cheap enough to leave on. They are
+shown in an opt-in debug panel (?debug=1 or HORIZON_DEBUG=1) and exported in
+Prometheus text format to HORIZON_METRICS_FILE after every rerun and/or on
+http://<host>:HORIZON_METRICS_PORT/metrics. Components that need time to
+start (the cache warm-up) report readiness, served on /ready of that port.
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import streamlit as st
+
+_lock = threading.Lock()
+_spans = defaultdict(lambda: [0, 0.0, 0.0, 0.0])  # name -> [count, total_s, max_s, last_s]
+_cache_counts = defaultdict(int)  # (cache, "hit" | "miss") -> count
+_payloads = {}  # chart -> serialized bytes of its last st.plotly_chart call
+_readiness = {}  # component -> (ready, detail)
+_local = threading.local()
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block under the given span name"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            stats = _spans[name]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] = elapsed
+
+
+def count(cache, result):
+    with _lock:
+        _cache_counts[(cache, result)] += 1
+
+
+@contextmanager
+def cache_lookup(cache):
+    """Count the enclosed cached call as a hit unless mark_miss() runs inside it"""
+    stack = _local.__dict__.setdefault("misses", [])
+    stack.append(False)
+    try:
+        yield
+    finally:
+        count(cache, "miss" if stack.pop() else "hit")
+
+
+def mark_miss():
+    """Call from the body of a cached function: it only runs on a miss"""
+    stack = getattr(_local, "misses", None)
+    if stack:
+        stack[-1] = True
+
+
+def record_payload(chart, nbytes):
+    with _lock:
+        _payloads[chart] = nbytes
+
+
+def set_ready(component, ready, detail=""):
+    """Report whether a component (e.g. the cache warm-up) is ready to serve traffic"""
+    with _lock:
+        _readiness[component] = (ready, detail)
+
+
+def readiness():
+    """(all components ready, {component: (ready, detail)})"""
+    with _lock:
+        components = dict(_readiness)
+    return all(ready for ready, _ in components.values()), components
+
+
+def span_table():
+    with _lock:
+        rows = [(name, n, total / n * 1e3, peak * 1e3, last * 1e3) for name, (n, total, peak, last) in _spans.items()]
+    return pd.DataFrame(rows, columns=["span", "count", "avg_ms", "max_ms", "last_ms"]).sort_values("span", ignore_index=True)
+
+
+def cache_table():
+    with _lock:
+        counts = dict(_cache_counts)
+    caches = sorted({cache for cache, _ in counts})
+    return pd.DataFrame([(cache, counts.get((cache, "hit"), 0), counts.get((cache, "miss"), 0)) for cache in caches],
+                        columns=["cache", "hits", "misses"])
+
+
+def payload_table():
+    with _lock:
+        rows = [(chart, round(nbytes / 1024, 1)) for chart, nbytes in _payloads.items()]
+    return pd.DataFrame(rows, columns=["chart", "kb"]).sort_values("kb", ascending=False, ignore_index=True)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus():
+    """All spans and cache counters in Prometheus text exposition format"""
+    with _lock:
+        spans = {name: list(stats) for name, stats in _spans.items()}
+        counts = dict(_cache_counts)
+        payloads = dict(_payloads)
+    lines = ["# HELP horizon_span_seconds Time spent in instrumented dashboard hot paths.",
+             "# TYPE horizon_span_seconds summary"]
+    for name, (n, total, _, _) in sorted(spans.items()):
+        lines.append(f'horizon_span_seconds_count{{span="{_label(name)}"}} {n}')
+        lines.append(f'horizon_span_seconds_sum{{span="{_label(name)}"}} {total:.6f}')
+    lines += ["# HELP horizon_span_max_seconds Slowest observation per span since process start.",
+              "# TYPE horizon_span_max_seconds gauge"]
+    lines += [f'horizon_span_max_seconds{{span="{_label(name)}"}} {stats[2]:.6f}' for name, stats in sorted(spans.items())]
+    lines += ["# HELP horizon_cache_requests_total Cache lookups by cache and result.",
+              "# TYPE horizon_cache_requests_total counter"]
+    lines += [f'horizon_cache_requests_total{{cache="{_label(cache)}",result="{result}"}} {n}'
+              for (cache, result), n in sorted(counts.items())]
+    lines += ["# HELP horizon_chart_payload_bytes Serialized size of the last st.plotly_chart call per chart.",
+              "# TYPE horizon_chart_payload_bytes gauge"]
+    lines += [f'horizon_chart_payload_bytes{{chart="{_label(chart)}"}} {n}' for chart, n in sorted(payloads.items())]
+    lines += ["# HELP horizon_ready Whether a component is ready to serve traffic (1) or still starting (0).",
+              "# TYPE horizon_ready gauge"]
+    lines += [f'horizon_ready{{component="{_label(component)}"}} {int(ready)}' for component, (ready, _) in sorted(readiness()[1].items())]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            self._send(200, to_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+        elif path == "/ready":
+            # For load balancer readiness probes: 503 until every component reports ready
+            ready, components = readiness()
+            self._send(200 if ready else 503, "".join(f"{name}: {'ready' if ok else 'not ready'} {detail}\n" for name, (ok, detail) in sorted(components.items())) or "ready\n",
+                       "text/plain; charset=utf-8")
+        else:
+            self.send_error(404)
+
+    def _send(self, status, text, content_type):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@st.cache_resource
+def serve_metrics(port):
+    """Start the /metrics and /ready endpoints once per process"""
+    server = ThreadingHTTPServer(("", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def export():
+    """Write or serve the Prometheus metrics if configured through the environment"""
+    if os.environ.get("HORIZON_METRICS_PORT"):
+        serve_metrics(int(os.environ["HORIZON_METRICS_PORT"]))
+    if os.environ.get("HORIZON_METRICS_FILE"):
+        write_prometheus(os.environ["HORIZON_METRICS_FILE"])
+
+
+def debug_enabled():
+    return os.environ.get("HORIZON_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+
+def reporting_enabled():
+    """Whether anything reads the more expensive measurements (chart payload sizes)"""
+    return bool(os.environ.get("HORIZON_METRICS_FILE") or os.environ.get("HORIZON_METRICS_PORT")) or debug_enabled()
+
+
+def render_debug_panel():
+    """Operator panel with span timings and cache counters"""
+    with st.sidebar.expander("🛠️ Debug: performance", expanded=True):
+        st.markdown("**Spans** (process-wide)")
+        st.dataframe(span_table(), hide_index=True, height=300)
+        for component, (ready, detail) in sorted(readiness()[1].items()):
+            st.caption(f"{'✅' if ready else '⏳'} {component}: {detail}")
+        st.markdown("**Caches**")
+        st.dataframe(cache_table(), hide_index=True)
+        st.markdown("**Chart payloads** (last render)")
+        payloads = payload_table()
+        st.dataframe(payloads, hide_index=True, height=250)
+        st.caption(f"Total: {payloads['kb'].sum():.1f} KB")
+        st.download_button("Download Prometheus metrics", data=to_prometheus(), file_name="horizon_metrics.prom", mime="text/plain")
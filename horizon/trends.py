@@ -0,0 +1,164 @@
+"""Log-linear growth trends and doubling times of the AI Development metrics.
+
+Each registry entry names a dataset, its value column and the grouping the
+page colors its scatter by. fit() regresses log10(value) on fractional years
+for every group at once: rows are sorted by group and the least-squares sums
+of all groups come from one np.add.reduceat, with no per-group Python loop.
+Confidence intervals come from a bootstrap that resamples rows within each
+group. A whole chunk of resamples is drawn as one index matrix and its sums
+reduced along the rows in the same way. The fitted table is cached per
+dataset fingerprint; the scatters draw it as dashed trend lines via
+add_trend_lines().
+"""
+import warnings
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import fingerprint, load_dataset
+
+BOOTSTRAP = 2000
+MIN_BOOTSTRAP = 200
+RESAMPLE_BUDGET = 20_000_000  # resampled rows per fit: large frames get fewer resamples, down to MIN_BOOTSTRAP
+CONFIDENCE = 0.95
+MIN_POINTS = 5  # fewer points give no fit
+SEED = 0  # fixed, so a dataset always gets the same interval
+_CHUNK = 250_000  # resampled points per reduceat pass, bounds the index matrix and its temporaries (a few MB)
+TREND_POINTS = 12  # along each trend line, so hovering anywhere on it shows the doubling time
+_NS_PER_YEAR = 365.2425 * 86400e9
+LOG2 = np.log10(2)
+
+
+class Trend(NamedTuple):
+    dataset: str
+    value_col: str
+    group_col: str
+    label: str
+
+
+TRENDS = {
+    "df_hardware": Trend("df_hardware", "cost__inflation_adjusted", "domain", "Training cost"),
+    "df_computation": Trend("df_computation", "training_computation_petaflop", "domain", "Training computation"),
+    "df_datapoint": Trend("df_datapoint", "training_dataset_size__datapoints", "domain", "Training datapoints"),
+    "df_parameter": Trend("df_parameter", "parameters", "organization_categorization", "Parameters"),
+}
+
+
+def _years(day):
+    return day.to_numpy().astype("datetime64[ns]").astype(np.int64) / _NS_PER_YEAR + 1970
+
+
+def _slope(n, sx, sy, sxx, sxy):
+    """Least-squares slope from the regression sums; NaN without spread in x"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_x, mean_y = sx / n, sy / n
+        var = sxx / n - mean_x ** 2
+        return np.where(var > 1e-12, (sxy / n - mean_x * mean_y) / var, np.nan)
+
+
+def _group_sums(x, y, starts, counts):
+    """Regression sums per group along the last axis; each group is the contiguous slice at its start"""
+    sums = [np.add.reduceat(v, starts, axis=-1) for v in (x, y, x * x, x * y)]
+    return [np.broadcast_to(counts, sums[0].shape), *sums]
+
+
+def _doubling(slope):
+    with np.errstate(divide='ignore'):
+        return np.where(slope > 0, LOG2 / slope, np.inf)
+
+
+def resamples(rows):
+    return min(BOOTSTRAP, max(MIN_BOOTSTRAP, RESAMPLE_BUDGET // max(rows, 1)))
+
+
+def fit(name, df, n_boot=None, seed=SEED):
+    """Growth per group of a registry dataset: one row per group with MIN_POINTS or more points"""
+    trend = TRENDS[name]
+    x = _years(df['day'])
+    y = np.log10(df[trend.value_col].to_numpy(dtype=float, na_value=np.nan))
+    keep = np.isfinite(x) & np.isfinite(y) & df[trend.group_col].notna().to_numpy()
+    codes, groups = pd.factorize(df[trend.group_col][keep])
+    if not len(codes):
+        return pd.DataFrame(columns=["group", "points", "first_year", "last_year", "slope", "mean_year", "mean_log",
+                                     "doubling_years", "ci_low", "ci_high"])
+    # Sorted by group, so each group is one contiguous slice and its sums one reduceat segment
+    order = np.argsort(codes, kind="stable")
+    codes, x, y = codes[order], x[keep][order], y[keep][order]
+    offset = x.mean()
+    x = x - offset  # centred, so the sums of squares keep their precision
+    counts = np.bincount(codes)
+    starts = np.r_[0, np.cumsum(counts)[:-1]]
+    n, sx, sy, sxx, sxy = _group_sums(x, y, starts, counts)
+    slope = _slope(n, sx, sy, sxx, sxy)
+
+    # Bootstrap: each resampled row is drawn from its own group's slice, a whole chunk of resamples per matrix
+    n_boot = resamples(len(x)) if n_boot is None else n_boot
+    rng = np.random.default_rng(seed)
+    boot = np.empty((n_boot, len(groups)))
+    base, span = starts[codes], counts[codes]
+    step = max(_CHUNK // len(x), 1)
+    for lo in range(0, n_boot, step):
+        b = min(step, n_boot - lo)
+        picks = base + (rng.random((b, len(x))) * span).astype(np.intp)
+        boot[lo:lo + b] = _slope(*_group_sums(x[picks], y[picks], starts, counts))
+    tail = (1 - CONFIDENCE) / 2 * 100
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # resamples of a tiny group can all lack spread in x
+        slope_lo, slope_hi = np.nanpercentile(boot, [tail, 100 - tail], axis=0)
+
+    table = pd.DataFrame({
+        "group": np.asarray(groups).astype(str),
+        "points": counts,
+        "first_year": np.minimum.reduceat(x, starts) + offset,
+        "last_year": np.maximum.reduceat(x, starts) + offset,
+        "slope": slope,  # log10 units per year
+        "mean_year": sx / n + offset,
+        "mean_log": sy / n,
+        "doubling_years": _doubling(slope),
+        "ci_low": _doubling(slope_hi),
+        "ci_high": _doubling(slope_lo),
+    })
+    return table[(table["points"] >= MIN_POINTS) & np.isfinite(table["slope"])].reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _trends(name, data_fingerprint):
+    telemetry.mark_miss()
+    with telemetry.span(f"trends:{name}"):
+        return fit(name, load_dataset(name))
+
+
+def get_trends(name):
+    """Shared growth table of a registry dataset, refitted when its file changes"""
+    with telemetry.cache_lookup("trends"):
+        return _trends(name, fingerprint([name]))
+
+
+def describe(row):
+    """One-line summary of a fitted group, e.g. 'doubles every 0.8 years (95% CI 0.6–1.1)'"""
+    if not row.slope > 0:
+        return f"no growth ({10 ** row.slope:.2f}x per year)"
+    high = "∞" if np.isinf(row.ci_high) else f"{row.ci_high:.1f}"
+    return f"doubles every {row.doubling_years:.1f} years ({CONFIDENCE:.0%} CI {row.ci_low:.1f}–{high})"
+
+
+def _dates(years):
+    return pd.to_datetime(((np.asarray(years) - 1970) * _NS_PER_YEAR).astype(np.int64))
+
+
+def add_trend_lines(fig, table):
+    """Dashed fitted line over each group's time span, in the color of the group's scatter trace"""
+    rows = {row.group: row for row in table.itertuples()}
+    for trace in list(fig.data):
+        row = rows.pop(trace.name, None)
+        if row is None:
+            continue
+        years = np.linspace(row.first_year, row.last_year, TREND_POINTS)
+        fig.add_trace(go.Scatter(x=_dates(years), y=10 ** (row.mean_log + row.slope * (years - row.mean_year)), mode="lines",
+                                 line=dict(color=trace.marker.color, width=1.5, dash="dash"), legendgroup=trace.legendgroup,
+                                 showlegend=False, name=f"{trace.name} trend", hovertemplate=f"{trace.name}: {describe(row)}<extra></extra>"))
+    return fig
@@ -0,0 +1,161 @@
+"""Process-wide cache warm-up: python -m horizon.warmup [streamlit run options]
+
+Fills the process-wide caches the pages read, so visitors don't render cold
+pages. First the datasets are loaded concurrently on a thread pool
+(memory-mapped store files, or parquet reads on a cold store). Then, also in
+parallel, it builds the survey indexes, the growth trends, the KPI snapshot
+entries and the pages' figures, and for a full warm-up the search index and
+the Comparison Tool cubes.
+
+The app calls start() on every rerun. The first call in a process starts the
+warm-up in a background thread and later calls return its progress. Progress
+is reported as telemetry readiness ("warmup"): with HORIZON_METRICS_PORT set,
+a load balancer can hold traffic until /ready answers 200.
+
+A full warm-up loads every dataset and imports every page, which gives up the
+lazy dataset loading and lazy page imports for the whole process. So by
+default the background warm-up covers only DEFAULT_SECTION, the page every
+visitor lands on. HORIZON_WARMUP=all warms every section and HORIZON_WARMUP=0
+turns the warm-up off (benchmarks and static export workers). Run as a module,
+it warms every section in-process first and only then starts the Streamlit
+server on the app, so the server accepts its first connection warm.
+"""
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import streamlit as st
+
+from horizon import telemetry
+from horizon.catalog import SECTIONS, SectionData, load_dataset
+
+DEFAULT_SECTION = next(iter(SECTIONS))  # first in the sidebar, what a new session renders
+# Loads are mostly I/O and pyarrow work outside the GIL, so use more threads than cores
+WORKERS = int(os.environ.get("HORIZON_WARMUP_WORKERS", 8))
+
+
+def warmup_tasks(sections=None):
+    """(phase, name, callable) for every cache the given sections read (all by default); phases run in this order"""
+    from horizon import comparison
+    from horizon.figures import cached_figure
+    from horizon.kpis import SECTION_KPIS, section_kpis
+    from horizon.pages import PAGES, chart_builders
+    from horizon.search import get_index as get_search_index
+    from horizon.surveys import SURVEYS, get_index
+    from horizon.trends import TRENDS, get_trends
+    full = sections is None
+    sections = list(SECTIONS) if full else sections
+    datasets = list(dict.fromkeys(name for section in sections for name in SECTIONS[section]))
+    tasks = [("datasets", name, partial(load_dataset, name)) for name in datasets]
+    tasks += [("survey_indexes", name, partial(get_index, name)) for name in SURVEYS if name in datasets]
+    tasks += [("trends", name, partial(get_trends, name)) for name in TRENDS if name in datasets]
+    if full:
+        tasks += [("search", "index", get_search_index)]
+    tasks += [("kpis", section, partial(section_kpis, section)) for section in SECTION_KPIS if section in sections]
+    for section in PAGES:
+        if section in sections:
+            data = SectionData(section)
+            tasks += [("figures", builder.__name__, partial(cached_figure, builder, data, names)) for builder, names in chart_builders(section)]
+    if "🔍 Comparison Tool" in sections:
+        tasks += [("comparison", f"{entry.dimension}/{entry.metric}", partial(comparison.get_cube, entry.dimension, entry.metric))
+                  for entry in comparison.REGISTRY]
+    return tasks
+
+
+class Warmup:
+    """Progress of one warm-up run; a failed task is recorded and the rest still run"""
+
+    def __init__(self, sections=None):
+        self.sections = sections  # None warms every section
+        self.total = self.done = 0
+        self.phase = "starting"
+        self.errors = []  # (phase, name, formatted exception)
+        self.elapsed = None
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+        self._report()
+
+    @property
+    def ready(self):
+        return self.finished.is_set()
+
+    def status(self):
+        if not self.ready:
+            return f"{self.phase} ({self.done}/{self.total})"
+        failed = f", {len(self.errors)} failed" if self.errors else ""
+        return f"{self.done} caches warmed in {self.elapsed:.1f}s{failed}"
+
+    def _report(self):
+        telemetry.set_ready("warmup", self.ready, self.status())
+
+    def _run_task(self, task):
+        phase, name, fn = task
+        try:
+            fn()
+        except Exception:
+            with self._lock:
+                self.errors.append((phase, name, traceback.format_exc()))
+        with self._lock:
+            self.done += 1
+        self._report()
+
+    def run(self, workers=WORKERS):
+        start = time.perf_counter()
+        try:
+            tasks = warmup_tasks(self.sections)
+            self.total = len(tasks)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool:
+                for phase in dict.fromkeys(phase for phase, _, _ in tasks):
+                    self.phase = phase
+                    with telemetry.span(f"warmup:{phase}"):
+                        list(pool.map(self._run_task, [task for task in tasks if task[0] == phase]))
+        except Exception:
+            self.errors.append(("setup", "warmup_tasks", traceback.format_exc()))
+        self.elapsed = time.perf_counter() - start
+        self.finished.set()
+        self._report()
+        return self
+
+
+@st.cache_resource(show_spinner=False)
+def start():
+    """Start the warm-up once per process in a background thread and return its progress"""
+    scope = os.environ.get("HORIZON_WARMUP")
+    warmup = Warmup(None if scope == "all" else [DEFAULT_SECTION])
+    if scope == "0":
+        warmup.finished.set()  # disabled, e.g. in static export workers that render one section each
+        warmup.elapsed = 0.0
+        warmup._report()
+    else:
+        threading.Thread(target=warmup.run, name="warmup", daemon=True).start()
+    return warmup
+
+
+def main():
+    from streamlit.logger import set_log_level
+    from streamlit.web import cli
+
+    from horizon.pages import APP_PATH
+    # Streamlit warns about the missing script context on every cached call before the server runs
+    set_log_level("error")
+    if os.environ.get("HORIZON_METRICS_PORT"):
+        telemetry.serve_metrics(int(os.environ["HORIZON_METRICS_PORT"]))  # /ready answers 503 while warming
+    os.environ.setdefault("HORIZON_WARMUP", "all")  # a server started this way wants every section warm
+    warmup = start()
+    warmup.finished.wait()
+    print(f"warmup: {warmup.status()}")
+    for phase, name, error in warmup.errors:
+        print(f"warmup {phase}/{name} failed:\n{error}", file=sys.stderr)
+    set_log_level("info")
+    # Same process, so the server's sessions find the caches filled above
+    cli.main(["run", APP_PATH, *sys.argv[1:]], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    # The app imports horizon.warmup: use that module's start() so it finds this warm-up cached
+    from horizon import warmup
+    warmup.main()